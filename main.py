@@ -2,9 +2,12 @@
 import argparse
 import sys
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from src.scenario_processor import ScenarioProcessor
+from src.json_io import DURABILITY_MODES, DURABILITY_NONE
+from src.sharding import parse_shard, select_shard
+from src.file_walker import walk_files, DEFAULT_EXCLUDE
 
 
 def find_mapping_files(directory: str) -> List[str]:
@@ -13,15 +16,379 @@ def find_mapping_files(directory: str) -> List[str]:
     if not path.exists():
         return []
     
-    # JSON 파일 찾기
-    json_files = list(path.glob("**/*.json"))
-    return [str(f) for f in json_files]
+    # JSON 및 NDJSON(JSON Lines) 파일 찾기 (.git, node_modules 등은 제외)
+    return list(walk_files(str(path)))
 
 
-def main():
+def run_serve(argv: List[str]):
+    """serve 서브커맨드: 로컬 HTTP 익명화 서비스를 실행합니다."""
+    from src.anonymization_server import AnonymizationServer
+    
+    parser = argparse.ArgumentParser(
+        prog='main.py serve',
+        description="JSON 문서를 HTTP로 받아 익명화하는 로컬 서비스를 실행합니다."
+    )
+    parser.add_argument(
+        '--host',
+        type=str,
+        default='127.0.0.1',
+        help='바인딩할 호스트 (기본값: 127.0.0.1)'
+    )
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=8080,
+        help='바인딩할 포트 (기본값: 8080)'
+    )
+    parser.add_argument(
+        '-w', '--workers',
+        type=int,
+        default=4,
+        help='배치 요청을 처리할 워커 수 (기본값: 4)'
+    )
+    parser.add_argument(
+        '-c', '--config',
+        type=str,
+        default=None,
+        help='설정 파일 경로 (기본값: config/personal_info_patterns.yaml)'
+    )
+    
+    args = parser.parse_args(argv)
+    
+    processor = ScenarioProcessor(args.config)
+    server = AnonymizationServer(
+        processor.replacer,
+        host=args.host,
+        port=args.port,
+        workers=args.workers
+    )
+    host, port = server.address
+    print(f"익명화 서비스 시작: http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n익명화 서비스 종료")
+
+
+def run_audit(argv: List[str]):
+    """audit 서브커맨드: 감사 인덱스에서 치환값의 원본과 원본이 있던 파일을 조회합니다."""
+    from src.audit_index import AuditIndex
+    
+    parser = argparse.ArgumentParser(
+        prog='main.py audit',
+        description="--audit-db로 기록한 감사 인덱스를 조회합니다."
+    )
+    parser.add_argument(
+        'db',
+        type=str,
+        help='감사 인덱스 파일 경로'
+    )
+    query = parser.add_mutually_exclusive_group(required=True)
+    query.add_argument(
+        '--replacement',
+        type=str,
+        help='이 치환값을 만든 원본 값을 조회'
+    )
+    query.add_argument(
+        '--original',
+        type=str,
+        help='이 원본 값이 포함되어 있던 파일을 조회'
+    )
+    query.add_argument(
+        '--stats',
+        action='store_true',
+        help='인덱스에 기록된 항목 수를 출력'
+    )
+    parser.add_argument(
+        '--type',
+        type=str,
+        default=None,
+        help='--original 조회 시 개인정보 유형 제한'
+    )
+    
+    args = parser.parse_args(argv)
+    
+    if not Path(args.db).exists():
+        print(f"오류: 감사 인덱스를 찾을 수 없습니다: {args.db}")
+        sys.exit(1)
+    
+    with AuditIndex(args.db) as index:
+        if args.stats:
+            for name, count in index.stats().items():
+                print(f"{name}: {count}")
+        elif args.replacement is not None:
+            entries = index.find_originals(args.replacement)
+            if not entries:
+                print(f"해당 치환값이 없습니다: {args.replacement}")
+                sys.exit(1)
+            for entry in entries:
+                print(f"{entry['replacement']} <- {entry['original']} ({entry['type']})")
+        else:
+            files = index.find_files(args.original, args.type)
+            if not files:
+                print(f"해당 원본 값이 포함된 파일이 없습니다: {args.original}")
+                sys.exit(1)
+            for path in files:
+                print(path)
+
+
+def run_scan(argv: List[str]):
+    """scan 서브커맨드: 치환 없이 개인정보 식별 결과만 집계합니다."""
+    import os
+    from src.config_loader import ConfigLoader
+    from src.scanner import scan_files, DEFAULT_SAMPLE_SIZE
+    
+    parser = argparse.ArgumentParser(
+        prog='main.py scan',
+        description="파일을 수정하지 않고 개인정보를 식별하여 유형/키/파일별 보고서를 출력합니다."
+    )
+    parser.add_argument(
+        'input',
+        type=str,
+        help='입력 파일 또는 디렉토리 경로'
+    )
+    parser.add_argument(
+        '-c', '--config',
+        type=str,
+        default=None,
+        help='설정 파일 경로 (기본값: config/personal_info_patterns.yaml)'
+    )
+    parser.add_argument(
+        '-w', '--workers',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='스캔할 프로세스 수 (기본값: CPU 수)'
+    )
+    parser.add_argument(
+        '--format',
+        choices=('json', 'csv'),
+        default='json',
+        help='보고서 형식 (기본값: json)'
+    )
+    parser.add_argument(
+        '-o', '--output',
+        type=str,
+        default=None,
+        help='보고서를 저장할 파일 (지정하지 않으면 표준 출력)'
+    )
+    parser.add_argument(
+        '--samples',
+        type=int,
+        default=DEFAULT_SAMPLE_SIZE,
+        help=f'유형별로 보고서에 남길 발견 위치 수 (기본값: {DEFAULT_SAMPLE_SIZE})'
+    )
+    parser.add_argument(
+        '--value-only',
+        action='store_true',
+        help='키 이름과 무관하게 값의 내용만으로도 개인정보를 판별'
+    )
+    parser.add_argument(
+        '--scan-text',
+        action='store_true',
+        help='키와 무관하게 문자열 내부에 포함된 개인정보도 검색'
+    )
+    parser.add_argument(
+        '--fail-on-findings',
+        action='store_true',
+        help='개인정보가 발견되면 종료 코드 1로 종료 (CI용)'
+    )
+    
+    args = parser.parse_args(argv)
+    
+    input_path = Path(args.input)
+    if not input_path.exists():
+        print(f"오류: 입력 경로를 찾을 수 없습니다: {args.input}", file=sys.stderr)
+        sys.exit(1)
+    
+    files = [str(input_path)] if input_path.is_file() else find_mapping_files(str(input_path))
+    config_loader = ConfigLoader(args.config)
+    report = scan_files(
+        files,
+        config_loader.get_patterns(),
+        workers=args.workers,
+        sample_size=args.samples,
+        value_only=args.value_only,
+        options={
+            'scan_text': args.scan_text,
+            'path_templates': config_loader.get_setting('path_templates', []),
+            'headers': config_loader.get_setting('headers', {})
+        }
+    )
+    
+    output = report.to_csv() if args.format == 'csv' else report.to_json() + '\n'
+    if args.output:
+        Path(args.output).write_text(output, encoding='utf-8')
+    else:
+        sys.stdout.write(output)
+    
+    if args.fail_on_findings and report.total:
+        sys.exit(1)
+
+
+def run_analyze(argv: List[str]):
+    """analyze 서브커맨드: 키 패턴별 일치 횟수, 거부율, 비용을 측정합니다."""
+    import json
+    from src.config_loader import ConfigLoader
+    from src.pattern_analyzer import PatternAnalyzer, DEFAULT_RESERVOIR_SIZE
+    
+    parser = argparse.ArgumentParser(
+        prog='main.py analyze',
+        description="코퍼스에서 설정 파일의 키 패턴별 일치 횟수, 값 패턴 거부율, 소요 시간을 측정합니다."
+    )
+    parser.add_argument(
+        'input',
+        type=str,
+        help='입력 파일 또는 디렉토리 경로'
+    )
+    parser.add_argument(
+        '-c', '--config',
+        type=str,
+        default=None,
+        help='설정 파일 경로 (기본값: config/personal_info_patterns.yaml)'
+    )
+    parser.add_argument(
+        '--format',
+        choices=('json', 'csv'),
+        default='json',
+        help='보고서 형식 (기본값: json)'
+    )
+    parser.add_argument(
+        '-o', '--output',
+        type=str,
+        default=None,
+        help='보고서를 저장할 파일 (지정하지 않으면 표준 출력)'
+    )
+    parser.add_argument(
+        '--samples',
+        type=int,
+        default=DEFAULT_RESERVOIR_SIZE,
+        help=f'키 패턴별로 보관할 키 이름 샘플 수 (기본값: {DEFAULT_RESERVOIR_SIZE})'
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=0,
+        help='샘플링 난수 시드 (기본값: 0)'
+    )
+    
+    args = parser.parse_args(argv)
+    
+    input_path = Path(args.input)
+    if not input_path.exists():
+        print(f"오류: 입력 경로를 찾을 수 없습니다: {args.input}", file=sys.stderr)
+        sys.exit(1)
+    
+    files = [str(input_path)] if input_path.is_file() else find_mapping_files(str(input_path))
+    analyzer = PatternAnalyzer(
+        ConfigLoader(args.config).get_patterns(),
+        reservoir_size=args.samples,
+        seed=args.seed
+    )
+    for file_path in files:
+        analyzer.analyze_file(file_path)
+    
+    if args.format == 'csv':
+        output = analyzer.report_csv()
+    else:
+        output = json.dumps(analyzer.report(), ensure_ascii=False, indent=2) + '\n'
+    if args.output:
+        Path(args.output).write_text(output, encoding='utf-8')
+    else:
+        sys.stdout.write(output)
+
+
+def run_merge_maps(argv: List[str]):
+    """merge-maps 서브커맨드: 샤드별 치환 매핑을 하나로 합칩니다."""
+    from src.replacer.map_store import (
+        export_replacement_map,
+        load_replacement_map,
+        merge_replacement_maps
+    )
+    
+    parser = argparse.ArgumentParser(
+        prog='main.py merge-maps',
+        description="--shard로 나누어 처리한 노드들의 치환 매핑을 충돌 검사 후 하나로 합칩니다."
+    )
+    parser.add_argument(
+        'maps',
+        nargs='+',
+        help='합칠 치환 매핑 파일 (앞에 있을수록 충돌 시 우선)'
+    )
+    parser.add_argument(
+        '-o', '--output',
+        type=str,
+        required=True,
+        help='합친 치환 매핑을 저장할 파일 (.json이면 JSON, 그 외는 바이너리 형식)'
+    )
+    parser.add_argument(
+        '--allow-conflicts',
+        action='store_true',
+        help='같은 원본이 다른 치환값을 가진 충돌이 있어도 먼저 나온 항목을 유지하여 저장'
+    )
+    
+    args = parser.parse_args(argv)
+    
+    try:
+        merged, conflicts = merge_replacement_maps(
+            load_replacement_map(path) for path in args.maps
+        )
+    except (OSError, ValueError, KeyError) as e:
+        print(f"오류: 치환 매핑을 불러올 수 없습니다: {e}")
+        sys.exit(1)
+    
+    # 중복(서로 다른 원본이 같은 치환값)은 두 항목을 모두 유지하고 보고만 함
+    replacement_conflicts = 0
+    for conflict in conflicts:
+        if conflict['kind'] == 'replacement':
+            replacement_conflicts += 1
+            print(
+                f"충돌 ({conflict['type']}): {conflict['original']} -> "
+                f"{conflict['kept']} (유지) / {conflict['dropped']}"
+            )
+        else:
+            print(
+                f"중복 ({conflict['type']}): {conflict['original']}, "
+                f"{conflict['other_original']} -> {conflict['replacement']}"
+            )
+    
+    if replacement_conflicts and not args.allow_conflicts:
+        print(
+            f"오류: 같은 원본이 다른 치환값을 가진 충돌 {replacement_conflicts}개가 있어 "
+            f"저장하지 않았습니다 (--allow-conflicts로 먼저 나온 값 유지)"
+        )
+        sys.exit(1)
+    
+    export_replacement_map(merged, args.output)
+    print(f"치환 매핑 {len(args.maps)}개를 합쳤습니다: {len(merged)}개 항목 -> {args.output}")
+
+
+# 첫 번째 인자로 선택하는 서브커맨드 (없으면 기본 익명화 모드)
+SUBCOMMANDS = {
+    'serve': run_serve,
+    'audit': run_audit,
+    'scan': run_scan,
+    'analyze': run_analyze,
+    'merge-maps': run_merge_maps,
+}
+
+
+def main(argv: Optional[List[str]] = None):
     """메인 함수"""
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    if argv and argv[0] in SUBCOMMANDS:
+        SUBCOMMANDS[argv[0]](argv[1:])
+        return
+    
+    run_anonymize(argv)
+
+
+def run_anonymize(argv: List[str]):
+    """기본 모드: 파일 또는 디렉토리의 개인정보를 익명화합니다."""
     parser = argparse.ArgumentParser(
-        description="Wiremock mappings 파일의 개인정보를 익명화 처리합니다."
+        description="Wiremock mappings 파일의 개인정보를 익명화 처리합니다.",
+        epilog="서브커맨드: " + ", ".join(SUBCOMMANDS)
     )
     parser.add_argument(
         'input',
@@ -45,8 +412,114 @@ def main():
         action='store_true',
         help='치환 매핑을 초기화하고 새로 시작'
     )
+    parser.add_argument(
+        '-w', '--workers',
+        type=int,
+        default=1,
+        help='NDJSON(.ndjson/.jsonl) 파일을 병렬 처리할 워커 수 (기본값: 1)'
+    )
+    parser.add_argument(
+        '--durability',
+        choices=DURABILITY_MODES,
+        default=DURABILITY_NONE,
+        help='출력 fsync 모드: none(원자적 교체만), file(파일마다 fsync), '
+             'batch(파일 내용과 디렉토리 fsync를 처리 종료 시 일괄 수행) (기본값: none)'
+    )
+    
+    parser.add_argument(
+        '--scan-text',
+        action='store_true',
+        help='로그 메시지, HTML 등 문자열 내부에 포함된 개인정보도 검색하여 치환'
+    )
     
-    args = parser.parse_args()
+    parser.add_argument(
+        '--value-only',
+        action='store_true',
+        help='키 이름과 무관하게 체크섬 검증 등 값의 내용만으로도 개인정보를 판별'
+    )
+    
+    parser.add_argument(
+        '--tolerant',
+        action='store_true',
+        help='BOM, 주석, 끝의 쉼표, 이어 붙은 문서를 고쳐 처리하고, 파싱할 수 없는 파일은 텍스트에서 개인정보를 찾아 치환'
+    )
+    
+    parser.add_argument(
+        '--include',
+        action='append',
+        default=None,
+        help='디렉토리 처리 시 대상 파일 glob 패턴 (여러 번 지정 가능, 기본값: *.json, *.ndjson, *.jsonl)'
+    )
+    
+    parser.add_argument(
+        '--exclude',
+        action='append',
+        default=[],
+        help='디렉토리 처리 시 건너뛸 파일/디렉토리 glob 패턴 '
+             '(여러 번 지정 가능, .git, node_modules 등은 항상 제외)'
+    )
+    
+    parser.add_argument(
+        '--max-depth',
+        type=int,
+        default=None,
+        help='디렉토리 처리 시 내려갈 최대 깊이 (입력 디렉토리 바로 아래가 0)'
+    )
+    
+    parser.add_argument(
+        '--shard',
+        type=str,
+        default=None,
+        help="디렉토리 처리 시 경로 해시로 나눈 N개 샤드 중 i번째만 처리 (형식: i/N)"
+    )
+    
+    parser.add_argument(
+        '--dedup',
+        action='store_true',
+        help='내용이 같은 파일은 한 번만 치환하고 결과를 복사 (기본: 각각 치환)'
+    )
+    
+    parser.add_argument(
+        '--link-duplicates',
+        action='store_true',
+        help='내용이 같은 파일의 출력을 복사 대신 하드 링크로 생성 (--dedup 포함)'
+    )
+    
+    parser.add_argument(
+        '--checkpoint',
+        type=str,
+        default=None,
+        help='디렉토리 처리 시 파일별 처리 결과와 새 치환 항목을 기록할 체크포인트 저널 (JSON Lines)'
+    )
+    
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='--checkpoint 저널의 치환 매핑을 불러와 성공한 파일을 건너뛰고 이어서 처리'
+    )
+    
+    parser.add_argument(
+        '--audit-db',
+        type=str,
+        default=None,
+        help='파일별 치환 기록(치환값->원본, 원본->파일)을 누적할 감사 인덱스 경로'
+    )
+    
+    parser.add_argument(
+        '--import-map',
+        type=str,
+        default=None,
+        help='처리 전에 불러올 치환 매핑 파일 (.json이면 JSON, 그 외는 바이너리 형식)'
+    )
+    
+    parser.add_argument(
+        '--export-map',
+        type=str,
+        default=None,
+        help='처리 후 치환 매핑을 저장할 파일 (.json이면 JSON, 그 외는 바이너리 형식)'
+    )
+    
+    args = parser.parse_args(argv)
     
     # 입력 경로 확인
     input_path = Path(args.input)
@@ -54,12 +527,50 @@ def main():
         print(f"오류: 입력 경로를 찾을 수 없습니다: {args.input}")
         sys.exit(1)
     
+    if args.resume and not args.checkpoint:
+        print("오류: --resume에는 --checkpoint 저널 경로가 필요합니다")
+        sys.exit(1)
+    
+    # 디렉토리 처리 전용 옵션은 단일 파일 입력에서 거부
+    if input_path.is_file():
+        for option, value in (
+            ('--shard', args.shard),
+            ('--checkpoint', args.checkpoint),
+            ('--resume', args.resume)
+        ):
+            if value:
+                print(f"오류: {option}는 디렉토리 입력에서만 사용할 수 있습니다")
+                sys.exit(1)
+    
+    shard = None
+    if args.shard:
+        try:
+            shard = parse_shard(args.shard)
+        except ValueError as e:
+            print(f"오류: {e}")
+            sys.exit(1)
+    
     # 프로세서 초기화
-    processor = ScenarioProcessor(args.config)
+    processor = ScenarioProcessor(
+        args.config,
+        workers=args.workers,
+        durability=args.durability,
+        scan_text=args.scan_text,
+        value_only=args.value_only,
+        tolerant=args.tolerant
+    )
     
     if args.reset:
         processor.reset()
     
+    if args.import_map:
+        try:
+            count = processor.import_replacement_map(args.import_map)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"오류: 치환 매핑을 불러올 수 없습니다: {e}")
+            sys.exit(1)
+        print(f"치환 매핑 불러옴: {count}개 ({args.import_map})")
+    
     # 파일 처리
     if input_path.is_file():
         # 단일 파일 처리
@@ -67,7 +578,8 @@ def main():
         try:
             result = processor.process_single_file(
                 str(input_path),
-                args.output
+                args.output,
+                audit_db=args.audit_db
             )
             print(f"완료: {args.input}")
             if args.output:
@@ -77,13 +589,45 @@ def main():
             sys.exit(1)
     else:
         # 디렉토리 처리
-        mapping_files = find_mapping_files(str(input_path))
-        if not mapping_files:
+        # 출력 디렉토리와 체크포인트 저널이 입력 디렉토리 안에 있으면 탐색에서 제외
+        # (glob 패턴이 아닌 상대 경로 전체로 비교하여 이름만 같은 디렉토리는 탐색)
+        exclude_paths = []
+        for generated in (args.output, args.checkpoint):
+            if not generated:
+                continue
+            try:
+                generated_rel = Path(generated).resolve().relative_to(input_path.resolve())
+                exclude_paths.append(generated_rel.as_posix())
+            except ValueError:
+                pass
+        
+        # 파일을 발견하는 대로 바로 처리
+        mapping_files = walk_files(
+            str(input_path),
+            include=args.include,
+            exclude=DEFAULT_EXCLUDE + tuple(args.exclude),
+            max_depth=args.max_depth,
+            exclude_paths=exclude_paths
+        )
+        if shard is not None:
+            mapping_files = select_shard(mapping_files, shard[0], shard[1], str(input_path))
+            print(f"샤드 {shard[0] + 1}/{shard[1]} 처리")
+        
+        results = processor.process_scenario(
+            mapping_files,
+            args.output,
+            audit_db=args.audit_db,
+            base_dir=str(input_path),
+            dedup=args.dedup or args.link_duplicates,
+            link_duplicates=args.link_duplicates,
+            checkpoint=args.checkpoint,
+            resume=args.resume
+        )
+        if not results['processed_files'] and shard is None:
             print(f"경고: JSON 파일을 찾을 수 없습니다: {args.input}")
             sys.exit(1)
-        
-        print(f"발견된 파일 수: {len(mapping_files)}")
-        results = processor.process_scenario(mapping_files, args.output)
+        # 샤드에 배정된 파일이 없는 노드도 정상 종료 (빈 매핑을 내보냄)
+        print(f"처리한 파일 수: {len(results['processed_files'])}")
         
         # 결과 출력
         success_count = sum(
@@ -94,6 +638,12 @@ def main():
         print(f"\n처리 완료:")
         print(f"  성공: {success_count}개")
         print(f"  실패: {error_count}개")
+        if results['resumed']:
+            print(f"  이전 실행에서 완료 (건너뜀): {results['resumed']}개")
+        if results['duplicates']:
+            print(f"  중복 (결과 재사용): {results['duplicates']}개")
+        for kind, count in sorted(results['parse_fixes'].items()):
+            print(f"  형식 오류 처리 ({kind}): {count}개")
         
         if error_count > 0:
             print("\n실패한 파일:")
@@ -111,6 +661,23 @@ def main():
                         f"  {value['original']} -> {value['replacement']} "
                         f"({value['type']})"
                     )
+        
+        # 치환값 충돌 통계 출력
+        for info_type, stats in results['collision_stats'].items():
+            if stats['rehashed']:
+                print(
+                    f"치환값 재해시 ({info_type}): 첫 치환값이 다른 원본과 겹쳐 다시 생성한 원본 "
+                    f"{stats['rehashed']}개 (이 원본들의 치환값은 처리 순서에 따라 달라질 수 있음)"
+                )
+            if stats['duplicates']:
+                print(
+                    f"경고: 치환값 충돌 ({info_type}): 불러온 매핑에서 다른 원본과 치환값이 겹친 원본 "
+                    f"{stats['duplicates']}개"
+                )
+    
+    if args.export_map:
+        processor.export_replacement_map(args.export_map)
+        print(f"치환 매핑 저장: {args.export_map}")
 
 
 if __name__ == '__main__':
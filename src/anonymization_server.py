@@ -0,0 +1,224 @@
+"""로컬 HTTP 익명화 서비스 모듈
+
+캡처 프록시 등에서 파일을 거치지 않고 JSON 문서를 바로 익명화할 수 있도록
+표준 라이브러리만으로 구현한 HTTP 서버를 제공합니다.
+
+- ``POST /anonymize``: JSON 객체 하나를 익명화
+- ``POST /anonymize/batch``: JSON 객체 배열을 워커 풀로 익명화
+- ``GET /metrics``: 처리량/지연시간 통계
+- ``GET /health``: 상태 확인
+"""
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Any, Optional, Tuple
+
+from .replacer.personal_info_replacer import PersonalInfoReplacer
+
+
+class ServerMetrics:
+    """요청 처리량과 지연시간을 집계하는 클래스"""
+
+    # 지연시간 히스토그램 버킷 상한 (밀리초)
+    LATENCY_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+        self.requests = 0
+        self.documents = 0
+        self.errors = 0
+        self.total_latency_ms = 0.0
+        self.max_latency_ms = 0.0
+        self.latency_buckets = [0] * (len(self.LATENCY_BUCKETS_MS) + 1)
+
+    def record(self, documents: int, latency_ms: float, error: bool = False):
+        """요청 하나의 처리 결과를 기록합니다."""
+        bucket = len(self.LATENCY_BUCKETS_MS)
+        for idx, upper in enumerate(self.LATENCY_BUCKETS_MS):
+            if latency_ms <= upper:
+                bucket = idx
+                break
+
+        with self._lock:
+            self.requests += 1
+            self.documents += documents
+            if error:
+                self.errors += 1
+            self.total_latency_ms += latency_ms
+            self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+            self.latency_buckets[bucket] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 통계를 딕셔너리로 반환합니다."""
+        with self._lock:
+            uptime = max(time.time() - self.started_at, 1e-9)
+            buckets = {
+                f"le_{upper}ms": count
+                for upper, count in zip(self.LATENCY_BUCKETS_MS, self.latency_buckets)
+            }
+            buckets['gt_{}ms'.format(self.LATENCY_BUCKETS_MS[-1])] = self.latency_buckets[-1]
+            return {
+                'uptime_seconds': round(uptime, 3),
+                'requests': self.requests,
+                'documents': self.documents,
+                'errors': self.errors,
+                'documents_per_second': round(self.documents / uptime, 3),
+                'avg_latency_ms': round(
+                    self.total_latency_ms / self.requests, 3
+                ) if self.requests else 0.0,
+                'max_latency_ms': round(self.max_latency_ms, 3),
+                'latency_histogram': buckets
+            }
+
+
+class AnonymizationServer:
+    """하나의 치환 매핑을 공유하며 JSON 문서를 익명화하는 HTTP 서버"""
+
+    def __init__(
+        self,
+        replacer: PersonalInfoReplacer,
+        host: str = '127.0.0.1',
+        port: int = 8080,
+        workers: int = 4,
+        max_body_size: int = 64 * 1024 * 1024
+    ):
+        """
+        Args:
+            replacer: 요청 간에 공유할 치환기 (치환 매핑이 유지됨)
+            host: 바인딩할 호스트
+            port: 바인딩할 포트 (0이면 임의 포트)
+            workers: 배치 처리에 사용할 워커 수
+            max_body_size: 허용하는 요청 본문 최대 크기 (바이트)
+        """
+        self.replacer = replacer
+        self.workers = max(1, workers)
+        self.max_body_size = max_body_size
+        self.metrics = ServerMetrics()
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.workers,
+            thread_name_prefix='anonymize'
+        )
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """실제로 바인딩된 (호스트, 포트)를 반환합니다."""
+        return self.httpd.server_address[:2]
+
+    def anonymize_document(self, document: Any) -> Dict[str, Any]:
+        """JSON 객체 하나를 익명화합니다."""
+        if not isinstance(document, dict):
+            raise ValueError("JSON 객체만 익명화할 수 있습니다")
+        return self.replacer._replace_document(document)
+
+    def anonymize_batch(self, documents: List[Any]) -> List[Dict[str, Any]]:
+        """여러 JSON 객체를 워커 풀에서 익명화합니다 (입력 순서 유지)."""
+        if not isinstance(documents, list):
+            raise ValueError("배치 요청은 JSON 배열이어야 합니다")
+        return list(self.executor.map(self.anonymize_document, documents))
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """익명화 요청 핸들러"""
+
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                # 요청마다 stderr에 로그를 남기지 않음
+                pass
+
+            def _send_json(self, status: int, payload: Any):
+                body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                if self.path == '/metrics':
+                    self._send_json(200, server.metrics.snapshot())
+                elif self.path == '/health':
+                    self._send_json(200, {
+                        'status': 'ok',
+                        'replacements': len(server.replacer.replacement_map)
+                    })
+                else:
+                    self._send_json(404, {'error': f"알 수 없는 경로입니다: {self.path}"})
+
+            def do_POST(self):
+                if self.path not in ('/anonymize', '/anonymize/batch'):
+                    self._send_json(404, {'error': f"알 수 없는 경로입니다: {self.path}"})
+                    return
+
+                started = time.perf_counter()
+                documents = 0
+                try:
+                    length = int(self.headers.get('Content-Length') or 0)
+                    if length < 0:
+                        # 음수를 그대로 읽으면 연결이 닫힐 때까지 기다리게 됨
+                        raise ValueError(f"잘못된 Content-Length입니다: {length}")
+                    if length > server.max_body_size:
+                        # 읽지 않은 본문이 다음 요청으로 해석되지 않도록 연결을 닫음
+                        self.close_connection = True
+                        self._send_json(413, {'error': "요청 본문이 너무 큽니다"})
+                        server.metrics.record(0, 0.0, error=True)
+                        return
+                    payload = json.loads(self.rfile.read(length) or b'null')
+
+                    if self.path == '/anonymize/batch':
+                        result = server.anonymize_batch(payload)
+                        documents = len(result)
+                    else:
+                        result = server.anonymize_document(payload)
+                        documents = 1
+                except (ValueError, TypeError) as e:
+                    elapsed = (time.perf_counter() - started) * 1000
+                    server.metrics.record(0, elapsed, error=True)
+                    # 본문을 읽지 못했을 수 있으므로 연결을 재사용하지 않음
+                    self.close_connection = True
+                    self._send_json(400, {'error': str(e)})
+                    return
+                except Exception as e:
+                    elapsed = (time.perf_counter() - started) * 1000
+                    server.metrics.record(0, elapsed, error=True)
+                    self.close_connection = True
+                    self._send_json(500, {'error': f"처리 중 오류가 발생했습니다: {e}"})
+                    return
+
+                elapsed = (time.perf_counter() - started) * 1000
+                server.metrics.record(documents, elapsed)
+                self._send_json(200, result)
+
+        return Handler
+
+    def serve_forever(self):
+        """현재 스레드에서 서버를 실행합니다."""
+        try:
+            self.httpd.serve_forever()
+        finally:
+            self.executor.shutdown(wait=True)
+
+    def start(self):
+        """백그라운드 스레드에서 서버를 시작합니다."""
+        self._thread = threading.Thread(
+            target=self.httpd.serve_forever,
+            daemon=True
+        )
+        self._thread.start()
+
+    def shutdown(self):
+        """서버와 워커 풀을 종료합니다."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.executor.shutdown(wait=True)
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,147 @@
+"""치환 감사 인덱스 모듈
+
+보안 감사에서 "치환값 X는 어떤 원본에서 나왔는가?", "원본 Y는 어떤 파일에 있었는가?"에
+답할 수 있도록 표준 라이브러리 sqlite3로 역방향 인덱스를 관리합니다.
+
+- replacements: (원본, 유형) -> 치환값, 치환값 컬럼에 인덱스
+- postings: (원본, 유형) -> 파일 목록
+
+두 조회 모두 B-tree 인덱스 탐색 한 번으로 처리되므로 항목 수가 수백만 개여도
+조회 시간이 거의 늘지 않습니다.
+"""
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS replacements (
+    original TEXT NOT NULL,
+    type TEXT NOT NULL,
+    replacement TEXT NOT NULL,
+    PRIMARY KEY (original, type)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_replacements_replacement
+    ON replacements (replacement);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS postings (
+    original TEXT NOT NULL,
+    type TEXT NOT NULL,
+    file_id INTEGER NOT NULL REFERENCES files (id),
+    PRIMARY KEY (original, type, file_id)
+) WITHOUT ROWID;
+"""
+
+
+class AuditIndex:
+    """치환값 -> 원본, 원본 -> 파일 역방향 인덱스"""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: sqlite 데이터베이스 파일 경로 (없으면 생성)
+        """
+        self.path = Path(path)
+        if str(path) != ':memory:':
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path))
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        """데이터베이스 연결을 닫습니다."""
+        self._conn.close()
+
+    def __enter__(self) -> 'AuditIndex':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def record_file(self, file_path: str, entries: Iterable[Dict[str, str]]):
+        """
+        파일 하나에서 사용된 치환 항목을 기록합니다 (파일 단위 트랜잭션).
+
+        Args:
+            file_path: 원본 파일 경로
+            entries: 해당 파일에서 사용된 {'type', 'original', 'replacement'} 항목
+        """
+        rows = [
+            (entry['original'], entry['type'], entry['replacement'])
+            for entry in entries
+        ]
+        with self._conn:
+            self._conn.execute(
+                'INSERT OR IGNORE INTO files (path) VALUES (?)',
+                (str(file_path),)
+            )
+            file_id = self._conn.execute(
+                'SELECT id FROM files WHERE path = ?',
+                (str(file_path),)
+            ).fetchone()[0]
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO replacements (original, type, replacement) '
+                'VALUES (?, ?, ?)',
+                rows
+            )
+            self._conn.executemany(
+                'INSERT OR IGNORE INTO postings (original, type, file_id) '
+                'VALUES (?, ?, ?)',
+                [(original, info_type, file_id) for original, info_type, _ in rows]
+            )
+
+    def find_originals(self, replacement: str) -> List[Dict[str, str]]:
+        """
+        치환값으로 원본을 찾습니다.
+
+        Returns:
+            {'type', 'original', 'replacement'} 항목 리스트
+        """
+        rows = self._conn.execute(
+            'SELECT type, original, replacement FROM replacements '
+            'WHERE replacement = ? ORDER BY type, original',
+            (replacement,)
+        ).fetchall()
+        return [
+            {'type': info_type, 'original': original, 'replacement': value}
+            for info_type, original, value in rows
+        ]
+
+    def find_files(self, original: str, info_type: Optional[str] = None) -> List[str]:
+        """
+        원본 값이 포함되어 있던 파일을 찾습니다.
+
+        Args:
+            original: 원본 값
+            info_type: 개인정보 유형 (None이면 모든 유형)
+
+        Returns:
+            파일 경로 리스트
+        """
+        if info_type is None:
+            rows = self._conn.execute(
+                'SELECT DISTINCT files.path FROM postings '
+                'JOIN files ON files.id = postings.file_id '
+                'WHERE postings.original = ? ORDER BY files.path',
+                (original,)
+            )
+        else:
+            rows = self._conn.execute(
+                'SELECT files.path FROM postings '
+                'JOIN files ON files.id = postings.file_id '
+                'WHERE postings.original = ? AND postings.type = ? '
+                'ORDER BY files.path',
+                (original, info_type)
+            )
+        return [path for (path,) in rows.fetchall()]
+
+    def stats(self) -> Dict[str, int]:
+        """인덱스에 기록된 치환 항목, 파일, posting 수를 반환합니다."""
+        return {
+            table: self._conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+            for table in ('replacements', 'files', 'postings')
+        }
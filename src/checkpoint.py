@@ -0,0 +1,135 @@
+"""처리 진행 상황 체크포인트 모듈
+
+큰 디렉토리를 처리하다 중단되어도 처음부터 다시 치환하지 않도록, 파일을 하나
+처리할 때마다 처리 결과와 그 파일에서 새로 만든 치환 항목을 JSON Lines 저널에
+추가합니다. 재개할 때는 저널의 치환 항목을 모두 불러와 중단 전과 같은 매핑으로
+이어서 처리하고, 성공한 파일은 건너뜁니다.
+
+각 레코드는 한 줄에 기록한 뒤 바로 운영체제에 넘기므로 프로세스가 중단되어도
+남아 있으며, sync_interval개 레코드마다 fsync하여 시스템 장애에도 대비합니다.
+중단 시점에 마지막 줄이 잘렸으면 그 레코드는 무시합니다.
+
+처리한 파일은 입력 경로 문자열 대신 호출한 쪽이 정한 키(입력 디렉토리 기준 상대
+경로 등)로 찾으므로, 재개할 때 같은 파일을 다른 형태의 경로로 지정해도 건너뜁니다.
+"""
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# fsync 간격 (레코드 수)
+DEFAULT_SYNC_INTERVAL = 100
+
+
+def read_checkpoint(
+    path: str
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, str]]]:
+    """
+    체크포인트 저널을 읽습니다.
+
+    Args:
+        path: 저널 파일 경로
+
+    Returns:
+        (파일 키별 성공한 처리 결과, 치환 매핑 {'type:original': {...}})
+        (키 없이 기록된 레코드는 입력 경로를 키로 사용)
+    """
+    completed: Dict[str, Dict[str, Any]] = {}
+    replacement_map: Dict[str, Dict[str, str]] = {}
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # 중단되어 잘린 마지막 레코드
+                continue
+
+            for entry in record['entries']:
+                replacement_map[f"{entry['type']}:{entry['original']}"] = entry
+            result = record['result']
+            key = record.get('key', result['input'])
+            if result['status'] == 'success':
+                completed[key] = result
+            else:
+                completed.pop(key, None)
+
+    return completed, replacement_map
+
+
+class CheckpointJournal:
+    """처리 결과와 치환 매핑 변경분을 기록하는 JSON Lines 저널"""
+
+    def __init__(
+        self,
+        path: str,
+        resume: bool = False,
+        sync_interval: int = DEFAULT_SYNC_INTERVAL
+    ):
+        """
+        Args:
+            path: 저널 파일 경로
+            resume: 기존 저널에 이어서 기록할지 여부 (False면 새로 시작)
+            sync_interval: fsync 간격 (레코드 수)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.sync_interval = max(1, sync_interval)
+        self._pending = 0
+        self._file = open(self.path, 'a' if resume else 'w', encoding='utf-8')
+        if resume and self._ends_with_partial_line():
+            # 잘린 레코드 뒤에 이어 쓰지 않도록 줄을 바꿈
+            self._file.write('\n')
+
+    def _ends_with_partial_line(self) -> bool:
+        """저널이 줄바꿈으로 끝나지 않는지 (마지막 레코드가 잘렸는지) 확인합니다."""
+        with open(self.path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return False
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b'\n'
+
+    def record(
+        self,
+        result: Dict[str, Any],
+        entries: List[Dict[str, str]],
+        key: Optional[str] = None
+    ):
+        """
+        파일 하나의 처리 결과를 기록합니다.
+
+        Args:
+            result: 처리 결과 ({'input', 'output', 'status', ...})
+            entries: 이 파일을 처리하며 새로 만든 치환 항목
+            key: 재개할 때 파일을 찾을 키 (None이면 result['input'] 사용)
+        """
+        record = {'result': result, 'entries': entries}
+        if key is not None:
+            record['key'] = key
+        self._file.write(json.dumps(record, ensure_ascii=False))
+        self._file.write('\n')
+        self._file.flush()
+        self._pending += 1
+        if self._pending >= self.sync_interval:
+            self.sync()
+
+    def sync(self):
+        """기록한 레코드를 fsync합니다."""
+        os.fsync(self._file.fileno())
+        self._pending = 0
+
+    def close(self):
+        """남은 레코드를 fsync하고 저널을 닫습니다."""
+        if self._file.closed:
+            return
+        if self._pending:
+            self.sync()
+        self._file.close()
+
+    def __enter__(self) -> 'CheckpointJournal':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
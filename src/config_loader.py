@@ -20,9 +20,10 @@ class ConfigLoader:
             config_path = base_dir / "config" / "personal_info_patterns.yaml"
         
         self.config_path = Path(config_path)
-        self.patterns = self._load_config()
+        self.config = self._load_config()
+        self.patterns = self.config.get('personal_info_patterns', [])
     
-    def _load_config(self) -> List[Dict[str, Any]]:
+    def _load_config(self) -> Dict[str, Any]:
         """설정 파일을 로드합니다."""
         if not self.config_path.exists():
             raise FileNotFoundError(
@@ -39,13 +40,25 @@ class ConfigLoader:
                     f"지원하지 않는 설정 파일 형식입니다: {self.config_path.suffix}"
                 )
         
-        return config.get('personal_info_patterns', [])
+        return config or {}
     
     def get_patterns(self) -> List[Dict[str, Any]]:
         """로드된 패턴 목록을 반환합니다."""
         return self.patterns
     
+    def get_setting(self, name: str, default: Any = None) -> Any:
+        """
+        패턴 외의 최상위 설정 항목을 반환합니다.
+        
+        Args:
+            name: 설정 항목 이름 (예: path_templates)
+            default: 항목이 없을 때 반환할 값
+        """
+        value = self.config.get(name)
+        return default if value is None else value
+    
     def reload(self):
         """설정 파일을 다시 로드합니다."""
-        self.patterns = self._load_config()
+        self.config = self._load_config()
+        self.patterns = self.config.get('personal_info_patterns', [])
 
@@ -0,0 +1,116 @@
+"""디렉토리 탐색 모듈
+
+os.scandir로 디렉토리를 스레드 풀에서 병렬로 읽으면서 발견한 파일을 바로 내보내는
+스트리밍 탐색기입니다. 전체 목록을 만들 때까지 기다리지 않으므로 파일이 수십만 개인
+저장소에서도 처리를 즉시 시작할 수 있고, 메모리에는 아직 읽지 않은 디렉토리만 남습니다.
+
+디렉토리는 발견한 순서(너비 우선)대로, 디렉토리 안의 항목은 이름순으로 내보내므로
+병렬로 읽어도 결과 순서는 항상 같습니다.
+"""
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
+from typing import AbstractSet, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+# 기본으로 처리할 파일 (JSON 및 NDJSON)
+DEFAULT_INCLUDE = ('*.json', '*.ndjson', '*.jsonl')
+
+# 기본으로 건너뛸 디렉토리
+DEFAULT_EXCLUDE = (
+    '.git', '.hg', '.svn', 'node_modules', '__pycache__', '.venv', '.tox',
+)
+
+# 디렉토리를 읽는 기본 스레드 수
+DEFAULT_WALK_WORKERS = 4
+
+
+def _matches(name: str, rel_path: str, patterns: Iterable[str]) -> bool:
+    """이름 또는 상대 경로가 glob 패턴 중 하나와 일치하는지 확인합니다."""
+    return any(fnmatch(name, pattern) or fnmatch(rel_path, pattern) for pattern in patterns)
+
+
+def _scan_directory(
+    path: str,
+    rel_path: str,
+    include: Sequence[str],
+    exclude: Sequence[str],
+    exclude_paths: AbstractSet[str] = frozenset()
+) -> Tuple[List[str], List[Tuple[str, str]]]:
+    """
+    디렉토리 하나를 읽어 (대상 파일 목록, 하위 디렉토리 목록)을 반환합니다.
+
+    심볼릭 링크 디렉토리는 순환을 피하기 위해 따라가지 않습니다.
+    """
+    files = []
+    directories = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                child_rel = f"{rel_path}/{entry.name}" if rel_path else entry.name
+                if child_rel in exclude_paths or _matches(entry.name, child_rel, exclude):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        directories.append((entry.path, child_rel))
+                    elif entry.is_file() and _matches(entry.name, child_rel, include):
+                        files.append(entry.path)
+                except OSError:
+                    continue
+    except OSError as e:
+        print(f"경고: 디렉토리를 읽을 수 없습니다: {path} ({e})")
+    return files, directories
+
+
+def walk_files(
+    root: str,
+    include: Optional[Sequence[str]] = None,
+    exclude: Optional[Sequence[str]] = None,
+    max_depth: Optional[int] = None,
+    workers: int = DEFAULT_WALK_WORKERS,
+    exclude_paths: Optional[Iterable[str]] = None
+) -> Iterator[str]:
+    """
+    디렉토리 아래의 대상 파일을 발견하는 대로 내보냅니다.
+
+    Args:
+        root: 탐색할 디렉토리
+        include: 처리할 파일 glob 패턴 (파일 이름 또는 root 기준 상대 경로와 비교)
+        exclude: 건너뛸 파일/디렉토리 glob 패턴 (None이면 DEFAULT_EXCLUDE)
+        max_depth: 내려갈 최대 깊이 (root 바로 아래 파일이 0, None이면 제한 없음)
+        workers: 디렉토리를 병렬로 읽을 스레드 수
+        exclude_paths: 건너뛸 파일/디렉토리의 root 기준 상대 경로 ('/' 구분).
+            glob 패턴이 아니며 이름만 같은 다른 위치의 항목은 건너뛰지 않음
+
+    Returns:
+        파일 경로 이터레이터
+    """
+    include = tuple(include) if include else DEFAULT_INCLUDE
+    exclude = tuple(exclude) if exclude is not None else DEFAULT_EXCLUDE
+    exclude_paths = frozenset(exclude_paths or ())
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, workers),
+        thread_name_prefix='walk'
+    ) as executor:
+        pending = deque([
+            (
+                executor.submit(
+                    _scan_directory, str(root), '', include, exclude, exclude_paths
+                ),
+                0
+            )
+        ])
+        while pending:
+            future, depth = pending.popleft()
+            files, directories = future.result()
+            if max_depth is None or depth < max_depth:
+                for path, rel_path in directories:
+                    pending.append((
+                        executor.submit(
+                            _scan_directory, path, rel_path, include, exclude, exclude_paths
+                        ),
+                        depth + 1
+                    ))
+            yield from files
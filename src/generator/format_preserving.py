@@ -0,0 +1,120 @@
+"""형식 보존 생성 모듈
+
+생성된 가상 값을 원본 값의 형식(길이, 구분자, 대소문자, 문자 종류)에 맞춥니다.
+예를 들어 원본이 '01012345678'이면 생성된 '532-1234-5678'을 '53212345678'로 바꿉니다.
+
+원본의 형태(shape)는 숫자 -> '9', 대문자 -> 'A', 소문자 -> 'a'로 바꾼 문자열이며,
+형태마다 한 번만 템플릿으로 컴파일하여 캐시합니다. 템플릿은 생성된 값의 숫자와 영문자를
+순서대로 채우고, 모자라면 주어진 난수 생성기에서 뽑으므로 해시 시드 기반 결정성이 유지됩니다.
+"""
+import itertools
+import random
+import string
+from functools import lru_cache
+from typing import Tuple, Union
+
+
+# 문자 종류
+DIGIT = '9'
+UPPER = 'A'
+LOWER = 'a'
+
+# 원본 값 -> 형태 문자열 변환 테이블 (그 외 문자는 구분자로 그대로 유지)
+_SHAPE_TABLE = str.maketrans(
+    string.digits + string.ascii_uppercase + string.ascii_lowercase,
+    DIGIT * 10 + UPPER * 26 + LOWER * 26
+)
+
+# 템플릿 캐시 크기 (형태의 가짓수는 보통 유형당 몇 개 수준)
+SHAPE_CACHE_SIZE = 1024
+
+
+class ShapeTemplate:
+    """형태 문자열에서 컴파일한 채우기 템플릿"""
+
+    def __init__(self, shape: str):
+        """
+        Args:
+            shape: 원본 값의 형태 문자열 (예: '999-9999-9999')
+        """
+        runs = []
+        for char, group in itertools.groupby(shape):
+            length = len(list(group))
+            if char in (DIGIT, UPPER, LOWER):
+                runs.append((char, length))
+            else:
+                runs.append((None, char * length))
+        self.runs: Tuple[Tuple[Union[str, None], Union[int, str]], ...] = tuple(runs)
+        self.digit_count = sum(length for kind, length in runs if kind == DIGIT)
+        self.letter_count = sum(length for kind, length in runs if kind in (UPPER, LOWER))
+
+    @property
+    def has_slots(self) -> bool:
+        """채울 자리(숫자/영문자)가 있는지 여부"""
+        return bool(self.digit_count or self.letter_count)
+
+    def fill(self, candidate: str, rng=random) -> str:
+        """
+        생성된 값의 숫자/영문자를 순서대로 템플릿에 채웁니다.
+
+        Args:
+            candidate: 생성기가 만든 값
+            rng: 모자란 자리를 채울 난수 생성기 (random 모듈 또는 random.Random)
+
+        Returns:
+            원본과 같은 형식의 값
+        """
+        digits = [char for char in candidate if char in string.digits]
+        letters = [char for char in candidate if char in string.ascii_letters]
+        if len(digits) < self.digit_count:
+            digits.extend(rng.choices(string.digits, k=self.digit_count - len(digits)))
+        if len(letters) < self.letter_count:
+            letters.extend(
+                rng.choices(string.ascii_uppercase, k=self.letter_count - len(letters))
+            )
+
+        parts = []
+        digit_pos = letter_pos = 0
+        for kind, spec in self.runs:
+            if kind is None:
+                parts.append(spec)
+            elif kind == DIGIT:
+                parts.append(''.join(digits[digit_pos:digit_pos + spec]))
+                digit_pos += spec
+            else:
+                chunk = ''.join(letters[letter_pos:letter_pos + spec])
+                letter_pos += spec
+                parts.append(chunk.upper() if kind == UPPER else chunk.lower())
+        return ''.join(parts)
+
+
+def shape_of(value: str) -> str:
+    """값의 형태 문자열을 반환합니다 (예: 'AB-12c' -> 'AA-99a')."""
+    return value.translate(_SHAPE_TABLE)
+
+
+@lru_cache(maxsize=SHAPE_CACHE_SIZE)
+def compile_shape(shape: str) -> ShapeTemplate:
+    """형태 문자열의 템플릿을 반환합니다 (형태별로 캐시)."""
+    return ShapeTemplate(shape)
+
+
+def preserve_format(original: str, candidate: str, rng=random) -> str:
+    """
+    생성된 값을 원본 값의 형식에 맞춥니다.
+
+    원본에 채울 자리가 없거나 결과가 우연히 원본과 같으면 생성된 값을 그대로 반환합니다.
+
+    Args:
+        original: 원본 값
+        candidate: 생성기가 만든 값
+        rng: 모자란 자리를 채울 난수 생성기
+
+    Returns:
+        원본과 같은 형식의 가상 값
+    """
+    template = compile_shape(shape_of(original))
+    if not template.has_slots:
+        return candidate
+    result = template.fill(candidate, rng)
+    return candidate if result == original else result
@@ -1,123 +1,284 @@
 """가상 개인정보 생성 모듈"""
+import importlib
+import itertools
 import random
 import string
-from typing import Dict, Optional
+import threading
+from functools import lru_cache
+from importlib.metadata import entry_points
+from typing import Callable, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 
+from .format_preserving import LOWER, compile_shape, preserve_format, shape_of
+
+
+# 원본 값을 받아 가상 값을 반환하는 생성 함수
+GeneratorFunc = Callable[[Optional[str]], str]
+
+# 외부 패키지가 생성기를 등록하는 entry point 그룹 (이름 = 개인정보 유형)
+ENTRY_POINT_GROUP = 'deidentifier.generators'
+
+# 생성된 값을 원본 값의 형식(길이, 구분자, 대소문자)에 맞추는 유형
+FORMAT_PRESERVING_TYPES = frozenset([
+    'ssn', 'passport', 'driver_license', 'birth_date', 'phone',
+    'card_number', 'account_number', 'imei', 'imsi',
+])
+
+
+def resolve_generator(path: str) -> GeneratorFunc:
+    """
+    'module:function' 형식의 경로에서 생성 함수를 가져옵니다.
+    
+    Args:
+        path: 생성 함수 경로 (예: 'my_package.generators:generate_member_id')
+    
+    Returns:
+        생성 함수
+    """
+    module_name, _, attr = path.partition(':')
+    if not module_name or not attr:
+        raise ValueError(f"생성기 경로는 'module:function' 형식이어야 합니다: {path}")
+    generator = getattr(importlib.import_module(module_name), attr, None)
+    if not callable(generator):
+        raise ValueError(f"호출할 수 있는 생성기를 찾을 수 없습니다: {path}")
+    return generator
+
+
+@lru_cache(maxsize=1)
+def _entry_point_generators() -> Tuple[Dict[str, GeneratorFunc], Tuple[str, ...]]:
+    """
+    설치된 패키지의 생성기 entry point를 한 번만 읽어옵니다.
+    
+    Returns:
+        (유형별 생성 함수, 불러오지 못한 entry point의 오류 메시지)
+    """
+    generators = {}
+    errors = []
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        try:
+            generators[entry_point.name] = entry_point.load()
+        except Exception as e:
+            errors.append(f"{entry_point.name} ({e})")
+    return generators, tuple(errors)
+
 
 class VirtualDataGenerator:
-    """가상의 개인정보를 생성하는 클래스"""
+    """가상의 개인정보를 생성하는 클래스
     
-    def __init__(self, seed: Optional[int] = None):
+    개인정보 유형별 생성 함수는 생성 시 한 번 레지스트리에 등록되며,
+    register()나 설정 파일의 generators 항목, (load_entry_points를 켠 경우)
+    entry point로 유형을 추가할 수 있습니다.
+    """
+    
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        generators: Optional[Dict[str, str]] = None,
+        load_entry_points: bool = False,
+        format_preserving: bool = True
+    ):
         """
         Args:
             seed: 랜덤 시드 (일관성을 위해 사용)
+            generators: 추가/대체할 생성기 ({유형: 'module:function'})
+            load_entry_points: deidentifier.generators entry point를 등록할지 여부
+                (설치된 패키지의 코드를 불러오므로 명시적으로 켠 경우에만 사용)
+            format_preserving: FORMAT_PRESERVING_TYPES 유형의 값을 원본 형식에 맞출지 여부
         """
-        if seed is not None:
-            random.seed(seed)
-        self.counter = 0
-        self.company_counter = 0
+        # 스레드마다 독립된 난수 생성기를 사용하여 여러 스레드에서 공유해도
+        # 한 스레드의 시드가 다른 스레드의 생성 결과에 영향을 주지 않게 함
+        self._seed = seed
+        self._local = threading.local()
+        self._name_counter = itertools.count(1)
+        self._company_counter = itertools.count(1)
+        self.format_preserving_types = (
+            set(FORMAT_PRESERVING_TYPES) if format_preserving else set()
+        )
+        
+        self.generators: Dict[str, GeneratorFunc] = {}
+        # 불러오지 못한 entry point의 오류 메시지 (호출한 쪽에서 경고로 출력)
+        self.entry_point_errors: List[str] = []
+        self._register_builtin_generators()
+        if load_entry_points:
+            entry_point_generators, errors = _entry_point_generators()
+            for info_type, generator in entry_point_generators.items():
+                self.register(info_type, generator)
+            self.entry_point_errors.extend(errors)
+        for info_type, path in (generators or {}).items():
+            self.register(info_type, resolve_generator(path))
+    
+    @property
+    def rng(self) -> random.Random:
+        """현재 스레드의 난수 생성기"""
+        rng = getattr(self._local, 'rng', None)
+        if rng is None:
+            rng = self._local.rng = random.Random(self._seed)
+        return rng
+    
+    def seed(self, value: int):
+        """현재 스레드의 난수 생성기 시드를 설정합니다."""
+        self.rng.seed(value)
+    
+    def _register_builtin_generators(self):
+        """기본 제공 유형의 생성기를 등록합니다."""
+        builtin = {
+            'name': self.generate_name,
+            'company_name': self.generate_company_name,
+            'ssn': self.generate_ssn,
+            'passport': self.generate_passport,
+            'driver_license': self.generate_driver_license,
+            'birth_date': self.generate_birth_date,
+            'phone': self.generate_phone,
+            'address': self.generate_address,
+            'card_number': self.generate_card_number,
+            'account_number': self.generate_account_number,
+            'email': self.generate_email,
+            'imei': self.generate_imei,
+            'imsi': self.generate_imsi,
+            'mac_address': self.generate_mac_address,
+            'ip_address': self.generate_ip_address,
+            'header': self.generate_header,
+        }
+        for info_type, generator in builtin.items():
+            self.register(info_type, generator)
+    
+    def register(self, info_type: str, generator: GeneratorFunc):
+        """
+        개인정보 유형의 생성기를 등록합니다 (이미 있으면 대체).
+        
+        Args:
+            info_type: 개인정보 유형
+            generator: 원본 값을 받아 가상 값을 반환하는 함수
+        """
+        self.generators[info_type] = generator
     
     def generate_name(self, original: str = None) -> str:
         """가상의 이름을 생성합니다."""
-        self.counter += 1
-        return f"테스트개인{self.counter}"
+        return f"테스트개인{next(self._name_counter)}"
     
     def generate_company_name(self, original: str = None) -> str:
         """가상의 법인명을 생성합니다."""
-        self.company_counter += 1
-        return f"테스트법인{self.company_counter}"
+        return f"테스트법인{next(self._company_counter)}"
     
     def generate_ssn(self, original: str = None) -> str:
         """가상의 주민등록번호를 생성합니다."""
         # 생년월일 부분 (존재하지 않을 법한 날짜)
-        year = random.randint(50, 99)  # 1950-1999
-        month = random.randint(13, 99)  # 잘못된 월
-        day = random.randint(32, 99)  # 잘못된 일
+        year = self.rng.randint(50, 99)  # 1950-1999
+        month = self.rng.randint(13, 99)  # 잘못된 월
+        day = self.rng.randint(32, 99)  # 잘못된 일
         
         # 뒷자리 (존재하지 않을 법한 번호)
-        suffix = random.randint(100000, 999999)
+        suffix = self.rng.randint(100000, 999999)
         
         return f"{year:02d}{month:02d}{day:02d}-{suffix}"
     
     def generate_passport(self, original: str = None) -> str:
         """가상의 여권번호를 생성합니다."""
-        prefix = random.choice(['XX', 'YY', 'ZZ'])  # 존재하지 않는 국가 코드
-        number = random.randint(1000000, 9999999)
+        prefix = self.rng.choice(['XX', 'YY', 'ZZ'])  # 존재하지 않는 국가 코드
+        number = self.rng.randint(1000000, 9999999)
         return f"{prefix}{number}"
     
     def generate_driver_license(self, original: str = None) -> str:
         """가상의 운전면허번호를 생성합니다."""
         # 형식: XX-XX-XXXXXX-XX
-        part1 = random.randint(99, 99)  # 잘못된 지역 코드
-        part2 = random.randint(99, 99)  # 잘못된 지역 코드
-        part3 = random.randint(100000, 999999)
-        part4 = random.randint(99, 99)  # 잘못된 체크섬
+        part1 = self.rng.randint(99, 99)  # 잘못된 지역 코드
+        part2 = self.rng.randint(99, 99)  # 잘못된 지역 코드
+        part3 = self.rng.randint(100000, 999999)
+        part4 = self.rng.randint(99, 99)  # 잘못된 체크섬
         return f"{part1:02d}-{part2:02d}-{part3:06d}-{part4:02d}"
     
     def generate_birth_date(self, original: str = None) -> str:
         """가상의 생년월일을 생성합니다."""
         # 존재하지 않을 법한 날짜
-        year = random.randint(1900, 2024)
-        month = random.randint(13, 99)  # 잘못된 월
-        day = random.randint(32, 99)  # 잘못된 일
+        year = self.rng.randint(1900, 2024)
+        month = self.rng.randint(13, 99)  # 잘못된 월
+        day = self.rng.randint(32, 99)  # 잘못된 일
         return f"{year:04d}-{month:02d}-{day:02d}"
     
     def generate_phone(self, original: str = None) -> str:
         """가상의 전화번호를 생성합니다."""
         # 전화번호 형식이지만 실제로는 존재하지 않는 번호
         # 010, 011 등으로 시작하지 않고 잘못된 형식
-        area = random.randint(532, 999)  # 존재하지 않는 지역번호
-        middle = random.randint(1000, 9999)
-        last = random.randint(1000, 9999)
+        area = self.rng.randint(532, 999)  # 존재하지 않는 지역번호
+        middle = self.rng.randint(1000, 9999)
+        last = self.rng.randint(1000, 9999)
         return f"{area}-{middle}-{last}"
     
     def generate_address(self, original: str = None) -> str:
         """가상의 주소를 생성합니다."""
         cities = ["테스트시", "가상구", "모의동"]
         streets = ["테스트로", "가상길", "모의대로"]
-        numbers = random.randint(1, 999)
-        return f"{random.choice(cities)} {random.choice(streets)} {numbers}"
+        numbers = self.rng.randint(1, 999)
+        return f"{self.rng.choice(cities)} {self.rng.choice(streets)} {numbers}"
     
     def generate_card_number(self, original: str = None) -> str:
         """가상의 카드번호를 생성합니다."""
         # Luhn 알고리즘을 만족하지 않는 잘못된 카드번호
-        part1 = random.randint(1000, 9999)
-        part2 = random.randint(1000, 9999)
-        part3 = random.randint(1000, 9999)
-        part4 = random.randint(1000, 9999)
+        part1 = self.rng.randint(1000, 9999)
+        part2 = self.rng.randint(1000, 9999)
+        part3 = self.rng.randint(1000, 9999)
+        part4 = self.rng.randint(1000, 9999)
         return f"{part1:04d}-{part2:04d}-{part3:04d}-{part4:04d}"
     
     def generate_account_number(self, original: str = None) -> str:
         """가상의 계좌번호를 생성합니다."""
         # 존재하지 않을 법한 계좌번호
-        return str(random.randint(1000000000, 99999999999999999999))
+        return str(self.rng.randint(1000000000, 99999999999999999999))
     
     def generate_email(self, original: str = None) -> str:
         """가상의 이메일 주소를 생성합니다."""
-        self.counter += 1
+        # 호출 순서와 무관하게 시드로만 결정되도록 번호도 난수로 생성
         domains = ["test.example", "virtual.test", "mock.invalid"]
-        return f"testuser{self.counter}@{random.choice(domains)}"
+        return f"testuser{self.rng.randint(1, 99999999)}@{self.rng.choice(domains)}"
     
     def generate_imei(self, original: str = None) -> str:
         """가상의 IMEI를 생성합니다."""
         # IMEI 체크섬을 만족하지 않는 잘못된 번호
-        return str(random.randint(100000000000000, 999999999999999))
+        return str(self.rng.randint(100000000000000, 999999999999999))
     
     def generate_imsi(self, original: str = None) -> str:
         """가상의 IMSI를 생성합니다."""
         # 존재하지 않을 법한 IMSI
-        return str(random.randint(100000000000000, 999999999999999))
+        return str(self.rng.randint(100000000000000, 999999999999999))
     
     def generate_mac_address(self, original: str = None) -> str:
         """가상의 MAC 주소를 생성합니다."""
-        # 로컬 관리 주소 (LAA) 형식이지만 잘못된 형식
-        parts = []
-        for _ in range(6):
-            # 잘못된 형식 (예: 99:99:99:99:99:99)
-            parts.append(f"{random.randint(99, 99):02x}")
+        # 제조사(OUI)에 할당되지 않는 로컬 관리(LAA) 유니캐스트 주소 (02:xx:xx:xx:xx:xx)
+        parts = ['02']
+        for _ in range(5):
+            parts.append(f"{self.rng.randint(0, 255):02x}")
         return ":".join(parts)
     
+    def generate_ip_address(self, original: str = None) -> str:
+        """가상의 IP 주소를 생성합니다."""
+        # 문서용으로 예약된 주소 대역 (RFC 5737, RFC 3849)
+        if original and ':' in original:
+            return f"2001:db8::{self.rng.randint(1, 0xffff):x}"
+        prefix = self.rng.choice(['192.0.2', '198.51.100', '203.0.113'])
+        return f"{prefix}.{self.rng.randint(1, 254)}"
+    
+    def generate_header(self, original: str = None) -> str:
+        """
+        값 전체를 치환하는 헤더(deny 정책)의 가상 값을 생성합니다.
+        
+        원본과 길이가 같은 불투명 토큰으로, 숫자/대문자/소문자 자리는 같은 종류의
+        임의 문자로 채우고 구분자('-', '.', '=' 등)와 인증 스킴('Bearer ' 등)은 유지합니다.
+        ASCII가 아닌 문자(한글 등)는 영문 소문자로 채웁니다.
+        """
+        if not original:
+            return ''.join(self.rng.choices(string.ascii_lowercase + string.digits, k=32))
+        
+        scheme, separator, credentials = original.partition(' ')
+        if separator and credentials and scheme.isascii() and scheme.isalpha():
+            prefix, body = scheme + separator, credentials
+        else:
+            prefix, body = '', original
+        shape = ''.join(
+            LOWER if not char.isascii() and char.isalnum() else char
+            for char in shape_of(body)
+        )
+        return prefix + compile_shape(shape).fill('', self.rng)
+    
     def generate(self, info_type: str, original_value: str = None) -> str:
         """
         개인정보 유형에 따라 가상 데이터를 생성합니다.
@@ -129,27 +290,12 @@ class VirtualDataGenerator:
         Returns:
             생성된 가상 개인정보
         """
-        generator_map = {
-            'name': self.generate_name,
-            'company_name': self.generate_company_name,
-            'ssn': self.generate_ssn,
-            'passport': self.generate_passport,
-            'driver_license': self.generate_driver_license,
-            'birth_date': self.generate_birth_date,
-            'phone': self.generate_phone,
-            'address': self.generate_address,
-            'card_number': self.generate_card_number,
-            'account_number': self.generate_account_number,
-            'email': self.generate_email,
-            'imei': self.generate_imei,
-            'imsi': self.generate_imsi,
-            'mac_address': self.generate_mac_address,
-        }
-        
-        generator = generator_map.get(info_type)
+        generator = self.generators.get(info_type)
         if generator:
-            return generator(original_value)
+            value = generator(original_value)
+            if info_type in self.format_preserving_types and isinstance(original_value, str):
+                value = preserve_format(original_value, value, self.rng)
+            return value
         else:
             # 알 수 없는 유형인 경우 기본값 반환
-            return f"테스트값_{random.randint(1000, 9999)}"
-
+            return f"테스트값_{self.rng.randint(1000, 9999)}"
@@ -4,16 +4,32 @@ import json
 from typing import Dict, List, Any, Tuple, Optional
 from pathlib import Path
 
+from ..json_io import load_json_file, DEFAULT_MMAP_THRESHOLD
+from .validators import VALIDATORS
+
+
+# 값만으로 판별할 때 검사할 최대 문자열 길이 (이보다 긴 값은 건너뜀)
+VALUE_ONLY_MAX_LENGTH = 64
+
 
 class PersonalInfoIdentifier:
     """JSON 데이터에서 개인정보를 식별하는 클래스"""
     
-    def __init__(self, patterns: List[Dict[str, Any]]):
+    def __init__(
+        self,
+        patterns: List[Dict[str, Any]],
+        mmap_threshold: Optional[int] = DEFAULT_MMAP_THRESHOLD,
+        value_only: bool = False
+    ):
         """
         Args:
             patterns: 개인정보 패턴 정의 리스트
+            mmap_threshold: 메모리 매핑으로 읽을 최소 파일 크기 (None이면 사용 안 함)
+            value_only: 키가 일치하지 않아도 값만으로 개인정보를 판별할지 여부
         """
         self.patterns = patterns
+        self.mmap_threshold = mmap_threshold
+        self.value_only = value_only
         self._compile_patterns()
     
     def _compile_patterns(self):
@@ -34,6 +50,102 @@ class PersonalInfoIdentifier:
                 'value_pattern': value_pattern,
                 'type': pattern_def.get('type', 'unknown')
             })
+        
+        self._compile_text_patterns()
+        self._compile_value_only_patterns()
+    
+    def _compile_value_only_patterns(self):
+        """
+        값만으로 판별할 유형의 패턴을 우선순위 순으로 하나의 정규표현식으로 결합합니다.
+        
+        validator가 지정되었거나 value_only: true인 패턴만 대상이며,
+        priority가 높은 유형이 먼저 시도됩니다. 결합된 패턴에 한 번 매칭하여
+        후보 유형을 고른 뒤 체크섬 검증을 수행합니다.
+        """
+        candidates = []
+        for index, pattern_def in enumerate(self.patterns):
+            validator_name = pattern_def.get('validator')
+            if not pattern_def.get('pattern'):
+                continue
+            if not validator_name and not pattern_def.get('value_only'):
+                continue
+            if validator_name and validator_name not in VALIDATORS:
+                raise ValueError(f"알 수 없는 validator입니다: {validator_name}")
+            candidates.append({
+                'group': f"v{index}",
+                'type': pattern_def.get('type', 'unknown'),
+                'priority': pattern_def.get('priority', 0),
+                'pattern': pattern_def['pattern'],
+                'validator': VALIDATORS.get(validator_name)
+            })
+        
+        # 우선순위가 높은 유형부터 (같으면 설정 파일 순서)
+        candidates.sort(key=lambda c: -c['priority'])
+        for candidate in candidates:
+            candidate['compiled'] = re.compile(candidate['pattern'], re.IGNORECASE)
+        
+        self.value_only_candidates = candidates
+        self.value_only_groups = {c['group']: i for i, c in enumerate(candidates)}
+        self.value_only_pattern = re.compile(
+            '|'.join(f"(?P<{c['group']}>{c['pattern']})" for c in candidates),
+            re.IGNORECASE
+        ) if candidates else None
+    
+    def classify_value(self, value: Any) -> Optional[str]:
+        """
+        키와 무관하게 값의 내용만으로 개인정보 유형을 판별합니다.
+        
+        Args:
+            value: 검사할 값 (문자열 또는 정수)
+        
+        Returns:
+            판별된 개인정보 유형, 개인정보가 아니면 None
+        """
+        if self.value_only_pattern is None or isinstance(value, bool):
+            return None
+        if not isinstance(value, (str, int)):
+            return None
+        
+        value_str = value if isinstance(value, str) else str(value)
+        if not value_str or len(value_str) > VALUE_ONLY_MAX_LENGTH:
+            return None
+        
+        match = self.value_only_pattern.fullmatch(value_str)
+        if match is None:
+            return None
+        
+        # 결합 패턴이 고른 후보부터 체크섬을 검증하고,
+        # 실패하면 우선순위가 낮은 나머지 후보를 차례로 검사
+        first = self.value_only_groups[match.lastgroup]
+        for candidate in self.value_only_candidates[first:]:
+            if candidate is not self.value_only_candidates[first]:
+                if not candidate['compiled'].fullmatch(value_str):
+                    continue
+            validator = candidate['validator']
+            if validator is None or validator(value_str):
+                return candidate['type']
+        return None
+    
+    def _compile_text_patterns(self):
+        """
+        자유 텍스트 검색용 패턴(text_pattern)을 하나의 정규표현식으로 결합합니다.
+        
+        각 유형의 패턴을 이름 있는 그룹으로 감싸 alternation으로 합치므로
+        문자열을 한 번만 훑어서 모든 유형의 개인정보 위치를 찾을 수 있습니다.
+        """
+        alternatives = []
+        self.text_pattern_types: Dict[str, str] = {}
+        for index, pattern_def in enumerate(self.patterns):
+            text_pattern = pattern_def.get('text_pattern')
+            if not text_pattern:
+                continue
+            group_name = f"t{index}"
+            self.text_pattern_types[group_name] = pattern_def.get('type', 'unknown')
+            alternatives.append(f"(?P<{group_name}>{text_pattern})")
+        
+        self.text_pattern = re.compile(
+            '|'.join(alternatives)
+        ) if alternatives else None
     
     def _matches_key_pattern(self, key: str, key_patterns: List[re.Pattern]) -> bool:
         """키가 패턴과 일치하는지 확인합니다."""
@@ -81,8 +193,44 @@ class PersonalInfoIdentifier:
                         'key': key
                     }
         
+        # 키와 무관하게 값만으로 판별 (선택사항)
+        if self.value_only:
+            info_type = self.classify_value(value)
+            if info_type:
+                return {
+                    'type': info_type,
+                    'value': value_str,
+                    'key': key
+                }
+        
         return None
     
+    def find_in_text(self, text: str) -> List[Dict[str, Any]]:
+        """
+        문자열 내부에 포함된 모든 개인정보의 위치를 찾습니다.
+        
+        키와 무관하게 text_pattern이 정의된 유형만 검색하며, 로그 메시지나
+        HTML 본문처럼 긴 문자열 안에 섞여 있는 개인정보를 찾는 데 사용합니다.
+        
+        Args:
+            text: 검사할 문자열
+        
+        Returns:
+            [{'type': 타입, 'value': 값, 'start': 시작 위치, 'end': 끝 위치}, ...]
+        """
+        if self.text_pattern is None or not isinstance(text, str):
+            return []
+        
+        return [
+            {
+                'type': self.text_pattern_types[match.lastgroup],
+                'value': match.group(),
+                'start': match.start(),
+                'end': match.end()
+            }
+            for match in self.text_pattern.finditer(text)
+        ]
+    
     def identify_in_dict(
         self,
         data: Dict[str, Any],
@@ -141,8 +289,7 @@ class PersonalInfoIdentifier:
         if not path.exists():
             raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
         
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json_file(path, self.mmap_threshold)
         
         return self.identify_in_dict(data)
 
@@ -0,0 +1,56 @@
+"""개인정보 값 검증(체크섬) 모듈
+
+키 이름 없이 값만으로 개인정보를 판별할 때 오탐을 줄이기 위해 사용합니다.
+"""
+from typing import Callable, Dict
+
+
+_ASCII_DIGITS = frozenset('0123456789')
+
+
+def _digits(value: str) -> str:
+    """구분자를 제거한 ASCII 숫자만 반환합니다."""
+    # isdigit()은 '²', '٣', 전각 숫자 등도 참이어서 ord(ch) - 48 계산이 틀어짐
+    return ''.join(ch for ch in value if ch in _ASCII_DIGITS)
+
+
+def luhn_valid(value: str) -> bool:
+    """Luhn 체크섬을 만족하는지 확인합니다 (카드번호 등)."""
+    digits = _digits(value)
+    if len(digits) < 2:
+        return False
+
+    total = 0
+    for index, ch in enumerate(reversed(digits)):
+        digit = ord(ch) - 48
+        if index % 2 == 1:
+            digit *= 2
+            if digit > 9:
+                digit -= 9
+        total += digit
+    return total % 10 == 0
+
+
+def rrn_valid(value: str) -> bool:
+    """주민등록번호 검증번호(마지막 자리)가 올바른지 확인합니다."""
+    digits = _digits(value)
+    if len(digits) != 13:
+        return False
+
+    weights = (2, 3, 4, 5, 6, 7, 8, 9, 2, 3, 4, 5)
+    total = sum((ord(d) - 48) * w for d, w in zip(digits, weights))
+    return (11 - total % 11) % 10 == ord(digits[12]) - 48
+
+
+def imei_valid(value: str) -> bool:
+    """15자리 IMEI의 Luhn 체크섬이 올바른지 확인합니다."""
+    digits = _digits(value)
+    return len(digits) == 15 and luhn_valid(digits)
+
+
+# 설정 파일의 validator 이름 -> 검증 함수
+VALIDATORS: Dict[str, Callable[[str], bool]] = {
+    'luhn': luhn_valid,
+    'rrn': rrn_valid,
+    'imei': imei_valid,
+}
@@ -0,0 +1,269 @@
+"""JSON 파일 입출력 모듈"""
+import json
+import mmap
+import os
+import shutil
+import threading
+from typing import Any, Optional, Set
+from pathlib import Path
+
+
+# 이 크기(바이트) 이상인 파일은 메모리 매핑으로 읽음
+DEFAULT_MMAP_THRESHOLD = 16 * 1024 * 1024
+
+# 출력 파일 쓰기 버퍼 크기 (바이트)
+DEFAULT_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# 출력 내구성 모드
+# - none: 원자적 rename만 수행 (fsync 없음)
+# - file: 파일마다 내용과 디렉토리를 fsync
+# - batch: 교체만 먼저 하고, 파일 내용과 디렉토리 fsync는 모두
+#   DurableWriteBatch.flush() 시점에 모아서 수행 (flush 전에 장애가 나면
+#   교체한 파일이 비어 있을 수 있으며, flush가 끝난 뒤에만 모두 반영됨)
+DURABILITY_NONE = 'none'
+DURABILITY_FILE = 'file'
+DURABILITY_BATCH = 'batch'
+DURABILITY_MODES = (DURABILITY_NONE, DURABILITY_FILE, DURABILITY_BATCH)
+
+# 임시 파일 이름 생성 재시도 횟수
+_TEMP_FILE_ATTEMPTS = 100
+
+
+def _fsync_path(path: Path, directory: bool = False):
+    """파일 또는 디렉토리를 fsync합니다."""
+    flags = os.O_RDONLY
+    if directory and hasattr(os, 'O_DIRECTORY'):
+        flags |= os.O_DIRECTORY
+    try:
+        fd = os.open(path, flags)
+    except OSError:
+        # 디렉토리 fsync를 지원하지 않는 플랫폼 (예: Windows)
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class DurableWriteBatch:
+    """batch 내구성 모드에서 fsync를 미뤄둔 출력 파일과 디렉토리를 모아두는 클래스
+
+    파일마다 교체 전에 fsync하는 대신 교체한 파일의 경로만 기록해 두었다가,
+    flush 시점에 파일 내용을 fsync한 뒤 디렉토리를 한 번씩 fsync합니다.
+    파일 설명자는 열어두지 않으므로 기록하는 양은 출력 파일 수에 비례합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.files: Set[Path] = set()
+        self.directories: Set[Path] = set()
+
+    def add(self, path: Path):
+        """교체한 파일과 그 디렉토리를 fsync 대상으로 등록합니다."""
+        with self._lock:
+            self.files.add(path)
+            self.directories.add(path.parent)
+
+    def flush(self) -> int:
+        """
+        등록된 파일의 내용을 fsync한 뒤 디렉토리를 한 번씩 fsync합니다.
+
+        Returns:
+            디스크에 반영한 출력 파일 수
+        """
+        with self._lock:
+            files, self.files = self.files, set()
+            directories, self.directories = self.directories, set()
+
+        for path in files:
+            _fsync_path(path)
+        for directory in directories:
+            _fsync_path(directory, directory=True)
+        return len(files)
+
+
+def create_temp_file(path: Path) -> Path:
+    """
+    출력 파일과 같은 디렉토리에 임시 파일을 만들고 경로를 반환합니다.
+
+    mkstemp와 달리 0o666 권한으로 만들어 운영체제가 현재 umask를 적용하므로,
+    새 출력 파일이 일반 open()으로 만든 파일과 같은 권한을 갖습니다.
+    """
+    for _ in range(_TEMP_FILE_ATTEMPTS):
+        temp_path = path.parent / f".{path.name}.{os.urandom(6).hex()}.tmp"
+        try:
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        except FileExistsError:
+            continue
+        os.close(fd)
+        return temp_path
+    raise FileExistsError(f"임시 파일을 만들 수 없습니다: {path}")
+
+
+def commit_temp_file(
+    temp_path: Path,
+    path: Path,
+    durability: str = DURABILITY_NONE,
+    batch: Optional[DurableWriteBatch] = None
+):
+    """
+    임시 파일을 원자적으로 최종 경로로 교체합니다.
+
+    Args:
+        temp_path: 내용이 모두 기록된 임시 파일 경로
+        path: 최종 출력 경로
+        durability: 내구성 모드 (none, file, batch)
+        batch: batch 모드에서 fsync를 미뤄둘 대상
+    """
+    try:
+        # 덮어쓰는 경우 기존 파일 권한 유지 (새 파일은 생성 시 umask 적용)
+        mode = os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = None
+
+    try:
+        if mode is not None:
+            os.chmod(temp_path, mode)
+        if durability == DURABILITY_FILE:
+            # 교체 후 장애가 나도 빈 파일이 남지 않도록 내용을 먼저 fsync
+            _fsync_path(temp_path)
+        os.replace(temp_path, path)
+    except BaseException:
+        if temp_path.exists():
+            temp_path.unlink()
+        raise
+
+    if durability == DURABILITY_FILE:
+        _fsync_path(path.parent, directory=True)
+    elif durability == DURABILITY_BATCH and batch is not None:
+        batch.add(path)
+
+
+def write_bytes_atomic(
+    data: bytes,
+    path: Path,
+    durability: str = DURABILITY_NONE,
+    batch: Optional[DurableWriteBatch] = None
+):
+    """
+    bytes를 임시 파일에 한 번에 기록한 뒤 원자적으로 교체합니다.
+
+    쓰기 도중 중단되어도 기존 파일은 이전 내용 그대로 남습니다.
+
+    Args:
+        data: 기록할 내용
+        path: 최종 출력 경로
+        durability: 내구성 모드 (none, file, batch)
+        batch: batch 모드에서 fsync를 미뤄둘 대상
+    """
+    temp_path = create_temp_file(path)
+    try:
+        with open(temp_path, 'wb', buffering=0) as f:
+            f.write(data)
+    except BaseException:
+        temp_path.unlink()
+        raise
+    commit_temp_file(temp_path, path, durability, batch)
+
+
+def copy_file_atomic(
+    source: Path,
+    path: Path,
+    durability: str = DURABILITY_NONE,
+    batch: Optional[DurableWriteBatch] = None,
+    link: bool = False
+):
+    """
+    이미 기록된 파일의 내용을 다른 경로에 원자적으로 복사합니다.
+
+    link가 True이면 내용을 복사하지 않고 하드 링크를 만들며, 하드 링크를
+    만들 수 없으면 (다른 파일 시스템 등) 복사로 대신합니다.
+
+    Args:
+        source: 원본 파일 경로
+        path: 최종 출력 경로
+        durability: 내구성 모드 (none, file, batch)
+        batch: batch 모드에서 fsync를 미뤄둘 대상
+        link: 하드 링크 사용 여부
+    """
+    temp_path = create_temp_file(path)
+    if link:
+        temp_path.unlink()
+        try:
+            os.link(source, temp_path)
+        except OSError:
+            link = False
+            temp_path = create_temp_file(path)
+
+    if link:
+        # 링크는 원본과 inode를 공유하므로 권한을 바꾸지 않고 교체만 수행
+        # (내용은 원본을 기록할 때 fsync되며, batch 모드에서는 flush 시점에 fsync)
+        try:
+            os.replace(temp_path, path)
+        except BaseException:
+            temp_path.unlink()
+            raise
+        if durability == DURABILITY_FILE:
+            _fsync_path(path.parent, directory=True)
+        elif durability == DURABILITY_BATCH and batch is not None:
+            batch.add(path)
+        return
+
+    try:
+        shutil.copyfile(source, temp_path)
+    except BaseException:
+        temp_path.unlink()
+        raise
+    commit_temp_file(temp_path, path, durability, batch)
+
+
+def load_json_file(
+    path: Path,
+    mmap_threshold: Optional[int] = DEFAULT_MMAP_THRESHOLD
+) -> Any:
+    """
+    JSON 파일을 읽어 파싱합니다.
+
+    파일은 한 번만 열고 크기에 따라 읽는 방법을 정합니다. 크기가 mmap_threshold
+    이상이면 파일을 메모리 매핑하여, 버퍼 단위로 나누어 읽는 대신 매핑된 영역
+    전체를 한 번에 UTF-8 디코딩합니다. 디코딩 결과는 새 문자열이므로 파일 크기만큼의
+    복사는 여전히 일어나지만, 파일 전체를 담는 중간 bytes 객체는 만들지 않습니다.
+
+    Args:
+        path: JSON 파일 경로
+        mmap_threshold: 메모리 매핑을 사용할 최소 파일 크기 (None이면 사용 안 함)
+
+    Returns:
+        파싱된 JSON 데이터
+    """
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if mmap_threshold is not None and size > 0 and size >= mmap_threshold:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return json.loads(str(mapped, 'utf-8'))
+        return json.loads(f.read().decode('utf-8'))
+
+
+def serialize_json(data: Any) -> bytes:
+    """JSON 데이터를 출력 형식의 UTF-8 bytes로 직렬화합니다."""
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def dump_json_file(
+    data: Any,
+    path: Path,
+    durability: str = DURABILITY_NONE,
+    batch: Optional[DurableWriteBatch] = None
+):
+    """
+    JSON 데이터를 메모리에서 직렬화한 뒤 한 번의 쓰기로 원자적으로 저장합니다.
+
+    Args:
+        data: 저장할 JSON 데이터
+        path: 출력 파일 경로
+        durability: 내구성 모드 (none, file, batch)
+        batch: batch 모드에서 fsync를 미뤄둘 대상
+    """
+    write_bytes_atomic(serialize_json(data), Path(path), durability, batch)
@@ -0,0 +1,117 @@
+"""출력 경로 결정 모듈
+
+입력 파일의 상대 경로를 출력 디렉토리 아래에 그대로 재현하고, 서로 다른 입력이 같은
+출력 경로를 갖는 충돌을 찾아냅니다. 이미 만든 디렉토리를 기억하여 디렉토리마다
+한 번만 생성합니다.
+
+대소문자나 유니코드 정규화(NFC/NFD)만 다른 경로는 출력 디렉토리의 파일 시스템이
+대소문자를 무시하거나 이름을 정규화하는 경우(macOS, Windows의 기본 파일 시스템)에만
+같은 파일이 되므로 충돌로 봅니다. 출력 디렉토리마다 한 번 확인하며, 구분하는 파일
+시스템에서는 두 파일을 모두 쓰고 경고만 출력합니다.
+"""
+import os
+import unicodedata
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+
+class OutputPathMapper:
+    """입력 경로를 출력 경로로 바꾸고 충돌을 검사하는 클래스"""
+
+    def __init__(self, output_dir: str, base_dir: Optional[str] = None):
+        """
+        Args:
+            output_dir: 출력 디렉토리
+            base_dir: 상대 경로의 기준이 되는 입력 디렉토리
+                (None이거나 입력이 그 아래에 없으면 파일 이름만 사용)
+        """
+        self.output_dir = Path(output_dir)
+        self.base_dir = Path(base_dir).resolve() if base_dir is not None else None
+        self._targets: Dict[str, str] = {}
+        # 대소문자와 정규화를 무시한 키 -> 처음 사용한 입력 (경고용)
+        self._variants: Dict[str, str] = {}
+        self._created_dirs: Set[Path] = set()
+        # 출력 파일 시스템의 이름 비교 방식 (처음 prepare할 때 확인, None이면 미확인)
+        self.case_insensitive: Optional[bool] = None
+        self.normalizing: Optional[bool] = None
+
+    def map(self, input_path: str) -> Path:
+        """입력 파일의 출력 경로를 반환합니다."""
+        if self.base_dir is not None:
+            try:
+                relative = Path(input_path).resolve().relative_to(self.base_dir)
+            except ValueError:
+                pass
+            else:
+                return self.output_dir / relative
+        return self.output_dir / Path(input_path).name
+
+    def _probe_filesystem(self):
+        """출력 디렉토리의 파일 시스템이 대소문자를 무시하는지, 이름을 정규화하는지 확인합니다."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        # 소문자와 NFC 'é'를 포함한 이름으로 만든 뒤 대문자/NFD 이름으로 찾아봄
+        name = f".case-probe-{os.urandom(6).hex()}-\u00e9"
+        probe = self.output_dir / name
+        os.close(os.open(probe, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600))
+        try:
+            self.case_insensitive = (self.output_dir / name.upper()).exists()
+            self.normalizing = (
+                self.output_dir / unicodedata.normalize('NFD', name)
+            ).exists()
+        finally:
+            probe.unlink()
+
+    @staticmethod
+    def _folded_key(output_path: Path) -> str:
+        """대소문자와 유니코드 정규화 차이를 무시한 키를 만듭니다."""
+        # normcase는 Windows에서만 대소문자를 무시하므로 macOS에서도 맞도록 직접 정규화
+        absolute = os.path.normcase(os.path.abspath(output_path))
+        return unicodedata.normalize('NFC', absolute).casefold()
+
+    def _collision_key(self, output_path: Path) -> str:
+        """출력 파일 시스템에서 같은 파일이 되는 경로끼리 같은 충돌 검사 키를 만듭니다."""
+        key = os.path.normcase(os.path.abspath(output_path))
+        if self.normalizing:
+            key = unicodedata.normalize('NFC', key)
+        if self.case_insensitive:
+            key = key.casefold()
+        return key
+
+    def prepare(self, input_path: str) -> Path:
+        """
+        출력 경로를 정하고 충돌을 검사한 뒤 상위 디렉토리를 만듭니다.
+
+        Args:
+            input_path: 입력 파일 경로
+
+        Returns:
+            출력 파일 경로
+
+        Raises:
+            ValueError: 다른 입력 파일이 이미 같은 출력 경로(출력 파일 시스템이
+                대소문자를 무시하거나 정규화하면 그 차이만 있는 경로 포함)를 사용하는 경우
+        """
+        if self.case_insensitive is None:
+            self._probe_filesystem()
+
+        output_path = self.map(input_path)
+        key = self._collision_key(output_path)
+        owner = self._targets.setdefault(key, input_path)
+        if owner != input_path:
+            raise ValueError(
+                f"출력 경로 충돌: {input_path}와 {owner}가 같은 경로에 저장됩니다 ({output_path})"
+            )
+
+        variant_owner = self._variants.setdefault(self._folded_key(output_path), input_path)
+        if variant_owner != input_path:
+            print(
+                f"경고: {input_path}와 {variant_owner}의 출력 경로가 대소문자나 유니코드 "
+                f"정규화만 다릅니다 ({output_path}). 대소문자를 구분하지 않는 파일 시스템으로 "
+                f"옮기면 서로 덮어씁니다"
+            )
+
+        parent = output_path.parent
+        if parent not in self._created_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(parent)
+        return output_path
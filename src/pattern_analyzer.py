@@ -0,0 +1,211 @@
+"""패턴 설정 분석 모듈
+
+코퍼스를 훑으며 personal_info_patterns.yaml의 키 정규표현식마다 일치 횟수, 값 패턴
+거부율, 소요 시간을 측정합니다. `.*tel.*`처럼 넓은 키 패턴이 `hotel`, `title` 등에
+일치하여 오탐이나 불필요한 정규표현식 비용을 만드는지 확인하는 데 사용합니다.
+
+일치/거부된 키 이름 예시는 저수지 샘플링(reservoir sampling)으로 고정 개수만 보관하므로
+코퍼스 크기와 무관하게 메모리 사용량이 일정합니다. 보고서에는 값이 아닌 키 이름만 남깁니다.
+"""
+import csv
+import io
+import json
+import random
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .json_io import load_json_file
+from .scenario_processor import NDJSON_SUFFIXES
+
+
+# 키 패턴별로 보관할 키 이름 샘플 수
+DEFAULT_RESERVOIR_SIZE = 10
+
+
+class Reservoir:
+    """고정 크기 균등 표본을 유지하는 저수지 샘플러 (Algorithm R)"""
+
+    def __init__(self, size: int, rng: random.Random):
+        self.size = size
+        self.rng = rng
+        self.seen = 0
+        self.items: List[Any] = []
+
+    def add(self, item: Any):
+        """항목을 하나 관찰합니다."""
+        self.seen += 1
+        if len(self.items) < self.size:
+            self.items.append(item)
+        else:
+            index = self.rng.randrange(self.seen)
+            if index < self.size:
+                self.items[index] = item
+
+
+class _KeyPatternStats:
+    """키 정규표현식 하나의 측정값"""
+
+    def __init__(
+        self,
+        info_type: str,
+        key_regex: re.Pattern,
+        value_regex: Optional[re.Pattern],
+        reservoir_size: int,
+        rng: random.Random
+    ):
+        self.info_type = info_type
+        self.key_regex = key_regex
+        self.value_regex = value_regex
+        self.key_matches = 0
+        self.value_rejections = 0
+        self.key_time_ns = 0
+        self.value_time_ns = 0
+        self.matched_keys = Reservoir(reservoir_size, rng)
+        self.rejected_keys = Reservoir(reservoir_size, rng)
+
+
+def iter_key_values(data: Any, key: str = '') -> Iterator[Tuple[str, Any]]:
+    """문서의 모든 (키, 스칼라 값) 쌍을 순회합니다 (리스트 항목은 부모 키를 사용)."""
+    if isinstance(data, dict):
+        for child_key, value in data.items():
+            yield from iter_key_values(value, child_key)
+    elif isinstance(data, list):
+        for item in data:
+            yield from iter_key_values(item, key)
+    elif key and data is not None:
+        yield key, data
+
+
+class PatternAnalyzer:
+    """키 정규표현식별 일치 횟수, 거부율, 비용을 측정하는 클래스"""
+
+    def __init__(
+        self,
+        patterns: List[Dict[str, Any]],
+        reservoir_size: int = DEFAULT_RESERVOIR_SIZE,
+        seed: int = 0
+    ):
+        """
+        Args:
+            patterns: 개인정보 패턴 정의 리스트
+            reservoir_size: 키 패턴별로 보관할 키 이름 샘플 수
+            seed: 샘플링 난수 시드 (같은 코퍼스에서 같은 보고서를 만들기 위함)
+        """
+        rng = random.Random(seed)
+        self.pairs = 0
+        self.files = 0
+        self.errors: Dict[str, str] = {}
+        self.stats: List[_KeyPatternStats] = []
+        for pattern_def in patterns:
+            value_regex = re.compile(
+                pattern_def['pattern'],
+                re.IGNORECASE
+            ) if pattern_def.get('pattern') else None
+            for key_pattern in pattern_def.get('keys', []):
+                self.stats.append(_KeyPatternStats(
+                    pattern_def.get('type', 'unknown'),
+                    re.compile(key_pattern, re.IGNORECASE),
+                    value_regex,
+                    reservoir_size,
+                    rng
+                ))
+
+    def observe(self, key: str, value: Any):
+        """
+        (키, 값) 쌍 하나를 모든 키 패턴에 대해 측정합니다.
+
+        식별기와 달리 첫 일치에서 멈추지 않고 모든 패턴을 평가하여
+        패턴마다 독립적인 비용을 잽니다.
+        """
+        self.pairs += 1
+        value_str = value if isinstance(value, str) else str(value)
+        clock = time.perf_counter_ns
+        for stats in self.stats:
+            started = clock()
+            matched = stats.key_regex.search(key)
+            stats.key_time_ns += clock() - started
+            if not matched:
+                continue
+
+            stats.key_matches += 1
+            if stats.value_regex is None:
+                stats.matched_keys.add(key)
+                continue
+            started = clock()
+            accepted = stats.value_regex.match(value_str)
+            stats.value_time_ns += clock() - started
+            if accepted:
+                stats.matched_keys.add(key)
+            else:
+                stats.value_rejections += 1
+                stats.rejected_keys.add(key)
+
+    def analyze_document(self, data: Any):
+        """JSON 문서 하나를 측정합니다."""
+        for key, value in iter_key_values(data):
+            self.observe(key, value)
+
+    def analyze_file(self, file_path: str):
+        """JSON 또는 NDJSON 파일 하나를 측정합니다 (NDJSON은 줄 단위 스트리밍)."""
+        self.files += 1
+        path = Path(file_path)
+        try:
+            if path.suffix.lower() in NDJSON_SUFFIXES:
+                with open(path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        if line.strip():
+                            self.analyze_document(json.loads(line))
+            else:
+                self.analyze_document(load_json_file(path))
+        except (OSError, ValueError) as e:
+            self.errors[file_path] = str(e)
+
+    def report(self) -> Dict[str, Any]:
+        """
+        측정 결과를 반환합니다.
+
+        Returns:
+            {'files', 'pairs', 'total_time_ms', 'patterns': [...], 'errors'}
+            patterns는 설정 파일 순서이며 각 항목에 일치 횟수, 거부율, 시간,
+            샘플 키 이름(중복 제거) 포함
+        """
+        total_ns = sum(s.key_time_ns + s.value_time_ns for s in self.stats) or 1
+        rows = []
+        for stats in self.stats:
+            time_ns = stats.key_time_ns + stats.value_time_ns
+            rows.append({
+                'type': stats.info_type,
+                'key_pattern': stats.key_regex.pattern,
+                'key_matches': stats.key_matches,
+                'value_rejections': stats.value_rejections,
+                'rejection_rate': round(
+                    stats.value_rejections / stats.key_matches, 4
+                ) if stats.key_matches else 0.0,
+                'time_ms': round(time_ns / 1e6, 3),
+                'time_share': round(time_ns / total_ns, 4),
+                'sample_matched_keys': sorted(set(stats.matched_keys.items)),
+                'sample_rejected_keys': sorted(set(stats.rejected_keys.items))
+            })
+        return {
+            'files': self.files,
+            'pairs': self.pairs,
+            'total_time_ms': round(total_ns / 1e6, 3) if self.stats else 0.0,
+            'patterns': rows,
+            'errors': self.errors
+        }
+
+    def report_csv(self) -> str:
+        """측정 결과를 키 패턴당 한 줄인 CSV 문자열로 반환합니다."""
+        columns = [
+            'type', 'key_pattern', 'key_matches', 'value_rejections',
+            'rejection_rate', 'time_ms', 'time_share', 'sample_rejected_keys'
+        ]
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow(columns)
+        for row in self.report()['patterns']:
+            row['sample_rejected_keys'] = ' '.join(row['sample_rejected_keys'])
+            writer.writerow([row[column] for column in columns])
+        return output.getvalue()
@@ -0,0 +1,77 @@
+"""HTTP 헤더 처리 정책 모듈
+
+헤더는 매핑 파일의 값 중 큰 비중을 차지하지만 대부분 개인정보가 없는 표준
+헤더입니다. 헤더 이름을 대소문자 구분 없이 분류하여 표준 헤더는 식별 과정을
+건너뛰고, 개인정보가 담기는 헤더는 전용 파서로 처리합니다.
+"""
+from typing import Iterable, Optional
+
+
+# 개인정보가 없는 표준 헤더 (식별을 건너뜀)
+DEFAULT_ALLOW_HEADERS = frozenset([
+    'accept', 'accept-charset', 'accept-encoding', 'accept-language',
+    'accept-ranges', 'access-control-allow-credentials',
+    'access-control-allow-headers', 'access-control-allow-methods',
+    'access-control-allow-origin', 'access-control-expose-headers',
+    'access-control-max-age', 'access-control-request-headers',
+    'access-control-request-method', 'age', 'allow', 'cache-control',
+    'connection', 'content-encoding', 'content-language', 'content-length',
+    'content-type', 'date', 'etag', 'expires', 'host', 'if-match',
+    'if-modified-since', 'if-none-match', 'keep-alive', 'last-modified',
+    'pragma', 'server', 'strict-transport-security', 'transfer-encoding',
+    'upgrade', 'vary', 'x-content-type-options', 'x-frame-options',
+    'x-request-id', 'x-correlation-id', 'x-xss-protection',
+])
+
+# 쿠키 형식(name=value; ...)으로 파싱하는 헤더
+COOKIE_HEADERS = frozenset(['cookie', 'set-cookie'])
+
+# 클라이언트 IP 목록(쉼표 구분)을 담는 헤더
+FORWARDED_HEADERS = frozenset([
+    'x-forwarded-for', 'x-real-ip', 'x-client-ip', 'true-client-ip',
+    'cf-connecting-ip', 'x-original-forwarded-for',
+])
+
+# 헤더 분류
+HEADER_ALLOW = 'allow'
+HEADER_DENY = 'deny'
+HEADER_COOKIE = 'cookie'
+HEADER_FORWARDED = 'forwarded'
+
+
+class HeaderPolicy:
+    """헤더 이름을 처리 방식별로 분류하는 클래스"""
+
+    def __init__(
+        self,
+        allow: Optional[Iterable[str]] = None,
+        deny: Optional[Iterable[str]] = None
+    ):
+        """
+        Args:
+            allow: 기본 목록에 추가로 식별을 건너뛸 헤더 이름
+            deny: 값 전체를 항상 치환할 헤더 이름 (allow보다 우선)
+        """
+        self.deny = frozenset(name.lower() for name in (deny or []))
+        self.allow = (
+            DEFAULT_ALLOW_HEADERS | frozenset(name.lower() for name in (allow or []))
+        ) - self.deny
+
+    def classify(self, name: str) -> Optional[str]:
+        """
+        헤더 이름의 처리 방식을 반환합니다.
+
+        Returns:
+            HEADER_ALLOW, HEADER_DENY, HEADER_COOKIE, HEADER_FORWARDED 중 하나,
+            일반 식별 대상이면 None
+        """
+        lowered = name.lower()
+        if lowered in self.allow:
+            return HEADER_ALLOW
+        if lowered in self.deny:
+            return HEADER_DENY
+        if lowered in COOKIE_HEADERS:
+            return HEADER_COOKIE
+        if lowered in FORWARDED_HEADERS:
+            return HEADER_FORWARDED
+        return None
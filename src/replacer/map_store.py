@@ -0,0 +1,351 @@
+"""치환 매핑 저장/불러오기 모듈
+
+치환 매핑을 팀 간에 공유하거나 감사용으로 보관하기 위한 파일 형식을 제공합니다.
+
+- JSON (.json): 사람이 읽을 수 있는 형식
+- 바이너리 (그 외 확장자): 유형별 열(column) 단위 문자열 테이블 형식.
+  ReplacementMapFile로 열면 파일을 메모리 매핑하여 헤더만 읽고, 각 항목은
+  조회할 때 오프셋으로 바로 읽습니다. load_replacement_map은 치환기에 넣을
+  dict를 만들기 위해 모든 항목을 디코딩하므로 비용이 항목 수에 비례합니다.
+
+바이너리 형식 (리틀 엔디언)::
+
+    magic 'DIDMAP01' | version u32 | type_count u32
+    type_count x (entry_count u32, section_offset u64, name_length u32, name bytes)
+    유형별 section:
+        originals 문자열 테이블 | replacements 문자열 테이블
+    문자열 테이블: (entry_count + 1) x offset u32 | UTF-8 blob
+
+각 유형의 항목은 원본 값 기준으로 정렬되어 있어 이진 탐색으로 조회합니다.
+"""
+import bisect
+import json
+import mmap
+import struct
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..json_io import write_bytes_atomic
+
+
+MAGIC = b'DIDMAP01'
+VERSION = 1
+
+_HEADER = struct.Struct('<8sII')
+_TYPE_ENTRY = struct.Struct('<IQI')
+_OFFSET = struct.Struct('<I')
+
+
+def _build_string_table(values: List[str]) -> bytes:
+    """문자열 목록을 오프셋 배열 + UTF-8 blob으로 직렬화합니다."""
+    encoded = [value.encode('utf-8') for value in values]
+    offsets = [0]
+    for item in encoded:
+        offsets.append(offsets[-1] + len(item))
+    return struct.pack(f'<{len(offsets)}I', *offsets) + b''.join(encoded)
+
+
+def _entries_by_type(
+    replacement_map: Dict[str, Dict[str, str]]
+) -> Dict[str, List[Tuple[str, str]]]:
+    """치환 매핑을 유형별 (원본, 치환값) 목록으로 정렬하여 나눕니다."""
+    grouped: Dict[str, List[Tuple[str, str]]] = {}
+    for entry in replacement_map.values():
+        grouped.setdefault(entry['type'], []).append(
+            (entry['original'], entry['replacement'])
+        )
+    for entries in grouped.values():
+        entries.sort()
+    return grouped
+
+
+def serialize_replacement_map(replacement_map: Dict[str, Dict[str, str]]) -> bytes:
+    """치환 매핑을 바이너리 형식으로 직렬화합니다."""
+    grouped = _entries_by_type(replacement_map)
+    type_names = sorted(grouped)
+
+    directory_size = sum(
+        _TYPE_ENTRY.size + len(name.encode('utf-8')) for name in type_names
+    )
+    offset = _HEADER.size + directory_size
+
+    directory = []
+    sections = []
+    for name in type_names:
+        entries = grouped[name]
+        section = (
+            _build_string_table([original for original, _ in entries])
+            + _build_string_table([replacement for _, replacement in entries])
+        )
+        encoded_name = name.encode('utf-8')
+        directory.append(
+            _TYPE_ENTRY.pack(len(entries), offset, len(encoded_name)) + encoded_name
+        )
+        sections.append(section)
+        offset += len(section)
+
+    return (
+        _HEADER.pack(MAGIC, VERSION, len(type_names))
+        + b''.join(directory)
+        + b''.join(sections)
+    )
+
+
+class _StringTable:
+    """매핑된 버퍼 위의 문자열 테이블 (필요한 항목만 디코딩)"""
+
+    def __init__(self, buffer: mmap.mmap, offset: int, count: int):
+        self.buffer = buffer
+        self.count = count
+        self.offsets_start = offset
+        self.blob_start = offset + (count + 1) * _OFFSET.size
+        if self.blob_start > len(buffer):
+            raise ValueError("문자열 테이블이 파일 범위를 벗어납니다")
+        self.end = self.blob_start + self._offset(count)
+        if self.end > len(buffer):
+            raise ValueError("문자열 테이블이 파일 범위를 벗어납니다")
+
+    def _offset(self, index: int) -> int:
+        return _OFFSET.unpack_from(self.buffer, self.offsets_start + index * _OFFSET.size)[0]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> str:
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        start = self.blob_start + self._offset(index)
+        end = self.blob_start + self._offset(index + 1)
+        if not self.blob_start <= start <= end <= self.end:
+            raise ValueError(f"손상된 문자열 테이블 오프셋: {index}")
+        return self.buffer[start:end].decode('utf-8')
+
+
+class ReplacementMapFile:
+    """메모리 매핑된 바이너리 치환 매핑 파일
+
+    열 때는 헤더와 유형 목록만 읽고 각 영역이 파일 범위 안에 있는지 확인하며,
+    각 항목은 접근할 때 디코딩합니다.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 바이너리 치환 매핑 파일 경로
+        """
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        try:
+            self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"치환 매핑 파일 형식이 아닙니다: {path}")
+
+        try:
+            self._tables = self._read_directory()
+        except (ValueError, struct.error) as e:
+            # 잘리거나 손상된 파일 (UnicodeDecodeError도 ValueError)
+            self.close()
+            raise ValueError(f"손상된 치환 매핑 파일입니다: {path} ({e})") from e
+
+    def _read_directory(self) -> Dict[str, Tuple[_StringTable, _StringTable]]:
+        """헤더와 유형 목록을 읽어 유형별 문자열 테이블을 만듭니다."""
+        if len(self._buffer) < _HEADER.size:
+            raise ValueError("헤더가 잘렸습니다")
+        magic, version, type_count = _HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC:
+            raise ValueError("치환 매핑 파일 형식이 아닙니다")
+        if version != VERSION:
+            raise ValueError(f"지원하지 않는 버전입니다: {version}")
+
+        tables: Dict[str, Tuple[_StringTable, _StringTable]] = {}
+        position = _HEADER.size
+        for _ in range(type_count):
+            count, section_offset, name_length = _TYPE_ENTRY.unpack_from(
+                self._buffer, position
+            )
+            position += _TYPE_ENTRY.size
+            if position + name_length > len(self._buffer):
+                raise ValueError("유형 목록이 잘렸습니다")
+            name = self._buffer[position:position + name_length].decode('utf-8')
+            position += name_length
+
+            originals = _StringTable(self._buffer, section_offset, count)
+            replacements = _StringTable(self._buffer, originals.end, count)
+            tables[name] = (originals, replacements)
+        return tables
+
+    def close(self):
+        """매핑과 파일을 닫습니다."""
+        self._buffer.close()
+        self._file.close()
+
+    def __enter__(self) -> 'ReplacementMapFile':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def types(self) -> List[str]:
+        """저장된 개인정보 유형 목록"""
+        return list(self._tables)
+
+    def __len__(self) -> int:
+        return sum(len(originals) for originals, _ in self._tables.values())
+
+    def lookup(self, info_type: str, original: str) -> Optional[str]:
+        """
+        원본 값의 치환값을 이진 탐색으로 조회합니다.
+
+        Returns:
+            치환값, 없으면 None
+        """
+        tables = self._tables.get(info_type)
+        if tables is None:
+            return None
+        originals, replacements = tables
+        index = bisect.bisect_left(originals, original)
+        if index < len(originals) and originals[index] == original:
+            return replacements[index]
+        return None
+
+    def entries(self) -> Iterator[Dict[str, str]]:
+        """모든 항목을 {'type', 'original', 'replacement'} 형태로 반환합니다."""
+        for info_type, (originals, replacements) in self._tables.items():
+            for index in range(len(originals)):
+                yield {
+                    'type': info_type,
+                    'original': originals[index],
+                    'replacement': replacements[index]
+                }
+
+    def to_replacement_map(self) -> Dict[str, Dict[str, str]]:
+        """PersonalInfoReplacer의 치환 매핑 형식으로 변환합니다."""
+        return {
+            f"{entry['type']}:{entry['original']}": entry
+            for entry in self.entries()
+        }
+
+
+def export_replacement_map(
+    replacement_map: Dict[str, Dict[str, str]],
+    path: str
+):
+    """
+    치환 매핑을 파일로 저장합니다 (.json이면 JSON, 그 외는 바이너리).
+
+    Args:
+        replacement_map: 치환 매핑 ({'type:original': {...}})
+        path: 저장할 파일 경로
+    """
+    output = Path(path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    if output.suffix.lower() == '.json':
+        # 입력 매핑의 순서와 무관하게 같은 파일이 되도록 (유형, 원본) 순으로 정렬
+        data = json.dumps(
+            sorted(
+                replacement_map.values(),
+                key=lambda entry: (entry['type'], entry['original'])
+            ),
+            ensure_ascii=False,
+            indent=2
+        ).encode('utf-8')
+    else:
+        data = serialize_replacement_map(replacement_map)
+    write_bytes_atomic(data, output)
+
+
+def load_replacement_map(path: str) -> Dict[str, Dict[str, str]]:
+    """
+    파일에서 치환 매핑을 불러옵니다 (.json이면 JSON, 그 외는 바이너리).
+
+    바이너리 파일도 모든 항목을 디코딩하여 dict로 만듭니다. 일부 항목만
+    조회할 때는 ReplacementMapFile을 직접 사용하세요.
+
+    Args:
+        path: 치환 매핑 파일 경로
+
+    Returns:
+        치환 매핑 ({'type:original': {...}})
+
+    Raises:
+        ValueError: 바이너리 파일이 잘렸거나 손상된 경우
+    """
+    source = Path(path)
+    if not source.exists():
+        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {path}")
+
+    if source.suffix.lower() == '.json':
+        with open(source, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+        if isinstance(entries, dict):
+            entries = list(entries.values())
+        return {
+            f"{entry['type']}:{entry['original']}": {
+                'type': entry['type'],
+                'original': entry['original'],
+                'replacement': entry['replacement']
+            }
+            for entry in entries
+        }
+
+    with ReplacementMapFile(str(source)) as map_file:
+        return map_file.to_replacement_map()
+
+
+def merge_replacement_maps(
+    replacement_maps: Iterable[Dict[str, Dict[str, str]]]
+) -> Tuple[Dict[str, Dict[str, str]], List[Dict[str, str]]]:
+    """
+    샤드별 치환 매핑을 하나로 합치고 충돌을 찾습니다.
+
+    치환값은 원본 값의 해시로만 결정되므로 같은 원본은 모든 샤드에서 같은 치환값을
+    가집니다. 합칠 때 다음 두 가지 충돌을 보고합니다.
+
+    - replacement: 같은 원본이 샤드마다 다른 치환값을 가짐 (샤드마다 다른 매핑을
+      불러온 경우 등). 먼저 나온 항목을 유지하며, 나중 값은 dropped로 보고합니다.
+    - duplicate: 같은 유형의 서로 다른 원본이 같은 치환값을 가짐 (해시 충돌).
+      샤드 출력에 이미 쓰인 값이므로 두 항목을 모두 유지하고 보고만 합니다.
+
+    Args:
+        replacement_maps: 합칠 치환 매핑 목록 (앞에 있을수록 우선)
+
+    Returns:
+        (합친 치환 매핑, 충돌 목록)
+    """
+    merged: Dict[str, Dict[str, str]] = {}
+    owners: Dict[Tuple[str, str], str] = {}
+    conflicts: List[Dict[str, str]] = []
+
+    for replacement_map in replacement_maps:
+        for key, entry in replacement_map.items():
+            existing = merged.get(key)
+            if existing is not None:
+                if existing['replacement'] != entry['replacement']:
+                    conflicts.append({
+                        'kind': 'replacement',
+                        'type': entry['type'],
+                        'original': entry['original'],
+                        'kept': existing['replacement'],
+                        'dropped': entry['replacement']
+                    })
+                continue
+
+            owner = owners.setdefault((entry['type'], entry['replacement']), key)
+            if owner != key:
+                conflicts.append({
+                    'kind': 'duplicate',
+                    'type': entry['type'],
+                    'original': entry['original'],
+                    'replacement': entry['replacement'],
+                    'other_original': merged[owner]['original']
+                })
+
+            merged[key] = {
+                'type': entry['type'],
+                'original': entry['original'],
+                'replacement': entry['replacement']
+            }
+
+    return merged, conflicts
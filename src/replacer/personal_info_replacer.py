@@ -1,13 +1,75 @@
 """개인정보 치환 모듈"""
 import json
 import hashlib
-import random
-from typing import Dict, List, Any, Optional, Tuple
+import ipaddress
+import threading
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Callable, Optional, Tuple, Iterator, Iterable, TextIO
 from pathlib import Path
-from urllib.parse import urlparse, parse_qs, urlencode, urlunparse, quote, unquote
+from urllib.parse import quote, unquote, unquote_plus
 
 from ..identifier.personal_info_identifier import PersonalInfoIdentifier
 from ..generator.virtual_data_generator import VirtualDataGenerator
+from .replacement_map import ShardedReplacementMap
+from .subtree_memo import SubtreeMemo
+from .url_tokenizer import PathTemplate, split_url, iter_query_params
+from .wiremock_traversal import WireMockStubTraverser, is_wiremock_stub
+from .header_policy import (
+    HeaderPolicy,
+    HEADER_ALLOW,
+    HEADER_DENY,
+    HEADER_COOKIE,
+    HEADER_FORWARDED,
+)
+from ..tolerant_json import (
+    parse_tolerant,
+    iter_scalar_pairs,
+    FIX_ENCODING,
+    FIX_TEXT_FALLBACK,
+)
+from ..json_io import (
+    load_json_file,
+    dump_json_file,
+    serialize_json,
+    write_bytes_atomic,
+    create_temp_file,
+    commit_temp_file,
+    DurableWriteBatch,
+    DEFAULT_MMAP_THRESHOLD,
+    DEFAULT_WRITE_BUFFER_SIZE,
+    DURABILITY_NONE,
+    DURABILITY_MODES,
+)
+
+
+# 문자열로 직렬화된 JSON(embedded JSON)으로 파싱을 시도할 최대 길이
+DEFAULT_EMBEDDED_JSON_MAX_SIZE = 1024 * 1024
+
+# embedded JSON 치환 결과 캐시 크기 (항목 수)
+EMBEDDED_JSON_CACHE_SIZE = 4096
+
+# 하위 트리 메모에 저장할 최소 크기 (직렬화된 길이, 작은 객체는 다시 순회하는 편이 빠름)
+SUBTREE_MEMO_MIN_SIZE = 256
+
+# 하위 트리 메모를 조회할 최대 중첩 깊이. 메모 키를 만들 때마다 하위 트리 전체를
+# 직렬화하므로, 깊이를 제한하여 전체 직렬화 비용을 문서 크기의 상수 배로 묶음
+SUBTREE_MEMO_MAX_DEPTH = 3
+
+# 값이 '?'를 포함하지 않아도 URL로 취급할 키 이름
+URL_KEYS = frozenset(['url', 'uri', 'endpoint', 'urlpath'])
+
+# 인덱스 기반으로 생성하는 유형의 접두어와 인덱스 공간
+# (원본 수가 많아도 서로 다른 원본이 같은 인덱스를 받을 확률이 낮도록 넓게 잡음)
+INDEXED_REPLACEMENT_PREFIXES = {
+    'name': '테스트개인',
+    'company_name': '테스트법인',
+}
+INDEXED_REPLACEMENT_SPACE = 10 ** 8
+
+# 치환값이 다른 원본과 겹칠 때 재해시하여 다시 생성하는 최대 횟수
+# (이 횟수 안에 빈 값을 찾지 못하면 유형의 값 공간이 소진된 것으로 보고 오류)
+REPLACEMENT_MAX_ATTEMPTS = 1000
 
 
 class PersonalInfoReplacer:
@@ -16,17 +78,78 @@ class PersonalInfoReplacer:
     def __init__(
         self,
         identifier: PersonalInfoIdentifier,
-        generator: VirtualDataGenerator
+        generator: VirtualDataGenerator,
+        mmap_threshold: Optional[int] = DEFAULT_MMAP_THRESHOLD,
+        write_buffer_size: int = DEFAULT_WRITE_BUFFER_SIZE,
+        durability: str = DURABILITY_NONE,
+        embedded_json_max_size: int = DEFAULT_EMBEDDED_JSON_MAX_SIZE,
+        scan_text: bool = False,
+        path_templates: Optional[List[str]] = None,
+        wiremock_aware: bool = True,
+        header_policy: Optional[HeaderPolicy] = None,
+        subtree_memo_size: int = 0
     ):
         """
         Args:
             identifier: 개인정보 식별자
             generator: 가상 데이터 생성기
+            mmap_threshold: 메모리 매핑으로 읽을 최소 파일 크기 (None이면 사용 안 함)
+            write_buffer_size: 스트리밍 출력(NDJSON) 쓰기 버퍼 크기 (바이트)
+            durability: 출력 내구성 모드 (none, file, batch)
+            embedded_json_max_size: 문자열 안의 JSON을 파싱하여 치환할 최대 길이
+                (0이면 사용 안 함)
+            scan_text: 키로 식별되지 않은 문자열 내부에서도 개인정보를 검색하여
+                부분 치환할지 여부
+            path_templates: 경로 세그먼트의 개인정보를 치환할 경로 템플릿 목록
+                (예: '/api/user/{phone}')
+            wiremock_aware: WireMock 스텁 구조(request matcher 등)를 인식하여 치환할지 여부
+            header_policy: 헤더 이름별 처리 정책 (None이면 기본 정책)
+            subtree_memo_size: 반복되는 하위 객체의 치환 결과를 재사용할 메모의
+                최대 크기 (직렬화된 길이의 합, 0이면 사용 안 함)
         """
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"지원하지 않는 내구성 모드입니다: {durability}")
+        
         self.identifier = identifier
         self.generator = generator
+        self.mmap_threshold = mmap_threshold
+        self.write_buffer_size = write_buffer_size
+        self.durability = durability
+        self.scan_text = scan_text
+        self.path_templates = [
+            PathTemplate(template) for template in (path_templates or [])
+        ]
+        self.wiremock_aware = wiremock_aware
+        self.header_policy = header_policy or HeaderPolicy()
+        self._wiremock = WireMockStubTraverser(self)
+        # batch 모드에서 fsync를 미뤄둔 출력 파일
+        self.durable_batch = DurableWriteBatch()
         # 일관성을 위한 매핑 테이블 (원본 값 -> 가상 값)
-        self.replacement_map: Dict[str, Dict[str, str]] = {}
+        # 키 해시로 나눈 shard마다 락을 두어 여러 스레드가 동시에 생성할 수 있음
+        self.replacement_map = ShardedReplacementMap()
+        # 충돌 검사용 유형별 치환값 -> 그 치환값을 쓰는 원본 수
+        # (매핑 테이블의 문자열을 그대로 참조)
+        self._used_replacements: Dict[str, Dict[str, int]] = {}
+        # 유형별 충돌 통계
+        # (rehashed: 첫 치환값이 겹쳐 재해시한 원본 수,
+        #  duplicates: 불러온 매핑에서 다른 원본과 치환값이 겹친 원본 수)
+        self.collision_stats: Dict[str, Dict[str, int]] = {}
+        # 새로 만든 치환 항목 기록 (체크포인트용, None이면 기록하지 않음)
+        self._new_entries: Optional[List[Dict[str, str]]] = None
+        # 사용 중인 치환값 집합, 충돌 통계, 새 항목 기록을 보호하는 락
+        self._used_lock = threading.Lock()
+        # embedded JSON 문자열 -> 치환된 문자열 (JSON이 아니면 None)
+        self.embedded_json_max_size = embedded_json_max_size
+        self._embedded_json_cache: OrderedDict = OrderedDict()
+        self._embedded_json_lock = threading.Lock()
+        # 하위 트리 구조 해시 -> 치환된 하위 트리 (None이면 사용 안 함)
+        self.subtree_memo = SubtreeMemo(subtree_memo_size) if subtree_memo_size > 0 else None
+        # 감사 인덱스용으로 사용된 치환 키를 기록하는 집합 (None이면 기록하지 않음)
+        self._touched: Optional[set] = None
+        # 캐시 항목별 사용 키를 모으기 위한 스레드별 기록 스택
+        self._touch_local = threading.local()
+        # 스레드별 하위 트리 메모 중첩 깊이
+        self._memo_local = threading.local()
     
     def _get_replacement_key(self, info_type: str, original_value: str) -> str:
         """치환 키를 생성합니다 (일관성 유지용)."""
@@ -48,42 +171,221 @@ class PersonalInfoReplacer:
             치환된 가상 값
         """
         replacement_key = self._get_replacement_key(info_type, original_value)
+        if self._touched is not None:
+            self._record_touches((replacement_key,))
+        
+        existing = self.replacement_map.get(replacement_key)
+        if existing is not None:
+            return existing['replacement']
         
-        if replacement_key not in self.replacement_map:
-            # 새로운 치환값 생성
-            # 타입별로 일관된 생성 (같은 타입, 같은 원본값은 같은 치환값)
-            # 해시 기반 생성으로 일관성 보장
-            hash_value = int(
-                hashlib.md5(replacement_key.encode()).hexdigest()[:8],
-                16
+        entry = self.replacement_map.get_or_create(
+            replacement_key,
+            lambda: self._create_entry(replacement_key, info_type, original_value)
+        )
+        return entry['replacement']
+    
+    def _record_touches(self, keys: Iterable[str]):
+        """사용된 치환 키를 기록합니다 (진행 중인 캐시 항목 기록에도 반영)."""
+        touched = self._touched
+        if touched is None:
+            return
+        touched.update(keys)
+        captures = getattr(self._touch_local, 'captures', None)
+        if captures:
+            captures[-1].update(keys)
+    
+    def _begin_touch_capture(self):
+        """이후 사용되는 치환 키를 별도로 모으기 시작합니다 (중첩 가능)."""
+        captures = getattr(self._touch_local, 'captures', None)
+        if captures is None:
+            captures = self._touch_local.captures = []
+        captures.append(set())
+    
+    def _end_touch_capture(self) -> frozenset:
+        """모은 치환 키를 반환하고, 바깥 기록이 있으면 그쪽에도 합칩니다."""
+        captures = self._touch_local.captures
+        keys = captures.pop()
+        if captures:
+            captures[-1].update(keys)
+        return frozenset(keys)
+    
+    def start_touch_tracking(self):
+        """사용된 치환 키 기록을 시작합니다 (파일별 감사 기록용)."""
+        self._touched = set()
+    
+    def stop_touch_tracking(self) -> List[Dict[str, str]]:
+        """
+        기록을 멈추고 그동안 사용된 치환 항목을 반환합니다.
+        
+        Returns:
+            {'type', 'original', 'replacement'} 항목 리스트
+        """
+        touched, self._touched = self._touched or set(), None
+        return [
+            self.replacement_map[key]
+            for key in touched
+            if key in self.replacement_map
+        ]
+    
+    def start_new_entry_log(self):
+        """새로 만든 치환 항목 기록을 시작합니다 (체크포인트용)."""
+        with self._used_lock:
+            self._new_entries = []
+    
+    def take_new_entries(self) -> List[Dict[str, str]]:
+        """
+        마지막 호출 이후 새로 만든 치환 항목을 반환하고 기록을 비웁니다.
+        
+        Returns:
+            {'type', 'original', 'replacement'} 항목 리스트
+        """
+        with self._used_lock:
+            if self._new_entries is None:
+                return []
+            entries, self._new_entries = self._new_entries, []
+            return entries
+    
+    def stop_new_entry_log(self):
+        """새로 만든 치환 항목 기록을 멈춥니다."""
+        with self._used_lock:
+            self._new_entries = None
+    
+    def _create_entry(
+        self,
+        replacement_key: str,
+        info_type: str,
+        original_value: str
+    ) -> Dict[str, str]:
+        """
+        새 치환 항목을 만듭니다 (키의 shard 락을 잡은 상태에서 호출됨).
+        
+        첫 치환값은 치환 키의 해시로만 결정되므로 처리 순서와 무관합니다. 이미 다른
+        원본이 쓰는 값이면 시도 번호를 붙인 해시로 다시 생성하여 (결정적 재해시)
+        유형 안에서 치환값이 겹치지 않게 합니다. 값 생성은 락 밖에서 하고,
+        빈 값인지 확인하여 차지하는 것만 락 안에서 수행합니다.
+        
+        Raises:
+            RuntimeError: REPLACEMENT_MAX_ATTEMPTS번 안에 빈 치환값을 찾지 못한 경우
+        """
+        for attempt in range(REPLACEMENT_MAX_ATTEMPTS):
+            replacement = self._generate_replacement(
+                replacement_key,
+                info_type,
+                original_value,
+                attempt
             )
-            
-            # 타입별 생성기 호출
-            if info_type == 'name':
-                # 해시 기반으로 일관된 인덱스 생성
-                index = (hash_value % 10000) + 1
-                replacement = f"테스트개인{index}"
-            elif info_type == 'company_name':
-                # 해시 기반으로 일관된 인덱스 생성
-                index = (hash_value % 10000) + 1
-                replacement = f"테스트법인{index}"
-            else:
-                # 다른 타입들은 해시 기반으로 일관된 값 생성
-                random.seed(hash_value)
-                replacement = self.generator.generate(info_type, original_value)
-                random.seed()  # 시드 초기화
-            
-            self.replacement_map[replacement_key] = {
-                'type': info_type,
-                'original': original_value,
-                'replacement': replacement
-            }
+            with self._used_lock:
+                used = self._used_replacements.setdefault(info_type, {})
+                if replacement in used:
+                    continue
+                used[replacement] = 1
+                if attempt:
+                    stats = self._stats_for(info_type)
+                    stats['rehashed'] += 1
+                entry = {
+                    'type': info_type,
+                    'original': original_value,
+                    'replacement': replacement
+                }
+                if self._new_entries is not None:
+                    self._new_entries.append(entry)
+                return entry
+        raise RuntimeError(
+            f"'{info_type}' 유형의 치환값 공간이 소진되었습니다: "
+            f"{REPLACEMENT_MAX_ATTEMPTS}번 재해시해도 다른 원본과 겹치지 않는 값을 "
+            f"만들지 못했습니다 (사용 중인 값 {len(self._used_replacements[info_type])}개)"
+        )
+    
+    def _stats_for(self, info_type: str) -> Dict[str, int]:
+        """유형의 충돌 통계를 반환합니다 (_used_lock 안에서 호출)."""
+        return self.collision_stats.setdefault(info_type, {'rehashed': 0, 'duplicates': 0})
+    
+    def _register_replacement(self, info_type: str, replacement: str):
+        """불러온 치환값 사용을 기록하고 겹치면 충돌 수를 늘립니다 (_used_lock 안에서 호출)."""
+        used = self._used_replacements.setdefault(info_type, {})
+        count = used.get(replacement, 0)
+        used[replacement] = count + 1
+        if count:
+            self._stats_for(info_type)['duplicates'] += 1
+    
+    def _unregister_replacement(self, info_type: str, replacement: str):
+        """치환값 사용 기록을 하나 지웁니다 (_used_lock 안에서 호출)."""
+        used = self._used_replacements.get(info_type, {})
+        count = used.get(replacement, 0)
+        if count <= 1:
+            used.pop(replacement, None)
+            return
+        used[replacement] = count - 1
+        self.collision_stats[info_type]['duplicates'] -= 1
+    
+    def _generate_replacement(
+        self,
+        replacement_key: str,
+        info_type: str,
+        original_value: str,
+        attempt: int = 0
+    ) -> str:
+        """
+        치환 키의 해시로 치환값을 결정적으로 생성합니다.
         
-        return self.replacement_map[replacement_key]['replacement']
+        Args:
+            replacement_key: 치환 키
+            info_type: 개인정보 유형
+            original_value: 원본 값
+            attempt: 재해시 시도 번호 (0이면 치환 키만 해시)
+        
+        Returns:
+            생성된 치환값
+        """
+        # 타입별로 일관된 생성 (같은 타입, 같은 원본값은 같은 치환값)
+        # 해시 기반 생성으로 일관성 보장
+        hash_input = replacement_key if attempt == 0 else f"{replacement_key}\0{attempt}"
+        digest = hashlib.md5(hash_input.encode()).hexdigest()
+        
+        prefix = INDEXED_REPLACEMENT_PREFIXES.get(info_type)
+        if prefix is not None:
+            # 해시 기반으로 일관된 인덱스 생성
+            index = int(digest, 16) % INDEXED_REPLACEMENT_SPACE + 1
+            return f"{prefix}{index}"
+        
+        # 다른 타입들은 해시 기반으로 일관된 값 생성 (스레드별 난수 생성기 사용)
+        self.generator.seed(int(digest, 16))
+        return self.generator.generate(info_type, original_value)
+    
+    def _replace_url_component(
+        self,
+        raw: str,
+        key: str,
+        plus_as_space: bool
+    ) -> Optional[str]:
+        """
+        URL의 query 값 또는 경로 세그먼트 하나를 decode하여 개인정보를 치환합니다.
+        
+        Args:
+            raw: 인코딩된 원본 구간
+            key: 식별에 사용할 키 (파라미터 이름 또는 템플릿 필드명)
+            plus_as_space: '+'를 공백으로 해석할지 여부 (query string)
+        
+        Returns:
+            인코딩된 치환값, 개인정보가 아니면 None
+        """
+        decoded = unquote_plus(raw) if plus_as_space else unquote(raw)
+        identified = self.identifier.identify_in_value(decoded, key)
+        if not identified:
+            return None
+        replacement = self._get_or_create_replacement(
+            identified['type'],
+            identified['value']
+        )
+        return quote(replacement, safe='', encoding='utf-8')
     
     def _replace_in_url(self, url: str) -> Tuple[str, bool]:
         """
-        URL 문자열에서 query string의 개인정보를 치환합니다.
+        URL 문자열의 query string 및 경로 세그먼트에서 개인정보를 치환합니다.
+        
+        URL을 한 번 훑어 파라미터 값과 템플릿 필드의 위치만 찾아 검사하고,
+        치환값을 원본 문자열에 끼워 넣습니다. 치환하지 않은 파라미터의
+        순서와 인코딩('%20', '+' 등)은 원본 그대로 유지됩니다.
         
         Args:
             url: 치환할 URL 문자열
@@ -91,46 +393,44 @@ class PersonalInfoReplacer:
         Returns:
             (치환된 URL, 치환 여부) 튜플
         """
-        if not isinstance(url, str) or '?' not in url:
+        if not isinstance(url, str):
             return url, False
         
-        try:
-            parsed = urlparse(url)
-            # query string을 decode하여 파싱
-            decoded_query = unquote(parsed.query, encoding='utf-8')
-            query_params = parse_qs(decoded_query, keep_blank_values=True)
-            
-            replaced = False
-            new_query_params = {}
-            
-            for param_name, param_values in query_params.items():
-                new_values = []
-                for param_value in param_values:
-                    # 각 query parameter 값을 개인정보 식별 및 치환
-                    identified = self.identifier.identify_in_value(param_value, param_name)
-                    if identified:
-                        replacement = self._get_or_create_replacement(
-                            identified['type'],
-                            identified['value']
-                        )
-                        new_values.append(replacement)
-                        replaced = True
-                    else:
-                        new_values.append(param_value)
-                
-                new_query_params[param_name] = new_values
-            
-            if replaced:
-                # query string 재구성 (URL encoding)
-                new_query = urlencode(new_query_params, doseq=True)
-                new_parsed = parsed._replace(query=new_query)
-                new_url = urlunparse(new_parsed)
-                return new_url, True
-            
-            return url, False
-        except Exception:
-            # URL 파싱 실패 시 원본 반환
+        path_start, path_end, query_start, query_end = split_url(url)
+        spans = []
+        
+        # 경로 템플릿과 일치하는 경로 세그먼트
+        for template in self.path_templates:
+            fields = template.match(url, path_start, path_end)
+            if fields is None:
+                continue
+            for field_name, start, end in fields:
+                replacement = self._replace_url_component(
+                    url[start:end], field_name, plus_as_space=False
+                )
+                if replacement is not None:
+                    spans.append((start, end, replacement))
+            break
+        
+        # query string 파라미터 값
+        for raw_name, start, end in iter_query_params(url, query_start, query_end):
+            replacement = self._replace_url_component(
+                url[start:end], unquote_plus(raw_name), plus_as_space=True
+            )
+            if replacement is not None:
+                spans.append((start, end, replacement))
+        
+        if not spans:
             return url, False
+        
+        pieces = []
+        position = 0
+        for start, end, replacement in spans:
+            pieces.append(url[position:start])
+            pieces.append(replacement)
+            position = end
+        pieces.append(url[position:])
+        return ''.join(pieces), True
     
     def _replace_url_encoded_value(self, value: str, key: str = '') -> Tuple[str, bool]:
         """
@@ -169,6 +469,141 @@ class PersonalInfoReplacer:
         
         return value, False
     
+    @staticmethod
+    def _detect_json_style(text: str) -> Dict[str, Any]:
+        """원본 JSON 문자열의 직렬화 스타일(들여쓰기, 구분자, 이스케이프)을 추정합니다."""
+        style: Dict[str, Any] = {
+            'ensure_ascii': text.isascii() and '\\u' in text
+        }
+        newline = text.find('\n')
+        if newline != -1:
+            line = text[newline + 1:newline + 81]
+            indent = len(line) - len(line.lstrip(' '))
+            style['indent'] = indent or None
+            style['separators'] = (',', ': ')
+        elif '": ' in text or ', ' in text:
+            style['separators'] = (', ', ': ')
+        else:
+            style['separators'] = (',', ':')
+        return style
+    
+    def _replace_embedded_json(self, value: str) -> Optional[str]:
+        """
+        문자열로 직렬화된 JSON(예: WireMock의 body, equalToJson)을 치환합니다.
+        
+        첫 번째 공백 아닌 문자가 '{' 또는 '['이고 길이가 제한 이하인 경우에만
+        파싱을 시도하며, 같은 문자열은 캐시된 결과를 재사용합니다.
+        
+        Args:
+            value: 검사할 문자열
+        
+        Returns:
+            JSON 문자열이면 치환된 문자열 (치환할 것이 없으면 원본 그대로),
+            JSON이 아니면 None
+        """
+        if len(value) > self.embedded_json_max_size:
+            return None
+        stripped = value.lstrip()
+        if not stripped or stripped[0] not in '{[':
+            return None
+        
+        # 감사 기록 중이면 캐시 항목에 사용된 치환 키도 함께 저장하여
+        # 캐시 적중 시에도 파일별 기록이 빠지지 않게 함
+        tracking = self._touched is not None
+        with self._embedded_json_lock:
+            cached = self._embedded_json_cache.get(value)
+            if cached is not None and tracking and cached[1] is None:
+                # 기록 없이 캐시된 항목은 다시 처리
+                cached = None
+            if cached is not None:
+                self._embedded_json_cache.move_to_end(value)
+        if cached is not None:
+            result, keys = cached
+            if keys:
+                self._record_touches(keys)
+            return result
+        
+        if tracking:
+            self._begin_touch_capture()
+        try:
+            parsed = json.loads(value)
+        except ValueError:
+            result = None
+        else:
+            if isinstance(parsed, dict):
+                replaced = self._replace_in_dict(parsed)
+            else:
+                replaced = self._replace_in_list(parsed, '')
+            
+            if replaced == parsed:
+                result = value
+            else:
+                result = json.dumps(
+                    replaced,
+                    **self._detect_json_style(value)
+                )
+        finally:
+            keys = self._end_touch_capture() if tracking else None
+        
+        with self._embedded_json_lock:
+            self._embedded_json_cache[value] = (result, keys)
+            if len(self._embedded_json_cache) > EMBEDDED_JSON_CACHE_SIZE:
+                self._embedded_json_cache.popitem(last=False)
+        return result
+    
+    def _replace_in_text(self, text: str) -> Tuple[str, bool]:
+        """
+        문자열 내부에 포함된 개인정보를 찾아 그 부분만 치환합니다.
+        
+        Args:
+            text: 검사할 문자열
+        
+        Returns:
+            (치환된 문자열, 치환 여부) 튜플
+        """
+        matches = self.identifier.find_in_text(text)
+        if not matches:
+            return text, False
+        
+        pieces = []
+        position = 0
+        for match in matches:
+            pieces.append(text[position:match['start']])
+            pieces.append(
+                self._get_or_create_replacement(match['type'], match['value'])
+            )
+            position = match['end']
+        pieces.append(text[position:])
+        return ''.join(pieces), True
+    
+    def _replace_in_malformed_text(self, text: str) -> str:
+        """
+        파싱할 수 없는 JSON 텍스트에서 개인정보를 치환합니다.
+        
+        ``"키": 값`` 쌍(따옴표 없는 숫자 포함)은 키 기반으로 식별하여 값만 치환하고,
+        그 밖의 텍스트는 text_pattern으로 검색하여 부분 치환합니다.
+        
+        Args:
+            text: JSON 형식이 깨진 텍스트
+        
+        Returns:
+            치환된 텍스트
+        """
+        pieces = []
+        position = 0
+        for key, value, start, end, quoted in iter_scalar_pairs(text):
+            replaced, replaced_flag = self._replace_in_value(value, key)
+            if not replaced_flag or not isinstance(replaced, str):
+                continue
+            pieces.append(self._replace_in_text(text[position:start])[0])
+            # 따옴표 안의 값은 이스케이프한 내용만 넣고, 따옴표 없는 값은 파싱한 경우와
+            # 같도록 JSON 문자열로 바꿔 넣음
+            encoded = json.dumps(replaced, ensure_ascii=False)
+            pieces.append(encoded[1:-1] if quoted else encoded)
+            position = end
+        pieces.append(self._replace_in_text(text[position:])[0])
+        return ''.join(pieces)
+    
     def _replace_in_value(
         self,
         value: Any,
@@ -184,8 +619,19 @@ class PersonalInfoReplacer:
         Returns:
             (치환된 값, 치환 여부) 튜플
         """
+        # 문자열로 직렬화된 JSON 처리
+        if isinstance(value, str) and self.embedded_json_max_size:
+            replaced_json = self._replace_embedded_json(value)
+            if replaced_json is not None:
+                # 캐시 적중 시 반환값은 처음 캐시한 문자열이므로 동일성이 아닌 값으로 비교
+                return replaced_json, replaced_json != value
+        
         # URL query string 처리 (url 키이거나 URL 패턴인 경우) - 먼저 처리
-        if isinstance(value, str) and ('?' in value or key.lower() in ['url', 'uri', 'endpoint']):
+        if isinstance(value, str) and (
+            '?' in value
+            or key.lower() in URL_KEYS
+            or (self.path_templates and value[:1] == '/')
+        ):
             replaced_url, url_replaced = self._replace_in_url(value)
             if url_replaced:
                 return replaced_url, True
@@ -204,8 +650,84 @@ class PersonalInfoReplacer:
                 identified['value']
             )
             return replacement, True
+        
+        # 문자열 내부 개인정보 검색 (선택사항)
+        if self.scan_text and isinstance(value, str):
+            return self._replace_in_text(value)
         return value, False
     
+    def _replace_cookie_header(self, value: str) -> str:
+        """
+        Cookie/Set-Cookie 헤더의 각 쿠키 값을 쿠키 이름을 키로 하여 치환합니다.
+        
+        Set-Cookie의 Path, Expires 같은 속성도 'name=value' 형식이지만
+        개인정보 키 패턴과 일치하지 않으므로 그대로 유지됩니다.
+        """
+        pieces = []
+        changed = False
+        for part in value.split(';'):
+            name, sep, cookie_value = part.partition('=')
+            if sep:
+                replaced, replaced_flag = self._replace_in_value(
+                    cookie_value.strip(), name.strip()
+                )
+                if replaced_flag:
+                    leading = cookie_value[:len(cookie_value) - len(cookie_value.lstrip())]
+                    part = f"{name}={leading}{replaced}"
+                    changed = True
+            pieces.append(part)
+        return ';'.join(pieces) if changed else value
+    
+    def _replace_forwarded_header(self, value: str) -> str:
+        """X-Forwarded-For 등 쉼표로 구분된 클라이언트 IP 목록을 치환합니다."""
+        pieces = []
+        for part in value.split(','):
+            address = part.strip()
+            try:
+                ipaddress.ip_address(address)
+            except ValueError:
+                pieces.append(part)
+                continue
+            leading = part[:len(part) - len(part.lstrip())]
+            pieces.append(
+                leading + self._get_or_create_replacement('ip_address', address)
+            )
+        return ','.join(pieces)
+    
+    def _replace_header_value(self, value: Any, name: str) -> Any:
+        """
+        헤더 값 하나를 헤더 이름에 따른 정책으로 치환합니다.
+        
+        Args:
+            value: 헤더 값 (문자열 또는 문자열 리스트)
+            name: 헤더 이름
+        
+        Returns:
+            치환된 헤더 값
+        """
+        if isinstance(value, list):
+            return [self._replace_header_value(item, name) for item in value]
+        
+        kind = self.header_policy.classify(name)
+        if kind == HEADER_ALLOW:
+            return value
+        if isinstance(value, str):
+            if kind == HEADER_COOKIE:
+                return self._replace_cookie_header(value)
+            if kind == HEADER_FORWARDED:
+                return self._replace_forwarded_header(value)
+            if kind == HEADER_DENY:
+                return self._get_or_create_replacement('header', value)
+        return self._replace_in_value(value, name)[0]
+    
+    def _replace_in_headers(self, headers: Dict[str, Any]) -> Dict[str, Any]:
+        """헤더 딕셔너리(이름 -> 값)를 헤더 정책에 따라 치환합니다."""
+        return {
+            name: self._replace_in_dict(value) if isinstance(value, dict)
+            else self._replace_header_value(value, name)
+            for name, value in headers.items()
+        }
+    
     def _replace_in_dict(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         딕셔너리에서 개인정보를 재귀적으로 치환합니다.
@@ -220,15 +742,15 @@ class PersonalInfoReplacer:
         
         for key, value in data.items():
             if isinstance(value, dict):
-                # 중첩된 딕셔너리인 경우 재귀 호출
-                result[key] = self._replace_in_dict(value)
+                if key.lower() == 'headers':
+                    # 헤더는 이름별 정책으로 빠르게 처리
+                    result[key] = self._replace_subtree(value, key, self._replace_in_headers)
+                else:
+                    # 중첩된 딕셔너리인 경우 재귀 호출
+                    result[key] = self._replace_subtree(value, key, self._replace_in_dict)
             elif isinstance(value, list):
                 # 리스트인 경우 각 항목 치환
-                result[key] = [
-                    self._replace_in_dict(item) if isinstance(item, dict)
-                    else self._replace_in_value(item, key)[0]
-                    for item in value
-                ]
+                result[key] = self._replace_in_list(value, key)
             else:
                 # 일반 값인 경우
                 replaced_value, _ = self._replace_in_value(value, key)
@@ -236,6 +758,133 @@ class PersonalInfoReplacer:
         
         return result
     
+    def _replace_subtree(
+        self,
+        data: Dict[str, Any],
+        key: str,
+        replace: Callable[[Dict[str, Any]], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        하위 딕셔너리를 치환하며, 같은 하위 트리의 이전 치환 결과가 있으면 재사용합니다.
+        
+        메모 키는 하위 트리의 직렬화 결과, 부모 키, 순회 방식(치환 함수 이름)의 해시이며,
+        치환값은 공유 매핑에 대해 결정적이므로 재사용한 결과는 다시 순회한 결과와 같습니다.
+        같은 키 아래의 같은 하위 트리라도 헤더 객체와 일반 객체는 다르게 치환되므로
+        순회 방식을 키에 포함합니다. 반환된
+        딕셔너리는 여러 문서에서 공유될 수 있으므로 수정하지 않아야 합니다.
+        
+        메모 키를 만들 때 하위 트리 전체를 직렬화하므로, 중첩 깊이가
+        SUBTREE_MEMO_MAX_DEPTH 이상인 하위 트리는 메모 없이 순회합니다. 그렇지 않으면
+        깊은 문서에서 같은 내용을 깊이마다 다시 직렬화하게 됩니다.
+        
+        Args:
+            data: 치환할 하위 딕셔너리
+            key: 부모 키
+            replace: 메모에 없을 때 사용할 치환 함수
+        
+        Returns:
+            치환된 딕셔너리
+        """
+        memo = self.subtree_memo
+        if memo is None:
+            return replace(data)
+        depth = getattr(self._memo_local, 'depth', 0)
+        if depth >= SUBTREE_MEMO_MAX_DEPTH:
+            return replace(data)
+        try:
+            serialized = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+        except (TypeError, ValueError):
+            return self._replace_nested_subtree(data, replace, depth)
+        if len(serialized) < SUBTREE_MEMO_MIN_SIZE:
+            return self._replace_nested_subtree(data, replace, depth)
+        
+        digest = hashlib.blake2b(
+            f"{replace.__name__}\0{key}\0{serialized}".encode('utf-8'),
+            digest_size=16
+        ).digest()
+        # 감사 기록 중이면 embedded JSON 캐시와 같이 사용된 치환 키도 함께 저장
+        tracking = self._touched is not None
+        cached = memo.get(digest)
+        if cached is not None and not (tracking and cached[1] is None):
+            result, keys = cached
+            if keys:
+                self._record_touches(keys)
+            return result
+        
+        if tracking:
+            self._begin_touch_capture()
+        try:
+            result = self._replace_nested_subtree(data, replace, depth)
+        finally:
+            keys = self._end_touch_capture() if tracking else None
+        memo.put(digest, (result, keys), len(serialized))
+        return result
+    
+    def _replace_nested_subtree(
+        self,
+        data: Dict[str, Any],
+        replace: Callable[[Dict[str, Any]], Dict[str, Any]],
+        depth: int
+    ) -> Dict[str, Any]:
+        """하위 트리 메모 중첩 깊이를 한 단계 늘린 상태로 치환합니다."""
+        self._memo_local.depth = depth + 1
+        try:
+            return replace(data)
+        finally:
+            self._memo_local.depth = depth
+    
+    def _replace_in_list(self, items: List[Any], key: str) -> List[Any]:
+        """
+        리스트의 각 항목에서 개인정보를 재귀적으로 치환합니다.
+        
+        Args:
+            items: 치환할 리스트
+            key: 리스트를 담고 있는 키 (값 식별에 사용)
+        
+        Returns:
+            치환된 리스트
+        """
+        return [
+            self._replace_subtree(item, key, self._replace_in_dict) if isinstance(item, dict)
+            else self._replace_in_list(item, key) if isinstance(item, list)
+            else self._replace_in_value(item, key)[0]
+            for item in items
+        ]
+    
+    def _replace_document(self, data: Any) -> Any:
+        """
+        JSON 문서 하나를 치환합니다.
+        
+        WireMock 스텁(또는 'mappings' 배열)이면 스텁 구조를 인식하여 치환하고,
+        그 외에는 일반 재귀 순회로 치환합니다.
+        
+        Args:
+            data: 치환할 JSON 데이터
+        
+        Returns:
+            치환된 JSON 데이터
+        """
+        if self.wiremock_aware and isinstance(data, dict):
+            if is_wiremock_stub(data):
+                return self._wiremock.replace_stub(data)
+            mappings = data.get('mappings')
+            if isinstance(mappings, list) and any(map(is_wiremock_stub, mappings)):
+                result = self._replace_in_dict(
+                    {k: v for k, v in data.items() if k != 'mappings'}
+                )
+                result['mappings'] = [
+                    self._wiremock.replace_stub(stub) if is_wiremock_stub(stub)
+                    else self._replace_document(stub)
+                    for stub in mappings
+                ]
+                return result
+        
+        if isinstance(data, dict):
+            return self._replace_in_dict(data)
+        if isinstance(data, list):
+            return self._replace_in_list(data, '')
+        return data
+    
     def replace_in_json_file(
         self,
         input_path: str,
@@ -255,27 +904,277 @@ class PersonalInfoReplacer:
         if not path.exists():
             raise FileNotFoundError(f"파일을 찾을 수 없습니다: {input_path}")
         
-        # JSON 파일 읽기
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # JSON 파일 읽기 (큰 파일은 메모리 매핑)
+        data = load_json_file(path, self.mmap_threshold)
         
         # 치환 수행
-        replaced_data = self._replace_in_dict(data)
+        replaced_data = self._replace_document(data)
         
         # 결과 저장
         output_file = Path(output_path) if output_path else path
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(replaced_data, f, ensure_ascii=False, indent=2)
+        dump_json_file(
+            replaced_data,
+            output_file,
+            self.durability,
+            self.durable_batch
+        )
         
         return replaced_data
     
+    def replace_in_json_file_tolerant(
+        self,
+        input_path: str,
+        output_path: Optional[str] = None
+    ) -> List[str]:
+        """
+        형식 오류가 있는 JSON 파일을 고쳐서 치환합니다.
+        
+        BOM, 주석, 끝의 쉼표, 이어 붙은 여러 문서를 고쳐 파싱하며 (여러 문서는
+        출력이 올바른 JSON이 되도록 하나의 배열로 출력), 고쳐도 파싱할 수 없거나
+        UTF-8이 아닌 파일은 텍스트에서 직접 개인정보를 찾아 치환합니다.
+        
+        Args:
+            input_path: 입력 JSON 파일 경로
+            output_path: 출력 파일 경로 (None이면 입력 파일 덮어쓰기)
+        
+        Returns:
+            고친 오류 분류 리스트 (텍스트로 치환했으면 'text_fallback' 포함)
+        """
+        path = Path(input_path)
+        if not path.exists():
+            raise FileNotFoundError(f"파일을 찾을 수 없습니다: {input_path}")
+        
+        raw = path.read_bytes()
+        fixes = []
+        documents = None
+        try:
+            text = raw.decode('utf-8')
+        except UnicodeDecodeError:
+            # 원본 바이트를 그대로 보존하여 텍스트로만 치환
+            text = raw.decode('utf-8', errors='surrogateescape')
+            fixes.append(FIX_ENCODING)
+        else:
+            try:
+                documents, parse_fixes = parse_tolerant(text)
+                fixes.extend(parse_fixes)
+            except ValueError:
+                documents = None
+        
+        if documents is not None:
+            replaced = [self._replace_document(document) for document in documents]
+            data = serialize_json(replaced[0] if len(replaced) == 1 else replaced)
+        else:
+            fixes.append(FIX_TEXT_FALLBACK)
+            data = self._replace_in_malformed_text(text).encode(
+                'utf-8', errors='surrogateescape'
+            )
+        
+        output_file = Path(output_path) if output_path else path
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        write_bytes_atomic(data, output_file, self.durability, self.durable_batch)
+        return fixes
+    
+    def _replace_ndjson_chunk(
+        self,
+        lines: List[str],
+        tolerant: bool = False
+    ) -> Tuple[str, Dict[str, int]]:
+        """
+        NDJSON 라인 묶음을 치환하여 출력 문자열로 반환합니다.
+        
+        Args:
+            lines: 한 줄에 하나의 JSON 레코드가 있는 라인 리스트
+            tolerant: 형식 오류가 있는 라인을 고치거나 텍스트로 치환할지 여부
+        
+        Returns:
+            (치환된 레코드들을 줄바꿈으로 이어붙인 문자열, 오류 분류별 라인 수)
+        """
+        output = []
+        fixes: Dict[str, int] = {}
+        for line in lines:
+            stripped = line.strip()
+            if not stripped:
+                continue
+            try:
+                records = [json.loads(stripped)]
+            except ValueError:
+                if not tolerant:
+                    raise
+                try:
+                    records, line_fixes = parse_tolerant(stripped)
+                except ValueError:
+                    records, line_fixes = None, [FIX_TEXT_FALLBACK]
+                for kind in line_fixes:
+                    fixes[kind] = fixes.get(kind, 0) + 1
+                if records is None:
+                    output.append(self._replace_in_malformed_text(stripped))
+                    output.append('\n')
+                    continue
+            for record in records:
+                output.append(json.dumps(self._replace_document(record), ensure_ascii=False))
+                output.append('\n')
+        return ''.join(output), fixes
+    
+    @staticmethod
+    def _iter_line_chunks(f: TextIO, chunk_size: int) -> Iterator[List[str]]:
+        """파일을 chunk_size 라인 단위로 나누어 반환합니다."""
+        chunk = []
+        for line in f:
+            chunk.append(line)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    
+    @staticmethod
+    def _write_ndjson_chunk(
+        dst: TextIO,
+        chunk_result: Tuple[str, Dict[str, int]],
+        stats: Dict[str, Any]
+    ):
+        """치환된 chunk를 기록하고 오류 분류별 라인 수를 통계에 더합니다."""
+        text, fixes = chunk_result
+        dst.write(text)
+        for kind, count in fixes.items():
+            stats['fixes'][kind] = stats['fixes'].get(kind, 0) + count
+    
+    def replace_in_ndjson_file(
+        self,
+        input_path: str,
+        output_path: Optional[str] = None,
+        workers: int = 1,
+        chunk_size: int = 1000,
+        tolerant: bool = False
+    ) -> Dict[str, Any]:
+        """
+        NDJSON(JSON Lines) 파일을 스트리밍으로 치환합니다.
+        
+        파일 전체를 메모리에 올리지 않고 chunk_size 라인씩 읽어 처리하며,
+        동시에 처리 중인 chunk 수를 workers * 2개로 제한하여 파일 크기와
+        무관하게 메모리 사용량을 일정하게 유지합니다. 출력 순서는 입력
+        순서와 같습니다.
+        
+        Args:
+            input_path: 입력 NDJSON 파일 경로
+            output_path: 출력 NDJSON 파일 경로 (None이면 입력 파일 덮어쓰기)
+            workers: chunk를 병렬 처리할 워커 수
+            chunk_size: 한 번에 처리할 라인 수
+            tolerant: 형식 오류가 있는 라인을 고치거나 텍스트로 치환할지 여부
+                (False면 오류 발생)
+        
+        Returns:
+            처리 통계 ({'records': 레코드 수, 'chunks': chunk 수,
+            'fixes': 오류 분류별 라인 수})
+        """
+        path = Path(input_path)
+        if not path.exists():
+            raise FileNotFoundError(f"파일을 찾을 수 없습니다: {input_path}")
+        
+        output_file = Path(output_path) if output_path else path
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        # 입력을 읽는 동안 같은 파일에 쓰지 않도록 임시 파일에 기록 후 교체
+        temp_file = create_temp_file(output_file)
+        
+        stats = {'records': 0, 'chunks': 0, 'fixes': {}}
+        max_pending = max(1, workers) * 2
+        
+        try:
+            with open(path, 'r', encoding='utf-8') as src, \
+                    open(temp_file, 'w', encoding='utf-8',
+                         buffering=self.write_buffer_size) as dst, \
+                    ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+                pending = deque()
+                for chunk in self._iter_line_chunks(src, max(1, chunk_size)):
+                    stats['records'] += sum(1 for line in chunk if line.strip())
+                    stats['chunks'] += 1
+                    pending.append(
+                        executor.submit(self._replace_ndjson_chunk, chunk, tolerant)
+                    )
+                    if len(pending) >= max_pending:
+                        self._write_ndjson_chunk(dst, pending.popleft().result(), stats)
+                while pending:
+                    self._write_ndjson_chunk(dst, pending.popleft().result(), stats)
+        except BaseException:
+            temp_file.unlink()
+            raise
+        
+        commit_temp_file(
+            temp_file,
+            output_file,
+            self.durability,
+            self.durable_batch
+        )
+        return stats
+    
+    def flush_durable_writes(self) -> int:
+        """
+        batch 내구성 모드에서 미뤄둔 fsync를 수행합니다.
+        
+        Returns:
+            디스크에 반영한 출력 파일 수
+        """
+        return self.durable_batch.flush()
+    
+    def get_collision_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        유형별 치환값 충돌 통계를 반환합니다.
+        
+        Returns:
+            {유형: {'rehashed': 첫 치환값이 겹쳐 재해시한 원본 수,
+                    'duplicates': 불러온 매핑에서 다른 원본과 치환값이 겹친 원본 수}}
+        """
+        with self._used_lock:
+            return {
+                info_type: dict(stats)
+                for info_type, stats in self.collision_stats.items()
+            }
+    
     def get_replacement_map(self) -> Dict[str, Dict[str, str]]:
-        """치환 매핑 테이블을 반환합니다."""
-        return self.replacement_map
+        """
+        치환 매핑 테이블의 스냅샷을 딕셔너리로 반환합니다.
+        
+        shard 순서는 프로세스마다 달라지는 hash()를 따르므로, 출력과 저장 결과가
+        실행마다 같도록 치환 키 순서로 정렬합니다.
+        """
+        return dict(sorted(self.replacement_map.items()))
+    
+    def load_replacement_map(self, replacement_map: Dict[str, Dict[str, str]]):
+        """
+        외부에서 불러온 치환 매핑을 현재 매핑 테이블에 병합합니다.
+        
+        이미 있는 원본 값은 불러온 치환값으로 덮어씁니다.
+        
+        Args:
+            replacement_map: 치환 매핑 ({'type:original': {...}})
+        """
+        for entry in replacement_map.values():
+            key = self._get_replacement_key(entry['type'], entry['original'])
+            previous = self.replacement_map.get(key)
+            self.replacement_map[key] = {
+                'type': entry['type'],
+                'original': entry['original'],
+                'replacement': entry['replacement']
+            }
+            with self._used_lock:
+                if previous is not None:
+                    # 덮어쓴 항목의 이전 치환값은 사용 기록에서 제거
+                    self._unregister_replacement(entry['type'], previous['replacement'])
+                self._register_replacement(entry['type'], entry['replacement'])
+        with self._embedded_json_lock:
+            self._embedded_json_cache.clear()
+        if self.subtree_memo is not None:
+            self.subtree_memo.clear()
     
     def clear_replacement_map(self):
         """치환 매핑 테이블을 초기화합니다."""
         self.replacement_map.clear()
-
+        with self._used_lock:
+            self._used_replacements.clear()
+            self.collision_stats.clear()
+        with self._embedded_json_lock:
+            self._embedded_json_cache.clear()
+        if self.subtree_memo is not None:
+            self.subtree_memo.clear()
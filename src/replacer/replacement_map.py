@@ -0,0 +1,90 @@
+"""스레드 안전 치환 매핑 모듈
+
+치환 매핑을 키 해시로 여러 shard에 나누고 shard마다 락을 두는(lock striping)
+딕셔너리입니다. 조회는 락 없이 수행하고, 새 치환값 생성만 해당 shard의 락을
+잡으므로 여러 스레드가 서로 다른 키를 동시에 생성할 수 있습니다.
+"""
+import threading
+from collections.abc import MutableMapping
+from typing import Any, Callable, Iterator
+
+
+# 기본 shard 수 (2의 거듭제곱)
+DEFAULT_SHARD_COUNT = 64
+
+
+class ShardedReplacementMap(MutableMapping):
+    """키('type:original')의 해시로 shard를 나눈 치환 매핑"""
+
+    def __init__(self, shard_count: int = DEFAULT_SHARD_COUNT):
+        """
+        Args:
+            shard_count: shard 수 (2의 거듭제곱으로 올림)
+        """
+        size = 1
+        while size < max(1, shard_count):
+            size <<= 1
+        self._mask = size - 1
+        self._shards = [{} for _ in range(size)]
+        self._locks = [threading.Lock() for _ in range(size)]
+
+    def _index(self, key: str) -> int:
+        return hash(key) & self._mask
+
+    def __getitem__(self, key: str) -> Any:
+        return self._shards[self._index(key)][key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._shards[self._index(key)].get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._shards[self._index(key)]
+
+    def __setitem__(self, key: str, value: Any):
+        index = self._index(key)
+        with self._locks[index]:
+            self._shards[index][key] = value
+
+    def __delitem__(self, key: str):
+        index = self._index(key)
+        with self._locks[index]:
+            del self._shards[index][key]
+
+    def __iter__(self) -> Iterator[str]:
+        for index, shard in enumerate(self._shards):
+            with self._locks[index]:
+                keys = list(shard)
+            yield from keys
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def get_or_create(self, key: str, factory: Callable[[], Any]) -> Any:
+        """
+        키의 값을 반환하고, 없으면 shard 락을 잡은 상태에서 factory로 만들어 저장합니다.
+
+        같은 키에 대해 factory는 한 번만 호출됩니다.
+
+        Args:
+            key: 치환 키
+            factory: 값을 만드는 함수
+
+        Returns:
+            저장된 값
+        """
+        index = self._index(key)
+        shard = self._shards[index]
+        value = shard.get(key)
+        if value is not None:
+            return value
+        with self._locks[index]:
+            value = shard.get(key)
+            if value is None:
+                value = factory()
+                shard[key] = value
+        return value
+
+    def clear(self):
+        for index, shard in enumerate(self._shards):
+            with self._locks[index]:
+                shard.clear()
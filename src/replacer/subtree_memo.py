@@ -0,0 +1,76 @@
+"""치환된 하위 트리 메모 모듈
+
+녹화된 응답에는 같은 객체(예: 같은 사용자 정보)가 수백 번 반복되는 경우가
+많습니다. 하위 트리의 구조 해시를 키로 치환 결과를 보관하여, 같은 하위 트리를
+다시 만나면 순회하지 않고 결과를 재사용합니다.
+
+메모리 사용량은 항목 수가 아니라 항목 크기(직렬화된 길이)의 합으로 제한하며,
+한도를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다.
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class SubtreeMemo:
+    """크기 가중치 기반 LRU 메모"""
+
+    def __init__(self, max_size: int):
+        """
+        Args:
+            max_size: 보관할 항목 크기 합의 최대값 (직렬화된 하위 트리 길이 기준)
+        """
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        저장된 값을 반환합니다 (최근 사용으로 표시).
+
+        Returns:
+            저장된 값, 없으면 None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, size: int):
+        """
+        값을 저장하고 크기 합이 한도를 넘으면 오래된 항목을 제거합니다.
+
+        한도보다 큰 항목은 저장하지 않습니다.
+
+        Args:
+            key: 하위 트리 해시
+            value: 저장할 값
+            size: 항목 크기 (직렬화된 하위 트리 길이)
+        """
+        if size > self.max_size:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= previous[1]
+            self._entries[key] = (value, size)
+            self.size += size
+            while self.size > self.max_size:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.size -= evicted_size
+
+    def clear(self):
+        """모든 항목을 제거합니다."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
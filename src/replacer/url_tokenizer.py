@@ -0,0 +1,125 @@
+"""URL 토큰화 모듈
+
+URL 문자열을 다시 조립하지 않고 치환이 필요한 구간(span)만 찾기 위한
+도우미를 제공합니다. 치환하지 않은 부분은 원본 문자열 그대로 유지됩니다.
+"""
+import re
+from typing import Iterator, List, Optional, Tuple
+
+
+# 경로 템플릿에서 필드를 나타내는 세그먼트 (예: {phone})
+_TEMPLATE_FIELD = re.compile(r'^\{([^{}/]+)\}$')
+
+
+def split_url(url: str) -> Tuple[int, int, int, int]:
+    """
+    URL에서 경로와 query string의 위치를 찾습니다.
+
+    Args:
+        url: URL 문자열 (절대 URL 또는 '/'로 시작하는 경로)
+
+    Returns:
+        (경로 시작, 경로 끝, query 시작, query 끝) 튜플.
+        query가 없으면 query 시작과 끝은 경로 끝과 같습니다.
+    """
+    fragment = url.find('#')
+    end = fragment if fragment != -1 else len(url)
+
+    query_mark = url.find('?', 0, end)
+    path_end = query_mark if query_mark != -1 else end
+
+    path_start = 0
+    scheme = url.find('://', 0, path_end)
+    if scheme != -1:
+        host_end = url.find('/', scheme + 3, path_end)
+        path_start = host_end if host_end != -1 else path_end
+
+    if query_mark == -1:
+        return path_start, path_end, path_end, path_end
+    return path_start, path_end, query_mark + 1, end
+
+
+def iter_query_params(
+    url: str,
+    start: int,
+    end: int
+) -> Iterator[Tuple[str, int, int]]:
+    """
+    query string의 각 파라미터 이름과 값의 위치를 순서대로 반환합니다.
+
+    Args:
+        url: URL 문자열
+        start: query string 시작 위치 ('?' 다음)
+        end: query string 끝 위치
+
+    Yields:
+        (인코딩된 파라미터 이름, 값 시작 위치, 값 끝 위치) 튜플
+    """
+    position = start
+    while position < end:
+        amp = url.find('&', position, end)
+        param_end = amp if amp != -1 else end
+        equals = url.find('=', position, param_end)
+        if equals != -1:
+            yield url[position:equals], equals + 1, param_end
+        position = param_end + 1
+
+
+class PathTemplate:
+    """'/api/user/{phone}' 형태의 경로 템플릿
+
+    '{필드명}' 세그먼트의 값은 해당 필드명을 키로 하여 개인정보를 식별하고,
+    '*' 세그먼트는 임의의 값과 일치합니다. 나머지 세그먼트는 정확히 일치해야 합니다.
+    """
+
+    def __init__(self, template: str):
+        self.template = template
+        self.segments: List[Tuple[str, Optional[str]]] = []
+        for segment in template.strip('/').split('/'):
+            field = _TEMPLATE_FIELD.match(segment)
+            if field:
+                self.segments.append(('field', field.group(1)))
+            elif segment == '*':
+                self.segments.append(('any', None))
+            else:
+                self.segments.append(('literal', segment))
+
+    def match(
+        self,
+        url: str,
+        start: int,
+        end: int
+    ) -> Optional[List[Tuple[str, int, int]]]:
+        """
+        경로가 템플릿과 일치하면 필드 세그먼트의 위치를 반환합니다.
+
+        Args:
+            url: URL 문자열
+            start: 경로 시작 위치
+            end: 경로 끝 위치
+
+        Returns:
+            [(필드명, 세그먼트 시작, 세그먼트 끝), ...], 일치하지 않으면 None
+        """
+        position = start + 1 if url.startswith('/', start) else start
+        if end > position and url[end - 1] == '/':
+            end -= 1
+
+        fields = []
+        for index, (kind, name) in enumerate(self.segments):
+            if position > end:
+                return None
+            slash = url.find('/', position, end)
+            segment_end = slash if slash != -1 else end
+            # 마지막 템플릿 세그먼트는 경로의 마지막 세그먼트여야 함
+            if index == len(self.segments) - 1 and slash != -1:
+                return None
+            if kind == 'literal' and url[position:segment_end] != name:
+                return None
+            if kind == 'field':
+                fields.append((name, position, segment_end))
+            position = segment_end + 1
+
+        if position <= end:
+            return None
+        return fields
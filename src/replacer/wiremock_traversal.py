@@ -0,0 +1,358 @@
+"""WireMock 스텁 구조를 인식하는 치환 순회 모듈
+
+WireMock 매핑의 request matcher는 실제 필드 이름이 한 단계 위에 있습니다
+(예: ``queryParameters.phone.equalTo``). 일반 재귀 순회는 ``equalTo``를 키로
+사용하므로 개인정보를 놓치게 됩니다. 이 모듈은 알려진 WireMock 경로를 표로
+미리 정의해두고, matcher 객체마다 실제 필드 이름을 찾아 치환합니다.
+"""
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from .url_tokenizer import iter_query_params
+from .header_policy import HEADER_ALLOW
+
+if TYPE_CHECKING:
+    from .personal_info_replacer import PersonalInfoReplacer
+
+
+# 값을 그대로 비교하는 matcher
+LITERAL_MATCHERS = frozenset([
+    'equalTo', 'contains', 'doesNotContain', 'equalToIgnoreCase'
+])
+
+# 정규표현식 matcher (정규식이 리터럴일 때만 치환)
+REGEX_MATCHERS = frozenset(['matches', 'doesNotMatch'])
+
+# 여러 matcher를 묶는 matcher
+COMBINATOR_MATCHERS = frozenset(['hasExactly', 'includes', 'and', 'or'])
+
+# 스텁 최상위에서 치환하지 않는 필드 (스텁 이름, 시나리오 상태 등)
+STUB_SKIP_FIELDS = frozenset([
+    'id', 'uuid', 'name', 'priority', 'persistent', 'scenarioName',
+    'requiredScenarioState', 'newScenarioState', 'postServeActions',
+    'serveEventListeners', 'insertionIndex'
+])
+
+# 요청/응답에서 치환하지 않는 필드
+REQUEST_SKIP_FIELDS = frozenset(['method'])
+RESPONSE_SKIP_FIELDS = frozenset([
+    'status', 'statusMessage', 'bodyFileName', 'base64Body',
+    'fixedDelayMilliseconds', 'delayDistribution', 'chunkedDribbleDelay',
+    'fault', 'transformers', 'transformerParameters', 'proxyBaseUrl'
+])
+
+# 정규표현식 메타 문자 (이 문자가 없어야 리터럴로 간주)
+_REGEX_META = re.compile(r'[.^$*+?{}\[\]\\|()]')
+
+# matchesJsonPath 필터 식의 '@.field == 'value'' 비교
+_JSONPATH_COMPARISON = re.compile(
+    r"""@\.([\w-]+)\s*==\s*(['"])(.*?)\2"""
+)
+
+# WireMock 스텁으로 판단하기 위한 request/response 필드
+_STUB_REQUEST_HINTS = frozenset([
+    'method', 'url', 'urlPath', 'urlPattern', 'urlPathPattern',
+    'queryParameters', 'bodyPatterns', 'headers'
+])
+
+
+def is_wiremock_stub(data: Any) -> bool:
+    """딕셔너리가 WireMock 스텁 매핑인지 확인합니다."""
+    if not isinstance(data, dict):
+        return False
+    request = data.get('request')
+    return (
+        isinstance(request, dict)
+        and isinstance(data.get('response'), dict)
+        and not _STUB_REQUEST_HINTS.isdisjoint(request)
+    )
+
+
+def _escape_regex_literal(value: str) -> str:
+    """치환값을 정규표현식 리터럴로 이스케이프합니다."""
+    return _REGEX_META.sub(lambda m: '\\' + m.group(), value)
+
+
+class WireMockStubTraverser:
+    """WireMock 스텁 구조에 맞춰 개인정보를 치환하는 클래스"""
+
+    def __init__(self, replacer: 'PersonalInfoReplacer'):
+        """
+        Args:
+            replacer: 실제 값 치환에 사용할 치환기
+        """
+        self.replacer = replacer
+        # 요청 필드 -> 처리 함수 (표에 없는 필드는 일반 순회)
+        self.request_handlers: Dict[str, Callable[[Any, str], Any]] = {
+            'url': self._replace_plain,
+            'urlPath': self._replace_plain,
+            'urlPattern': self._replace_url_regex,
+            'urlPathPattern': self._replace_url_regex,
+            'queryParameters': self._replace_named_matchers,
+            'headers': self._replace_header_matchers,
+            'cookies': self._replace_named_matchers,
+            'formParameters': self._replace_named_matchers,
+            'pathParameters': self._replace_named_matchers,
+            'bodyPatterns': self._replace_body_patterns,
+        }
+        # 응답 필드 -> 처리 함수
+        self.response_handlers: Dict[str, Callable[[Any, str], Any]] = {
+            'headers': self._replace_headers,
+            'body': self._replace_generic,
+            'jsonBody': self._replace_generic,
+        }
+
+    def replace_stub(self, stub: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        WireMock 스텁 하나를 치환합니다.
+
+        Args:
+            stub: WireMock 스텁 매핑
+
+        Returns:
+            치환된 스텁
+        """
+        result = {}
+        for key, value in stub.items():
+            if key == 'request' and isinstance(value, dict):
+                result[key] = self._replace_section(
+                    value, self.request_handlers, REQUEST_SKIP_FIELDS
+                )
+            elif key == 'response' and isinstance(value, dict):
+                result[key] = self._replace_section(
+                    value, self.response_handlers, RESPONSE_SKIP_FIELDS
+                )
+            elif key in STUB_SKIP_FIELDS:
+                result[key] = value
+            else:
+                result[key] = self._replace_generic(value, key)
+        return result
+
+    def _replace_section(
+        self,
+        section: Dict[str, Any],
+        handlers: Dict[str, Callable[[Any, str], Any]],
+        skip_fields: frozenset
+    ) -> Dict[str, Any]:
+        """request 또는 response 섹션을 표에 따라 치환합니다."""
+        result = {}
+        for key, value in section.items():
+            handler = handlers.get(key)
+            if handler is not None:
+                result[key] = handler(value, key)
+            elif key in skip_fields:
+                result[key] = value
+            else:
+                result[key] = self._replace_generic(value, key)
+        return result
+
+    def _replace_generic(self, value: Any, key: str) -> Any:
+        """WireMock 구조가 아닌 값은 일반 순회로 치환합니다."""
+        if isinstance(value, dict):
+            return self.replacer._replace_in_dict(value)
+        if isinstance(value, list):
+            return self.replacer._replace_in_list(value, key)
+        return self.replacer._replace_in_value(value, key)[0]
+
+    def _replace_plain(self, value: Any, key: str) -> Any:
+        """url, urlPath 같은 단일 값을 치환합니다."""
+        return self.replacer._replace_in_value(value, key)[0]
+
+    def _replace_headers(self, headers: Any, key: str) -> Any:
+        """응답 헤더(이름 -> 값)를 헤더 정책에 따라 치환합니다."""
+        if not isinstance(headers, dict):
+            return self._replace_generic(headers, key)
+        return self.replacer._replace_in_headers(headers)
+
+    def _replace_header_matchers(self, matchers: Any, key: str) -> Any:
+        """
+        요청 헤더 matcher를 치환합니다.
+
+        값이 matcher 객체가 아니면 응답 헤더와 같이 헤더 정책으로 처리하고,
+        matcher 객체이면 허용 목록의 헤더는 건너뛰고 나머지는 헤더 이름을
+        키로 하여 치환합니다.
+        """
+        if not isinstance(matchers, dict):
+            return self._replace_generic(matchers, key)
+        policy = self.replacer.header_policy
+        result = {}
+        for name, matcher in matchers.items():
+            if not isinstance(matcher, dict):
+                result[name] = self.replacer._replace_header_value(matcher, name)
+            elif policy.classify(name) == HEADER_ALLOW:
+                result[name] = matcher
+            else:
+                # 리터럴 matcher 값은 Cookie 등 헤더 전용 파서로 처리
+                result[name] = {
+                    operator: self.replacer._replace_header_value(operand, name)
+                    if operator in LITERAL_MATCHERS
+                    else self._replace_matcher({operator: operand}, name)[operator]
+                    for operator, operand in matcher.items()
+                }
+        return result
+
+    def _replace_named_value(self, value: Any, name: str) -> Any:
+        """헤더/파라미터 값 하나를 이름을 키로 하여 치환합니다."""
+        if isinstance(value, list):
+            return [self._replace_named_value(item, name) for item in value]
+        return self.replacer._replace_in_value(value, name)[0]
+
+    def _replace_named_matchers(self, matchers: Any, key: str) -> Any:
+        """queryParameters, headers 등 '이름 -> matcher' 구조를 치환합니다."""
+        if not isinstance(matchers, dict):
+            return self._replace_generic(matchers, key)
+        return {
+            name: self._replace_matcher(matcher, name)
+            for name, matcher in matchers.items()
+        }
+
+    def _replace_matcher(self, matcher: Any, name: str) -> Any:
+        """
+        matcher 객체를 실제 필드 이름(name)을 키로 하여 치환합니다.
+
+        Args:
+            matcher: matcher 객체 또는 값 (예: {'equalTo': '010-1234-5678'})
+            name: matcher가 검사하는 필드 이름
+
+        Returns:
+            치환된 matcher
+        """
+        if not isinstance(matcher, dict):
+            # matcher 없이 값만 있는 경우 (비표준 형식)
+            return self._replace_named_value(matcher, name)
+
+        result = {}
+        for operator, operand in matcher.items():
+            if operator in LITERAL_MATCHERS:
+                result[operator] = self.replacer._replace_in_value(operand, name)[0]
+            elif operator in REGEX_MATCHERS:
+                result[operator] = self._replace_regex_literal(operand, name)
+            elif operator in COMBINATOR_MATCHERS and isinstance(operand, list):
+                result[operator] = [
+                    self._replace_matcher(item, name) for item in operand
+                ]
+            elif operator == 'equalToJson':
+                result[operator] = self._replace_generic(operand, name)
+            elif operator == 'matchesJsonPath':
+                result[operator] = self._replace_json_path(operand)
+            else:
+                result[operator] = operand
+        return result
+
+    def _replace_body_patterns(self, patterns: Any, key: str) -> Any:
+        """bodyPatterns의 각 matcher를 치환합니다."""
+        if not isinstance(patterns, list):
+            return self._replace_generic(patterns, key)
+        return [self._replace_matcher(pattern, '') for pattern in patterns]
+
+    def _replace_regex_literal(self, pattern: Any, name: str) -> Any:
+        """정규표현식이 리터럴 값일 때만 개인정보를 치환합니다."""
+        if not isinstance(pattern, str):
+            return pattern
+        literal = self._unescape_regex_literal(pattern)
+        if literal is None:
+            return pattern
+        replaced, changed = self.replacer._replace_in_value(literal, name)
+        if not changed:
+            return pattern
+        return _escape_regex_literal(str(replaced))
+
+    @staticmethod
+    def _unescape_regex_literal(pattern: str) -> Optional[str]:
+        """
+        메타 문자가 없는(이스케이프만 있는) 정규표현식을 리터럴 문자열로 바꿉니다.
+
+        Returns:
+            리터럴 문자열, 정규표현식 문법을 사용하면 None
+        """
+        literal = []
+        index = 0
+        while index < len(pattern):
+            ch = pattern[index]
+            if ch == '\\':
+                if index + 1 >= len(pattern):
+                    return None
+                escaped = pattern[index + 1]
+                if escaped.isalnum():
+                    # \d, \w 같은 문자 클래스
+                    return None
+                literal.append(escaped)
+                index += 2
+                continue
+            if _REGEX_META.match(ch):
+                return None
+            literal.append(ch)
+            index += 1
+        return ''.join(literal)
+
+    def _replace_url_regex(self, pattern: Any, key: str) -> Any:
+        """
+        urlPattern, urlPathPattern의 query 값 중 리터럴인 값을 치환합니다.
+
+        정규표현식 안의 '\\?' 뒤를 query string으로 보고 각 파라미터 값이
+        리터럴이면 식별하여 치환하며, 나머지 부분은 그대로 유지합니다.
+        """
+        if not isinstance(pattern, str):
+            return pattern
+        query_mark = pattern.find('\\?')
+        if query_mark == -1:
+            return pattern
+
+        spans: List[Tuple[int, int, str]] = []
+        for raw_name, start, end in iter_query_params(
+            pattern, query_mark + 2, len(pattern)
+        ):
+            literal = self._unescape_regex_literal(pattern[start:end])
+            if not literal:
+                continue
+            replacement = self.replacer._replace_url_component(
+                literal, raw_name, plus_as_space=True
+            )
+            if replacement is not None:
+                spans.append((start, end, _escape_regex_literal(replacement)))
+
+        if not spans:
+            return pattern
+        pieces = []
+        position = 0
+        for start, end, replacement in spans:
+            pieces.append(pattern[position:start])
+            pieces.append(replacement)
+            position = end
+        pieces.append(pattern[position:])
+        return ''.join(pieces)
+
+    def _replace_json_path(self, operand: Any) -> Any:
+        """
+        matchesJsonPath를 치환합니다.
+
+        - 문자열: 필터 식의 ``@.field == 'value'`` 비교 값을 field를 키로 치환
+        - 객체: ``expression``의 마지막 필드 이름을 키로 나머지 matcher를 치환
+        """
+        if isinstance(operand, str):
+            return _JSONPATH_COMPARISON.sub(self._replace_json_path_comparison, operand)
+        if not isinstance(operand, dict):
+            return operand
+
+        expression = operand.get('expression')
+        name = ''
+        if isinstance(expression, str):
+            name = re.split(r"[.\[\]'\"]+", expression.strip('$.[]\'"'))[-1]
+            expression = _JSONPATH_COMPARISON.sub(
+                self._replace_json_path_comparison, expression
+            )
+        result = self._replace_matcher(
+            {k: v for k, v in operand.items() if k != 'expression'},
+            name
+        )
+        if 'expression' in operand:
+            result = {'expression': expression, **result}
+        return result
+
+    def _replace_json_path_comparison(self, match: 're.Match') -> str:
+        field, quote, value = match.group(1), match.group(2), match.group(3)
+        replaced, changed = self.replacer._replace_in_value(value, field)
+        if not changed:
+            return match.group(0)
+        prefix = match.group(0)[:match.start(3) - match.start(0)]
+        return f"{prefix}{replaced}{quote}"
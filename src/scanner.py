@@ -0,0 +1,368 @@
+"""개인정보 스캔(식별 전용) 모듈
+
+치환값 생성이나 파일 쓰기 없이 개인정보 식별만 수행하여 유형별, 키별, 파일별
+집계 보고서를 만듭니다. 치환과 같은 순회(URL의 query 값과 경로 템플릿, 문자열 안의
+JSON, WireMock matcher, scan_text의 문자열 내부 검색)를 dry-run으로 사용하므로
+치환 대상이 되는 값은 모두 보고서에 나타납니다.
+
+파일 단위로 프로세스 풀에 분배하며, 워커는 패턴을 한 번만 컴파일하고 파일마다
+집계 결과만 돌려주므로 프로세스 간 전송량이 작습니다.
+
+보고서에는 원본 값을 넣지 않고 위치(경로)만 기록하므로 CI 로그에 남겨도 안전합니다.
+"""
+import csv
+import io
+import json
+from collections import Counter
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .identifier.personal_info_identifier import PersonalInfoIdentifier
+from .generator.virtual_data_generator import VirtualDataGenerator
+from .replacer.personal_info_replacer import PersonalInfoReplacer
+from .replacer.header_policy import HeaderPolicy
+from .replacer.wiremock_traversal import WireMockStubTraverser
+from .json_io import load_json_file
+from .scenario_processor import NDJSON_SUFFIXES
+
+
+# 유형별로 보고서에 남길 발견 위치 샘플 수
+DEFAULT_SAMPLE_SIZE = 5
+
+# 한 번에 워커에 넘길 파일 수
+SCAN_CHUNK_SIZE = 16
+
+# 워커 프로세스마다 한 번 생성하는 기록기
+_worker_recorder: Optional['FindingRecorder'] = None
+
+
+class _PathTrackingStubTraverser(WireMockStubTraverser):
+    """스텁 섹션과 필드 이름을 FindingRecorder의 경로에 넣는 WireMock 순회기"""
+
+    def __init__(self, recorder: 'FindingRecorder'):
+        super().__init__(recorder)
+        for handlers in (self.request_handlers, self.response_handlers):
+            for field, handler in handlers.items():
+                handlers[field] = self._tracked(handler)
+
+    def _tracked(self, handler: Callable[[Any, str], Any]) -> Callable[[Any, str], Any]:
+        def run(value: Any, key: str) -> Any:
+            with self.replacer._at(key):
+                return handler(value, key)
+        return run
+
+    def _replace_section(self, section, handlers, skip_fields):
+        name = 'request' if handlers is self.request_handlers else 'response'
+        with self.replacer._at(name):
+            return super()._replace_section(section, handlers, skip_fields)
+
+    def _replace_generic(self, value: Any, key: str) -> Any:
+        with self.replacer._at(key):
+            return super()._replace_generic(value, key)
+
+
+class FindingRecorder(PersonalInfoReplacer):
+    """치환 순회를 그대로 사용하되 치환값 대신 발견 위치를 기록하는 치환기 (dry-run)
+
+    치환값을 만들 자리에서 유형, 키, 경로를 기록하고 원본 값을 그대로 돌려주므로
+    치환 매핑이나 출력 파일은 만들지 않습니다. 같은 문자열을 다시 만나도 기록이
+    빠지지 않도록 문자열 안의 JSON 캐시는 사용하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        identifier: PersonalInfoIdentifier,
+        scan_text: bool = False,
+        path_templates: Optional[List[str]] = None,
+        headers: Optional[Dict[str, List[str]]] = None
+    ):
+        """
+        Args:
+            identifier: 개인정보 식별기
+            scan_text: 키로 식별되지 않은 문자열 내부에서도 개인정보를 검색할지 여부
+            path_templates: 경로 세그먼트의 개인정보를 찾을 경로 템플릿 목록
+            headers: 헤더 처리 정책 ({'allow': [...], 'deny': [...]})
+        """
+        super().__init__(
+            identifier,
+            VirtualDataGenerator(),
+            mmap_threshold=identifier.mmap_threshold,
+            scan_text=scan_text,
+            path_templates=path_templates,
+            header_policy=HeaderPolicy(**(headers or {}))
+        )
+        self.findings: List[Dict[str, str]] = []
+        self._path: List[str] = []
+        self._wiremock = _PathTrackingStubTraverser(self)
+
+    def scan_document(self, data: Any, path: str = '') -> List[Dict[str, str]]:
+        """
+        JSON 문서 하나를 순회하여 발견한 개인정보를 반환합니다.
+
+        Args:
+            data: JSON 데이터
+            path: 경로 앞에 붙일 위치 (예: NDJSON의 'line3')
+
+        Returns:
+            {'type', 'key', 'path'} 리스트
+        """
+        self.findings = []
+        self._path = [path] if path else []
+        self._replace_document(data)
+        return self.findings
+
+    def _path_string(self) -> str:
+        path = ''
+        for segment in self._path:
+            if path and not segment.startswith('['):
+                path += '.'
+            path += segment
+        return path
+
+    @contextmanager
+    def _at(self, key: str):
+        """순회하는 동안 경로에 키를 넣습니다 (이미 마지막 경로이면 다시 넣지 않음)."""
+        if not key or (self._path and self._path[-1] == key):
+            yield
+            return
+        self._path.append(key)
+        try:
+            yield
+        finally:
+            self._path.pop()
+
+    def _get_or_create_replacement(self, info_type: str, original_value: str) -> str:
+        key = next(
+            (segment for segment in reversed(self._path) if not segment.startswith('[')),
+            ''
+        )
+        self.findings.append({'type': info_type, 'key': key, 'path': self._path_string()})
+        return original_value
+
+    def _replace_embedded_json(self, value: str) -> Optional[str]:
+        try:
+            return super()._replace_embedded_json(value)
+        finally:
+            self._embedded_json_cache.clear()
+
+    def _replace_url_component(self, raw: str, key: str, plus_as_space: bool) -> Optional[str]:
+        with self._at(key):
+            return super()._replace_url_component(raw, key, plus_as_space)
+
+    def _replace_header_value(self, value: Any, name: str) -> Any:
+        with self._at(name):
+            return super()._replace_header_value(value, name)
+
+    def _replace_in_value(self, value: Any, key: str = ''):
+        with self._at(key):
+            return super()._replace_in_value(value, key)
+
+    def _replace_subtree(self, data: Dict[str, Any], key: str, replace):
+        with self._at(key):
+            return super()._replace_subtree(data, key, replace)
+
+    def _replace_in_list(self, items: List[Any], key: str) -> List[Any]:
+        with self._at(key):
+            self._scan_items(items, key)
+        return items
+
+    def _scan_items(self, items: List[Any], key: str):
+        """리스트 항목을 인덱스 경로와 함께 순회합니다."""
+        for index, item in enumerate(items):
+            self._path.append(f"[{index}]")
+            try:
+                if isinstance(item, dict):
+                    self._replace_in_dict(item)
+                elif isinstance(item, list):
+                    self._scan_items(item, key)
+                else:
+                    super()._replace_in_value(item, key)
+            finally:
+                self._path.pop()
+
+
+def scan_file(
+    recorder: FindingRecorder,
+    file_path: str,
+    sample_size: int = DEFAULT_SAMPLE_SIZE
+) -> Dict[str, Any]:
+    """
+    파일 하나를 스캔하여 집계 결과를 반환합니다.
+
+    Args:
+        recorder: 발견 위치 기록기
+        file_path: JSON 또는 NDJSON(.ndjson/.jsonl) 파일 경로
+        sample_size: 유형별로 남길 발견 위치 수
+
+    Returns:
+        {'file', 'types', 'keys', 'samples', 'error'} 딕셔너리
+    """
+    result = {
+        'file': file_path,
+        'types': Counter(),
+        'keys': Counter(),
+        'samples': {},
+        'error': None
+    }
+
+    def add(findings: List[Dict[str, Any]]):
+        for finding in findings:
+            result['types'][finding['type']] += 1
+            result['keys'][finding['key']] += 1
+            samples = result['samples'].setdefault(finding['type'], [])
+            if len(samples) < sample_size:
+                samples.append(f"{file_path}:{finding['path']}")
+
+    try:
+        path = Path(file_path)
+        if path.suffix.lower() in NDJSON_SUFFIXES:
+            with open(path, 'r', encoding='utf-8') as f:
+                for line_no, line in enumerate(f, 1):
+                    if line.strip():
+                        add(recorder.scan_document(json.loads(line), f"line{line_no}"))
+        else:
+            add(recorder.scan_document(load_json_file(path, recorder.mmap_threshold)))
+    except (OSError, ValueError) as e:
+        result['error'] = str(e)
+
+    return result
+
+
+def _make_recorder(
+    patterns: List[Dict[str, Any]],
+    value_only: bool,
+    options: Optional[Dict[str, Any]]
+) -> FindingRecorder:
+    return FindingRecorder(
+        PersonalInfoIdentifier(patterns, value_only=value_only),
+        **(options or {})
+    )
+
+
+def _init_worker(
+    patterns: List[Dict[str, Any]],
+    value_only: bool,
+    options: Optional[Dict[str, Any]]
+):
+    """워커 프로세스의 기록기를 초기화합니다."""
+    global _worker_recorder
+    _worker_recorder = _make_recorder(patterns, value_only, options)
+
+
+def _scan_in_worker(args) -> Dict[str, Any]:
+    file_path, sample_size = args
+    return scan_file(_worker_recorder, file_path, sample_size)
+
+
+class ScanReport:
+    """파일별 스캔 결과를 합산하는 보고서"""
+
+    def __init__(self, sample_size: int = DEFAULT_SAMPLE_SIZE):
+        self.sample_size = sample_size
+        self.by_type: Counter = Counter()
+        self.by_key: Counter = Counter()
+        self.by_file: Dict[str, int] = {}
+        self.samples: Dict[str, List[str]] = {}
+        self.errors: Dict[str, str] = {}
+        self.files_scanned = 0
+
+    def add(self, file_result: Dict[str, Any]):
+        """파일 하나의 스캔 결과를 합산합니다."""
+        self.files_scanned += 1
+        if file_result['error']:
+            self.errors[file_result['file']] = file_result['error']
+            return
+
+        self.by_type.update(file_result['types'])
+        self.by_key.update(file_result['keys'])
+        total = sum(file_result['types'].values())
+        if total:
+            self.by_file[file_result['file']] = total
+        for info_type, paths in file_result['samples'].items():
+            samples = self.samples.setdefault(info_type, [])
+            samples.extend(paths[:self.sample_size - len(samples)])
+
+    @property
+    def total(self) -> int:
+        """발견된 개인정보 총 개수"""
+        return sum(self.by_type.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """보고서를 딕셔너리로 반환합니다 (개수 내림차순)."""
+        return {
+            'files_scanned': self.files_scanned,
+            'files_with_findings': len(self.by_file),
+            'total': self.total,
+            'by_type': dict(self.by_type.most_common()),
+            'by_key': dict(self.by_key.most_common()),
+            'by_file': dict(sorted(self.by_file.items(), key=lambda item: (-item[1], item[0]))),
+            'samples': self.samples,
+            'errors': self.errors
+        }
+
+    def to_json(self) -> str:
+        """보고서를 JSON 문자열로 반환합니다."""
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+
+    def to_csv(self) -> str:
+        """보고서를 section,name,count 형식의 CSV 문자열로 반환합니다."""
+        report = self.to_dict()
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow(['section', 'name', 'count'])
+        writer.writerow(['summary', 'files_scanned', report['files_scanned']])
+        writer.writerow(['summary', 'total', report['total']])
+        for section in ('type', 'key', 'file'):
+            for name, count in report[f'by_{section}'].items():
+                writer.writerow([section, name, count])
+        for file_path, error in report['errors'].items():
+            writer.writerow(['error', file_path, error])
+        return output.getvalue()
+
+
+def scan_files(
+    file_paths: List[str],
+    patterns: List[Dict[str, Any]],
+    workers: int = 1,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    value_only: bool = False,
+    options: Optional[Dict[str, Any]] = None
+) -> ScanReport:
+    """
+    여러 파일을 스캔하여 합산 보고서를 만듭니다.
+
+    Args:
+        file_paths: 스캔할 파일 경로 리스트
+        patterns: 개인정보 패턴 정의 리스트
+        workers: 프로세스 수 (1이면 현재 프로세스에서 처리)
+        sample_size: 유형별로 남길 발견 위치 수
+        value_only: 키 이름과 무관하게 값만으로도 판별할지 여부
+        options: FindingRecorder에 넘길 순회 옵션
+            (scan_text, path_templates, headers)
+
+    Returns:
+        ScanReport (입력 순서대로 합산되어 샘플이 결정적임)
+    """
+    report = ScanReport(sample_size)
+
+    if workers <= 1 or len(file_paths) <= 1:
+        recorder = _make_recorder(patterns, value_only, options)
+        for file_path in file_paths:
+            report.add(scan_file(recorder, file_path, sample_size))
+        return report
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(patterns, value_only, options)
+    ) as executor:
+        for file_result in executor.map(
+            _scan_in_worker,
+            [(file_path, sample_size) for file_path in file_paths],
+            chunksize=SCAN_CHUNK_SIZE
+        ):
+            report.add(file_result)
+
+    return report
@@ -1,89 +1,391 @@
 """Wiremock 시나리오 처리 모듈"""
+import hashlib
 import json
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Dict, Any, Iterable, Optional
 
 from .config_loader import ConfigLoader
 from .identifier.personal_info_identifier import PersonalInfoIdentifier
 from .generator.virtual_data_generator import VirtualDataGenerator
 from .replacer.personal_info_replacer import PersonalInfoReplacer
+from .replacer.header_policy import HeaderPolicy
+from .replacer.map_store import export_replacement_map, load_replacement_map
+from .json_io import (
+    DEFAULT_MMAP_THRESHOLD,
+    DEFAULT_WRITE_BUFFER_SIZE,
+    DURABILITY_NONE,
+    DURABILITY_FILE,
+    copy_file_atomic,
+)
+from .audit_index import AuditIndex
+from .output_paths import OutputPathMapper
+from .checkpoint import CheckpointJournal, DEFAULT_SYNC_INTERVAL, read_checkpoint
+
+
+# 한 줄에 하나의 JSON 레코드가 있는 스트리밍 처리 대상 확장자
+NDJSON_SUFFIXES = ('.ndjson', '.jsonl')
 
 
 class ScenarioProcessor:
     """Wiremock 시나리오 내의 여러 mappings 파일을 일관되게 처리하는 클래스"""
     
-    def __init__(self, config_path: str = None):
+    def __init__(
+        self,
+        config_path: str = None,
+        workers: int = 1,
+        durability: str = DURABILITY_NONE,
+        scan_text: bool = False,
+        value_only: bool = False,
+        tolerant: bool = False
+    ):
         """
         Args:
             config_path: 설정 파일 경로
+            workers: NDJSON 파일을 병렬 처리할 워커 수
+            durability: 출력 내구성 모드 (none: fsync 없음, file: 파일마다 fsync,
+                batch: 파일 내용과 디렉토리를 process_scenario 종료 시 일괄 fsync)
+            scan_text: 문자열 내부에 포함된 개인정보도 검색하여 치환할지 여부
+            value_only: 키 이름과 무관하게 값만으로 개인정보를 판별할지 여부
+            tolerant: 형식 오류(BOM, 주석, 끝의 쉼표, 이어 붙은 문서)를 고쳐 처리하고,
+                고칠 수 없는 파일은 텍스트에서 개인정보를 찾아 치환할지 여부
         """
+        self.workers = workers
+        self.tolerant = tolerant
+        
         # 설정 로드
         config_loader = ConfigLoader(config_path)
         patterns = config_loader.get_patterns()
+        # 설정 파일에서는 0으로 메모리 매핑을 끔
+        mmap_threshold = config_loader.get_setting(
+            'mmap_threshold', DEFAULT_MMAP_THRESHOLD
+        ) or None
         
         # 모듈 초기화
-        self.identifier = PersonalInfoIdentifier(patterns)
-        self.generator = VirtualDataGenerator()
-        self.replacer = PersonalInfoReplacer(self.identifier, self.generator)
+        self.identifier = PersonalInfoIdentifier(
+            patterns,
+            value_only=value_only,
+            mmap_threshold=mmap_threshold
+        )
+        self.generator = VirtualDataGenerator(
+            generators=config_loader.get_setting('generators', {}),
+            load_entry_points=config_loader.get_setting('load_entry_points', False),
+            format_preserving=config_loader.get_setting('format_preserving', True)
+        )
+        for error in self.generator.entry_point_errors:
+            print(f"경고: 생성기 entry point를 불러올 수 없습니다: {error}")
+        self.replacer = PersonalInfoReplacer(
+            self.identifier,
+            self.generator,
+            durability=durability,
+            scan_text=scan_text,
+            path_templates=config_loader.get_setting('path_templates', []),
+            header_policy=HeaderPolicy(**config_loader.get_setting('headers', {})),
+            subtree_memo_size=config_loader.get_setting('subtree_memo_size', 0),
+            mmap_threshold=mmap_threshold,
+            write_buffer_size=config_loader.get_setting(
+                'write_buffer_size', DEFAULT_WRITE_BUFFER_SIZE
+            )
+        )
     
     def process_scenario(
         self,
-        mapping_files: List[str],
-        output_dir: str = None
+        mapping_files: Iterable[str],
+        output_dir: str = None,
+        audit_db: str = None,
+        base_dir: str = None,
+        dedup: bool = False,
+        link_duplicates: bool = False,
+        checkpoint: str = None,
+        resume: bool = False
     ) -> Dict[str, Any]:
         """
         시나리오 내의 여러 mappings 파일을 일관되게 처리합니다.
         
+        dedup이 True이면 입력 파일 내용의 해시가 같은 파일은 한 번만 치환하고,
+        나머지는 먼저 기록된 출력을 복사합니다. 치환은 공유 매핑에 대해
+        결정적이므로 결과는 각각 치환한 것과 같습니다. 모든 입력을 치환 전에
+        한 번 더 읽어 해시하므로 중복이 적은 입력에서는 비용만 늘어납니다.
+        
+        checkpoint를 지정하면 파일마다 처리 결과와 새 치환 항목을 저널에 기록하고,
+        resume이 True이면 저널의 치환 항목을 불러와 성공한 파일을 건너뛰고 이어서 처리합니다.
+        
         Args:
-            mapping_files: 처리할 mappings 파일 경로 리스트
+            mapping_files: 처리할 mappings 파일 경로 (리스트 또는 이터레이터)
             output_dir: 출력 디렉토리 (None이면 원본 파일 덮어쓰기)
+            audit_db: 파일별 치환 기록을 누적할 감사 인덱스 경로 (None이면 기록 안 함)
+            base_dir: 출력 디렉토리 아래에 재현할 상대 경로의 기준 디렉토리
+                (None이면 파일 이름만 사용, 같은 이름의 파일은 충돌로 처리)
+            dedup: 내용이 같은 파일을 한 번만 치환할지 여부
+            link_duplicates: 중복 파일의 출력을 복사 대신 하드 링크로 만들지 여부
+                (dedup이 True일 때만 적용)
+            checkpoint: 진행 상황을 기록할 체크포인트 저널 경로 (None이면 기록 안 함)
+            resume: 체크포인트 저널에서 이어서 처리할지 여부
         
         Returns:
             처리 결과 정보
         """
         results = {
             'processed_files': [],
-            'replacement_map': {}
+            'replacement_map': {},
+            'duplicates': 0,
+            'resumed': 0,
+            'parse_fixes': {}
         }
         
+        # 중단 전의 치환 매핑을 복원하고 성공한 파일 목록을 가져옴
+        completed: Dict[str, Dict[str, Any]] = {}
+        if checkpoint and resume and Path(checkpoint).exists():
+            completed, replacement_map = read_checkpoint(checkpoint)
+            self.replacer.load_replacement_map(replacement_map)
+        
+        journal = None
+        if checkpoint:
+            # 원본을 덮어쓰는 경우, 덮어쓴 파일이 저널에 빠져 재개 시 이미 치환된
+            # 내용을 다시 치환하지 않도록 레코드마다 fsync
+            journal = CheckpointJournal(
+                checkpoint,
+                resume=resume,
+                sync_interval=1 if output_dir is None else DEFAULT_SYNC_INTERVAL
+            )
+        audit_index = AuditIndex(audit_db) if audit_db else None
+        if journal is not None:
+            self.replacer.start_new_entry_log()
+        durability = self.replacer.durability
+        if journal is not None and output_dir is None and durability == DURABILITY_NONE:
+            # 원본을 덮어쓰며 완료를 기록하는 경우, 기록한 파일이 장애 후 비거나 이전
+            # 내용으로 남지 않도록 --durability none이어도 파일마다 fsync
+            self.replacer.durability = DURABILITY_FILE
+        try:
+            output_paths = OutputPathMapper(output_dir, base_dir) if output_dir else None
+            self._process_files(
+                mapping_files,
+                output_paths,
+                results,
+                audit_index,
+                {} if dedup else None,
+                link_duplicates,
+                journal,
+                completed,
+                base_dir
+            )
+        finally:
+            self.replacer.durability = durability
+            if journal is not None:
+                self.replacer.stop_new_entry_log()
+                journal.close()
+            if audit_index is not None:
+                audit_index.close()
+        
+        # batch 내구성 모드에서 미뤄둔 fsync 수행
+        self.replacer.flush_durable_writes()
+        
+        # 치환 매핑 정보 저장
+        results['replacement_map'] = self.replacer.get_replacement_map()
+        results['collision_stats'] = self.replacer.get_collision_stats()
+        
+        return results
+    
+    def _process_files(
+        self,
+        mapping_files: Iterable[str],
+        output_paths: Optional[OutputPathMapper],
+        results: Dict[str, Any],
+        audit_index: Optional[AuditIndex],
+        processed: Optional[Dict[tuple, Dict[str, Any]]] = None,
+        link_duplicates: bool = False,
+        journal: Optional[CheckpointJournal] = None,
+        completed: Optional[Dict[str, Dict[str, Any]]] = None,
+        base_dir: Optional[str] = None
+    ):
+        """
+        파일을 차례로 처리하여 결과를 results에 기록합니다.
+        
+        Args:
+            processed: 내용 해시별로 먼저 처리된 파일 정보 (None이면 중복 제거 안 함)
+            link_duplicates: 중복 파일의 출력을 하드 링크로 만들지 여부
+            journal: 파일별 처리 결과를 기록할 체크포인트 저널
+            completed: 이전 실행에서 성공하여 건너뛸 파일의 처리 결과 (체크포인트 키별)
+            base_dir: 체크포인트 키(상대 경로)의 기준 디렉토리
+        """
+        tracking_checkpoint = journal is not None or bool(completed)
+        resolved_base = Path(base_dir).resolve() if base_dir is not None else None
+        
         # 모든 파일을 한 번에 처리하여 일관성 유지
         for mapping_file in mapping_files:
             file_path = Path(mapping_file)
+            checkpoint_key = (
+                self._checkpoint_key(file_path, resolved_base)
+                if tracking_checkpoint else None
+            )
             if not file_path.exists():
                 print(f"경고: 파일을 찾을 수 없습니다: {mapping_file}")
                 continue
             
-            # 출력 경로 결정
-            if output_dir:
-                output_path = Path(output_dir) / file_path.name
-            else:
-                output_path = None
+            # 출력 경로 결정 (입력 기준 상대 경로 유지, 충돌 검사)
+            output_path = None
+            if output_paths is not None:
+                try:
+                    output_path = output_paths.prepare(mapping_file)
+                except ValueError as e:
+                    result = {
+                        'input': mapping_file,
+                        'output': str(output_paths.map(mapping_file)),
+                        'status': 'error',
+                        'error': str(e)
+                    }
+                    results['processed_files'].append(result)
+                    if journal is not None:
+                        journal.record(
+                            result, self.replacer.take_new_entries(), checkpoint_key
+                        )
+                    continue
+            target = output_path if output_path else file_path
+            
+            # 이전 실행에서 이미 처리한 파일은 건너뜀
+            if completed and checkpoint_key in completed:
+                result = completed[checkpoint_key]
+                results['processed_files'].append(result)
+                results['resumed'] += 1
+                for kind, count in result.get('parse_fixes', {}).items():
+                    results['parse_fixes'][kind] = results['parse_fixes'].get(kind, 0) + count
+                continue
+            
+            digest = self._content_key(file_path) if processed is not None else None
+            first = processed.get(digest) if digest is not None else None
             
-            # 치환 수행
             try:
-                self.replacer.replace_in_json_file(mapping_file, str(output_path))
-                results['processed_files'].append({
+                if first is not None:
+                    # 같은 내용은 먼저 기록된 출력을 그대로 사용
+                    if Path(first['output']) != target:
+                        copy_file_atomic(
+                            Path(first['output']),
+                            target,
+                            self.replacer.durability,
+                            self.replacer.durable_batch,
+                            link=link_duplicates
+                        )
+                    entries = first['entries']
+                else:
+                    # 치환 수행 (감사 인덱스가 있으면 파일에서 사용된 치환 항목을 기록)
+                    fixes: Dict[str, int] = {}
+                    if audit_index is not None:
+                        self.replacer.start_touch_tracking()
+                    try:
+                        self._process_file(
+                            mapping_file,
+                            str(output_path) if output_path else None,
+                            fixes
+                        )
+                    finally:
+                        entries = (
+                            self.replacer.stop_touch_tracking()
+                            if audit_index is not None else None
+                        )
+                    if digest is not None:
+                        processed[digest] = {
+                            'input': mapping_file,
+                            'output': str(target),
+                            'entries': entries,
+                            'fixes': fixes
+                        }
+                
+                if audit_index is not None:
+                    audit_index.record_file(mapping_file, entries)
+                result = {
                     'input': mapping_file,
-                    'output': str(output_path) if output_path else mapping_file,
+                    'output': str(target),
                     'status': 'success'
-                })
+                }
+                if first is not None:
+                    result['duplicate_of'] = first['input']
+                    results['duplicates'] += 1
+                    fixes = first['fixes']
+                if fixes:
+                    # 고친 오류 분류별 파일 수 (NDJSON은 라인 수) 집계
+                    result['parse_fixes'] = fixes
+                    for kind, count in fixes.items():
+                        results['parse_fixes'][kind] = results['parse_fixes'].get(kind, 0) + count
             except Exception as e:
-                results['processed_files'].append({
+                result = {
                     'input': mapping_file,
-                    'output': str(output_path) if output_path else mapping_file,
+                    'output': str(target),
                     'status': 'error',
                     'error': str(e)
-                })
+                }
+            results['processed_files'].append(result)
+            if journal is not None:
+                if output_paths is None:
+                    # 덮어쓴 파일이 디스크에 반영된 뒤에 완료로 기록
+                    self.replacer.flush_durable_writes()
+                journal.record(result, self.replacer.take_new_entries(), checkpoint_key)
+    
+    @staticmethod
+    def _checkpoint_key(file_path: Path, base_dir: Optional[Path]) -> str:
+        """
+        체크포인트에서 파일을 찾을 키를 만듭니다.
         
-        # 치환 매핑 정보 저장
-        results['replacement_map'] = self.replacer.get_replacement_map()
+        base_dir 아래의 파일은 정규화된 상대 경로('/' 구분), 그 밖의 파일은 절대 경로를
+        사용하여 같은 파일을 다른 형태의 경로로 지정해도 같은 키가 되게 합니다.
+        """
+        resolved = file_path.resolve()
+        if base_dir is not None:
+            try:
+                return resolved.relative_to(base_dir).as_posix()
+            except ValueError:
+                pass
+        return str(resolved)
+    
+    @staticmethod
+    def _content_key(file_path: Path) -> tuple:
+        """처리 방식(JSON/NDJSON)과 파일 내용 해시로 중복 판별 키를 만듭니다."""
+        with open(file_path, 'rb') as f:
+            digest = hashlib.file_digest(f, 'blake2b').digest()
+        return (file_path.suffix.lower() in NDJSON_SUFFIXES, digest)
+    
+    def _process_file(
+        self,
+        input_path: str,
+        output_path: str = None,
+        fixes: Optional[Dict[str, int]] = None
+    ) -> Any:
+        """
+        확장자에 따라 JSON 또는 NDJSON 치환을 수행합니다.
         
-        return results
+        Args:
+            input_path: 입력 파일 경로
+            output_path: 출력 파일 경로 (None이면 원본 파일 덮어쓰기)
+            fixes: 관대한 파싱 모드에서 고친 오류 분류별 개수를 더할 딕셔너리
+                (JSON 파일은 분류마다 1, NDJSON 파일은 고친 라인 수)
+        """
+        if Path(input_path).suffix.lower() in NDJSON_SUFFIXES:
+            stats = self.replacer.replace_in_ndjson_file(
+                input_path,
+                output_path,
+                workers=self.workers,
+                tolerant=self.tolerant
+            )
+            if fixes is not None:
+                for kind, count in stats['fixes'].items():
+                    fixes[kind] = fixes.get(kind, 0) + count
+            return stats
+        
+        if not self.tolerant:
+            return self.replacer.replace_in_json_file(input_path, output_path)
+        try:
+            return self.replacer.replace_in_json_file(input_path, output_path)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            # 정상 파일은 그대로 빠르게 처리하고, 파싱에 실패한 파일만 다시 읽어 고침
+            file_fixes = self.replacer.replace_in_json_file_tolerant(input_path, output_path)
+            if fixes is not None:
+                for kind in file_fixes:
+                    fixes[kind] = fixes.get(kind, 0) + 1
+            return None
     
     def process_single_file(
         self,
         input_path: str,
-        output_path: str = None
+        output_path: str = None,
+        audit_db: str = None
     ) -> Dict[str, Any]:
         """
         단일 파일을 처리합니다.
@@ -91,16 +393,56 @@ class ScenarioProcessor:
         Args:
             input_path: 입력 파일 경로
             output_path: 출력 파일 경로 (None이면 원본 파일 덮어쓰기)
+            audit_db: 치환 기록을 누적할 감사 인덱스 경로 (None이면 기록 안 함)
         
         Returns:
-            치환된 데이터
+            치환된 데이터 (NDJSON 파일이면 처리 통계)
         """
-        return self.replacer.replace_in_json_file(input_path, output_path)
+        if not audit_db:
+            result = self._process_file(input_path, output_path)
+            self.replacer.flush_durable_writes()
+            return result
+        
+        with AuditIndex(audit_db) as audit_index:
+            self.replacer.start_touch_tracking()
+            try:
+                result = self._process_file(input_path, output_path)
+                audit_index.record_file(
+                    input_path,
+                    self.replacer.stop_touch_tracking()
+                )
+            finally:
+                self.replacer.stop_touch_tracking()
+        self.replacer.flush_durable_writes()
+        return result
     
     def get_replacement_map(self) -> Dict[str, Dict[str, str]]:
         """현재 치환 매핑 테이블을 반환합니다."""
         return self.replacer.get_replacement_map()
     
+    def export_replacement_map(self, path: str):
+        """
+        현재 치환 매핑을 파일로 저장합니다.
+        
+        Args:
+            path: 저장할 경로 (.json이면 JSON, 그 외는 바이너리 형식)
+        """
+        export_replacement_map(self.replacer.get_replacement_map(), path)
+    
+    def import_replacement_map(self, path: str) -> int:
+        """
+        파일에 저장된 치환 매핑을 불러와 현재 매핑에 병합합니다.
+        
+        Args:
+            path: 치환 매핑 파일 경로 (.json이면 JSON, 그 외는 바이너리 형식)
+        
+        Returns:
+            불러온 항목 수
+        """
+        replacement_map = load_replacement_map(path)
+        self.replacer.load_replacement_map(replacement_map)
+        return len(replacement_map)
+    
     def reset(self):
         """치환 매핑을 초기화합니다 (새 시나리오 시작 시 사용)."""
         self.replacer.clear_replacement_map()
@@ -0,0 +1,68 @@
+"""파일 샤딩 모듈
+
+여러 CI 노드가 하나의 저장소를 나누어 처리할 수 있도록 파일 경로의 해시로
+파일을 샤드에 결정적으로 배정합니다. 경로는 입력 디렉토리 기준 상대 경로(POSIX 형식)를
+사용하므로 노드마다 체크아웃 위치가 달라도 같은 파일은 같은 샤드에 배정됩니다.
+"""
+import hashlib
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Tuple
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """
+    'i/N' 형식의 샤드 지정을 해석합니다 (i는 1부터 N까지).
+
+    Returns:
+        (0부터 시작하는 샤드 번호, 샤드 수)
+    """
+    index, sep, count = spec.partition('/')
+    try:
+        index_value, count_value = int(index), int(count)
+    except ValueError:
+        raise ValueError(f"샤드는 'i/N' 형식이어야 합니다: {spec}")
+    if not sep or count_value < 1 or not 1 <= index_value <= count_value:
+        raise ValueError(f"샤드 번호는 1부터 N 사이여야 합니다: {spec}")
+    return index_value - 1, count_value
+
+
+def shard_of(file_path: str, shard_count: int, base_dir: Optional[str] = None) -> int:
+    """
+    파일이 배정되는 샤드 번호(0부터)를 반환합니다.
+
+    Args:
+        file_path: 파일 경로
+        shard_count: 샤드 수
+        base_dir: 상대 경로의 기준 디렉토리 (None이면 경로를 그대로 사용)
+    """
+    path = Path(file_path)
+    if base_dir is not None:
+        try:
+            path = path.relative_to(base_dir)
+        except ValueError:
+            pass
+    digest = hashlib.md5(path.as_posix().encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') % shard_count
+
+
+def select_shard(
+    file_paths: Iterable[str],
+    shard_index: int,
+    shard_count: int,
+    base_dir: Optional[str] = None
+) -> Iterator[str]:
+    """
+    지정한 샤드에 배정된 파일만 골라냅니다.
+
+    Args:
+        file_paths: 파일 경로 목록
+        shard_index: 0부터 시작하는 샤드 번호
+        shard_count: 샤드 수
+        base_dir: 상대 경로의 기준 디렉토리
+
+    Returns:
+        해당 샤드의 파일 경로 (입력 순서 유지)
+    """
+    for file_path in file_paths:
+        if shard_of(file_path, shard_count, base_dir) == shard_index:
+            yield file_path
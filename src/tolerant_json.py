@@ -0,0 +1,146 @@
+"""관대한 JSON 파싱 모듈
+
+손으로 편집한 WireMock 매핑 파일에 흔한 다음 형식 오류를 고쳐 파싱합니다.
+
+- 파일 앞의 UTF-8 BOM
+- ``//``, ``/* */`` 주석
+- 객체/배열 끝의 쉼표 (trailing comma)
+- 여러 JSON 문서를 이어 붙인 파일 (concatenated documents)
+
+고쳐도 파싱할 수 없는 파일은 텍스트에서 ``"키": 값`` 쌍을 찾아 키 기반으로
+식별할 수 있도록 iter_scalar_pairs를 제공합니다.
+"""
+import json
+import re
+from typing import Any, Iterator, List, Tuple, Union
+
+
+# 고친 오류 분류
+FIX_BOM = 'bom'
+FIX_COMMENTS = 'comments'
+FIX_TRAILING_COMMAS = 'trailing_commas'
+FIX_CONCATENATED = 'concatenated'
+FIX_ENCODING = 'encoding'
+FIX_TEXT_FALLBACK = 'text_fallback'
+
+_BOM = '\ufeff'
+
+# 문자열 리터럴은 그대로 두고 주석만 찾기 위해 문자열을 먼저 일치시킴
+_COMMENT = re.compile(r'"(?:[^"\\]|\\.)*"|//[^\n]*|/\*.*?\*/', re.S)
+_TRAILING_COMMA = re.compile(r'"(?:[^"\\]|\\.)*"|,(?=\s*[\]}])', re.S)
+
+# 한 줄 안의 "키": "값" 또는 "키": 따옴표 없는 값 (숫자 등) 쌍
+_SCALAR_PAIR = re.compile(
+    r'"((?:[^"\\\n]|\\.)*)"\s*:\s*'
+    r'(?:"((?:[^"\\\n]|\\.)*)"|([^\s"\[\]{},:]+))'
+)
+
+# 개인정보가 될 수 없는 따옴표 없는 값
+_LITERALS = frozenset(['true', 'false', 'null'])
+
+_WHITESPACE = re.compile(r'\s*')
+_DECODER = json.JSONDecoder()
+
+
+def _strip_comment(match: re.Match) -> str:
+    token = match.group()
+    if token[0] == '"':
+        return token
+    # 블록 주석은 앞뒤 토큰이 붙지 않도록 공백으로 바꿈
+    return ' ' if token[:2] == '/*' else ''
+
+
+def _strip_trailing_comma(match: re.Match) -> str:
+    token = match.group()
+    return token if token[0] == '"' else ''
+
+
+def _decode_all(text: str) -> List[Any]:
+    """공백으로 구분되었거나 바로 이어 붙은 JSON 문서를 모두 파싱합니다."""
+    documents = []
+    position = _WHITESPACE.match(text).end()
+    while position < len(text):
+        document, position = _DECODER.raw_decode(text, position)
+        documents.append(document)
+        position = _WHITESPACE.match(text, position).end()
+    if not documents:
+        raise ValueError("JSON 문서가 없습니다")
+    return documents
+
+
+def parse_tolerant(text: str) -> Tuple[List[Any], List[str]]:
+    """
+    흔한 형식 오류를 고쳐 JSON 텍스트를 파싱합니다.
+
+    Args:
+        text: JSON 텍스트
+
+    Returns:
+        (파싱된 문서 리스트, 고친 오류 분류 리스트)
+
+    Raises:
+        ValueError: 고쳐도 파싱할 수 없는 경우
+    """
+    fixes = []
+    if text.startswith(_BOM):
+        text = text[1:]
+        fixes.append(FIX_BOM)
+
+    try:
+        return [json.loads(text)], fixes
+    except ValueError:
+        pass
+
+    cleaned = _COMMENT.sub(_strip_comment, text)
+    if cleaned != text:
+        fixes.append(FIX_COMMENTS)
+    without_commas = _TRAILING_COMMA.sub(_strip_trailing_comma, cleaned)
+    if without_commas != cleaned:
+        fixes.append(FIX_TRAILING_COMMAS)
+
+    documents = _decode_all(without_commas)
+    if len(documents) > 1:
+        fixes.append(FIX_CONCATENATED)
+    return documents, fixes
+
+
+def iter_scalar_pairs(
+    text: str
+) -> Iterator[Tuple[str, Union[str, int, float], int, int, bool]]:
+    """
+    파싱할 수 없는 텍스트에서 ``"키": 값`` 형태의 스칼라 쌍을 찾습니다.
+
+    값은 문자열뿐 아니라 따옴표 없는 숫자(예: 손으로 입력한 주민등록번호,
+    전화번호)와 그 밖의 따옴표 없는 토큰도 포함합니다. 숫자로 파싱되는 토큰은
+    정상 JSON을 파싱했을 때와 같도록 int/float로, 나머지는 문자열로 반환하며
+    true/false/null은 건너뜁니다.
+
+    Args:
+        text: 검사할 텍스트
+
+    Returns:
+        (키, 값, 값 시작 위치, 값 끝 위치, 따옴표 여부) 이터레이터 (문자열 값의
+        위치는 따옴표 안쪽 기준, 이스케이프를 해석할 수 없는 쌍은 건너뜀)
+    """
+    for match in _SCALAR_PAIR.finditer(text):
+        try:
+            key = json.loads(f'"{match.group(1)}"')
+        except ValueError:
+            continue
+
+        if match.group(2) is not None:
+            try:
+                value = json.loads(f'"{match.group(2)}"')
+            except ValueError:
+                continue
+            yield key, value, match.start(2), match.end(2), True
+            continue
+
+        token = match.group(3)
+        if token in _LITERALS:
+            continue
+        try:
+            value = json.loads(token)
+        except ValueError:
+            value = token
+        yield key, value, match.start(3), match.end(3), False
@@ -0,0 +1,142 @@
+"""로컬 HTTP 익명화 서비스 테스트"""
+import unittest
+import json
+import http.client
+import socket
+import urllib.request
+import urllib.error
+
+from src.identifier.personal_info_identifier import PersonalInfoIdentifier
+from src.generator.virtual_data_generator import VirtualDataGenerator
+from src.replacer.personal_info_replacer import PersonalInfoReplacer
+from src.anonymization_server import AnonymizationServer
+
+
+class TestAnonymizationServer(unittest.TestCase):
+    """AnonymizationServer 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        patterns = [
+            {
+                'keys': ['^name$'],
+                'type': 'name',
+                'pattern': '^[가-힣]{2,4}$'
+            },
+            {
+                'keys': ['^phone$'],
+                'type': 'phone',
+                'pattern': '^01[0-9]-\\d{3,4}-\\d{4}$'
+            }
+        ]
+        identifier = PersonalInfoIdentifier(patterns)
+        self.replacer = PersonalInfoReplacer(identifier, VirtualDataGenerator())
+        self.server = AnonymizationServer(self.replacer, port=0, workers=2)
+        self.server.start()
+        host, port = self.server.address
+        self.base_url = f"http://{host}:{port}"
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.server.shutdown()
+
+    def _request(self, path: str, payload=None):
+        data = None
+        if payload is not None:
+            data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        request = urllib.request.Request(self.base_url + path, data=data)
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return json.loads(response.read())
+
+    def test_anonymize_single_document(self):
+        """단일 문서 익명화 테스트"""
+        result = self._request('/anonymize', {'name': '홍길동', 'age': 30})
+
+        self.assertNotEqual(result['name'], '홍길동')
+        self.assertEqual(result['age'], 30)
+
+    def test_batch_shares_replacement_map(self):
+        """배치 요청과 개별 요청이 같은 치환 매핑을 공유하는지 테스트"""
+        single = self._request('/anonymize', {'phone': '010-1234-5678'})
+        batch = self._request('/anonymize/batch', [
+            {'phone': '010-1234-5678'},
+            {'name': '홍길동'},
+            {'phone': '010-1234-5678'}
+        ])
+
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(batch[0]['phone'], single['phone'])
+        self.assertEqual(batch[2]['phone'], single['phone'])
+        self.assertNotEqual(batch[1]['name'], '홍길동')
+
+    def test_invalid_request(self):
+        """JSON 객체가 아닌 요청은 400을 반환하는지 테스트"""
+        with self.assertRaises(urllib.error.HTTPError) as ctx:
+            self._request('/anonymize', ['not', 'an', 'object'])
+        self.assertEqual(ctx.exception.code, 400)
+
+    def test_negative_content_length(self):
+        """음수 Content-Length는 본문을 기다리지 않고 400을 반환하는지 테스트"""
+        host, port = self.server.address
+        connection = http.client.HTTPConnection(host, port, timeout=5)
+        try:
+            connection.putrequest('POST', '/anonymize')
+            connection.putheader('Content-Length', '-1')
+            connection.endheaders()
+            response = connection.getresponse()
+            self.assertEqual(response.status, 400)
+        finally:
+            connection.close()
+
+    def test_oversized_body_closes_connection(self):
+        """너무 큰 본문은 413을 반환하고, 읽지 않은 본문을 다음 요청으로 처리하지 않는지 테스트"""
+        self.server.max_body_size = 64
+        # 본문 안에 완전한 두 번째 요청을 넣어, 연결을 재사용하면 응답이 하나 더 오게 함
+        inner = json.dumps({'name': '홍길동'}).encode('utf-8')
+        smuggled = (
+            b"POST /anonymize HTTP/1.1\r\nHost: localhost\r\n"
+            b"Content-Length: " + str(len(inner)).encode() + b"\r\n\r\n" + inner
+        )
+        body = smuggled.ljust(200, b' ')
+        request = (
+            b"POST /anonymize HTTP/1.1\r\nHost: localhost\r\n"
+            b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+        )
+
+        with socket.create_connection(self.server.address, timeout=5) as sock:
+            sock.sendall(request)
+            received = b''
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                received += chunk
+
+        self.assertTrue(received.startswith(b'HTTP/1.1 413'))
+        self.assertEqual(received.count(b'HTTP/1.1 '), 1)
+
+    def test_internal_error(self):
+        """요청 형식과 무관한 처리 오류는 500을 반환하는지 테스트"""
+        def fail(document):
+            raise RuntimeError('replacer failure')
+
+        self.server.anonymize_document = fail
+        with self.assertRaises(urllib.error.HTTPError) as ctx:
+            self._request('/anonymize', {'name': '홍길동'})
+        self.assertEqual(ctx.exception.code, 500)
+        self.assertEqual(self.server.metrics.snapshot()['errors'], 1)
+
+    def test_metrics(self):
+        """처리량 및 지연시간 통계 테스트"""
+        self._request('/anonymize', {'name': '홍길동'})
+        self._request('/anonymize/batch', [{'name': '김철수'}, {'name': '이영희'}])
+
+        metrics = self._request('/metrics')
+        self.assertEqual(metrics['requests'], 2)
+        self.assertEqual(metrics['documents'], 3)
+        self.assertEqual(metrics['errors'], 0)
+        self.assertEqual(sum(metrics['latency_histogram'].values()), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+"""감사 인덱스 테스트"""
+import unittest
+import tempfile
+from pathlib import Path
+
+from src.audit_index import AuditIndex
+
+
+class TestAuditIndex(unittest.TestCase):
+    """AuditIndex 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = str(Path(self.temp_dir.name) / 'audit.db')
+        self.index = AuditIndex(self.db_path)
+
+    def tearDown(self):
+        """인덱스 정리"""
+        self.index.close()
+        self.temp_dir.cleanup()
+
+    def test_find_originals(self):
+        """치환값 -> 원본 조회 테스트"""
+        self.index.record_file('a.json', [
+            {'type': 'name', 'original': '홍길동', 'replacement': '테스트개인1'},
+            {'type': 'phone', 'original': '010-1234-5678', 'replacement': '010-0000-1111'}
+        ])
+
+        entries = self.index.find_originals('테스트개인1')
+        self.assertEqual(entries, [
+            {'type': 'name', 'original': '홍길동', 'replacement': '테스트개인1'}
+        ])
+        self.assertEqual(self.index.find_originals('없는값'), [])
+
+    def test_find_files(self):
+        """원본 -> 파일 조회 테스트"""
+        entry = {'type': 'name', 'original': '홍길동', 'replacement': '테스트개인1'}
+        self.index.record_file('b.json', [entry])
+        self.index.record_file('a.json', [entry])
+        self.index.record_file('a.json', [entry])
+        self.index.record_file('c.json', [
+            {'type': 'company_name', 'original': '홍길동', 'replacement': '테스트법인1'}
+        ])
+
+        self.assertEqual(self.index.find_files('홍길동', 'name'), ['a.json', 'b.json'])
+        self.assertEqual(self.index.find_files('홍길동'), ['a.json', 'b.json', 'c.json'])
+        self.assertEqual(self.index.stats(), {'replacements': 2, 'files': 3, 'postings': 3})
+
+    def test_persistent(self):
+        """다시 열어도 기록이 유지되는지 테스트"""
+        self.index.record_file('a.json', [
+            {'type': 'name', 'original': '홍길동', 'replacement': '테스트개인1'}
+        ])
+        self.index.close()
+
+        self.index = AuditIndex(self.db_path)
+        self.assertEqual(self.index.find_files('홍길동'), ['a.json'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,184 @@
+"""체크포인트 저널 테스트"""
+import unittest
+import tempfile
+import json
+import shutil
+from pathlib import Path
+from unittest import mock
+
+import yaml
+
+from src import json_io
+from src.checkpoint import CheckpointJournal, read_checkpoint
+from src.scenario_processor import ScenarioProcessor
+
+
+class TestCheckpoint(unittest.TestCase):
+    """CheckpointJournal 및 재개 처리 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.config_path = self.temp_dir / 'patterns.yaml'
+        self.config_path.write_text(yaml.dump({
+            'personal_info_patterns': [
+                {
+                    'keys': ['^name$'],
+                    'type': 'name',
+                    'pattern': '^[가-힣]{2,4}$'
+                }
+            ]
+        }, allow_unicode=True), encoding='utf-8')
+
+        self.input_dir = self.temp_dir / 'in'
+        self.input_dir.mkdir()
+        self.files = []
+        for index, name in enumerate(['홍길동', '김철수', '이영희', '박민수']):
+            path = self.input_dir / f'{index}.json'
+            path.write_text(json.dumps({'name': name}, ensure_ascii=False), encoding='utf-8')
+            self.files.append(str(path))
+        self.journal_path = str(self.temp_dir / 'checkpoint.jsonl')
+
+    def tearDown(self):
+        """임시 디렉토리 정리"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_truncated_record_ignored(self):
+        """잘린 마지막 레코드를 무시하고 이어 쓰는지 테스트"""
+        entry = {'type': 'name', 'original': '홍길동', 'replacement': '테스트개인1'}
+        with CheckpointJournal(self.journal_path) as journal:
+            journal.record({'input': 'a.json', 'output': 'a.json', 'status': 'success'}, [entry])
+        with open(self.journal_path, 'a', encoding='utf-8') as f:
+            f.write('{"result": {"input": "b.js')
+
+        completed, replacement_map = read_checkpoint(self.journal_path)
+        self.assertEqual(list(completed), ['a.json'])
+        self.assertEqual(replacement_map, {'name:홍길동': entry})
+
+        with CheckpointJournal(self.journal_path, resume=True) as journal:
+            journal.record({'input': 'c.json', 'output': 'c.json', 'status': 'success'}, [])
+        completed, _ = read_checkpoint(self.journal_path)
+        self.assertEqual(sorted(completed), ['a.json', 'c.json'])
+
+    def test_resume_after_failure(self):
+        """중단 후 재개 시 같은 매핑으로 남은 파일만 처리하는지 테스트"""
+        def interrupted():
+            yield from self.files[:2]
+            raise RuntimeError('중단')
+
+        first = ScenarioProcessor(str(self.config_path))
+        with self.assertRaises(RuntimeError):
+            first.process_scenario(
+                interrupted(),
+                str(self.temp_dir / 'out'),
+                base_dir=str(self.input_dir),
+                checkpoint=self.journal_path
+            )
+
+        resumed = ScenarioProcessor(str(self.config_path))
+        results = resumed.process_scenario(
+            self.files,
+            str(self.temp_dir / 'out'),
+            base_dir=str(self.input_dir),
+            checkpoint=self.journal_path,
+            resume=True
+        )
+        self.assertEqual(results['resumed'], 2)
+        self.assertEqual(len(results['processed_files']), 4)
+
+        uninterrupted = ScenarioProcessor(str(self.config_path))
+        expected = uninterrupted.process_scenario(
+            self.files,
+            str(self.temp_dir / 'expected'),
+            base_dir=str(self.input_dir)
+        )
+        self.assertEqual(results['replacement_map'], expected['replacement_map'])
+        for index in range(4):
+            self.assertEqual(
+                (self.temp_dir / 'out' / f'{index}.json').read_bytes(),
+                (self.temp_dir / 'expected' / f'{index}.json').read_bytes()
+            )
+
+        completed, _ = read_checkpoint(self.journal_path)
+        self.assertEqual(sorted(completed), [f'{index}.json' for index in range(4)])
+
+    def test_resume_matches_normalized_paths(self):
+        """재개 시 다른 형태의 경로로 지정한 같은 파일을 건너뛰는지 테스트"""
+        first = ScenarioProcessor(str(self.config_path))
+        first.process_scenario(
+            self.files[:2],
+            str(self.temp_dir / 'out'),
+            base_dir=str(self.input_dir),
+            checkpoint=self.journal_path
+        )
+
+        # 같은 입력 디렉토리를 '..'이 포함된 경로로 지정
+        other_base = self.input_dir / '..' / 'in'
+        resumed = ScenarioProcessor(str(self.config_path))
+        results = resumed.process_scenario(
+            [str(other_base / Path(path).name) for path in self.files],
+            str(self.temp_dir / 'out'),
+            base_dir=str(other_base),
+            checkpoint=self.journal_path,
+            resume=True
+        )
+        self.assertEqual(results['resumed'], 2)
+        self.assertEqual(len(results['processed_files']), 4)
+
+    def test_in_place_syncs_every_record(self):
+        """원본을 덮어쓰는 경우 레코드마다 fsync하는지 테스트"""
+        processor = ScenarioProcessor(str(self.config_path))
+        with mock.patch.object(
+            CheckpointJournal,
+            'sync',
+            autospec=True,
+            side_effect=CheckpointJournal.sync
+        ) as sync:
+            processor.process_scenario(
+                self.files,
+                base_dir=str(self.input_dir),
+                checkpoint=self.journal_path
+            )
+
+        self.assertEqual(sync.call_count, len(self.files))
+
+    def test_in_place_fsyncs_output_before_record(self):
+        """원본을 덮어쓰는 경우 --durability none이어도 파일을 fsync한 뒤 완료로 기록하는지 테스트"""
+        events = []
+        fsync_path = json_io._fsync_path
+        record = CheckpointJournal.record
+
+        def track_fsync(path, directory=False):
+            if not directory:
+                events.append(('fsync', Path(path).name))
+            return fsync_path(path, directory)
+
+        def track_record(journal, result, entries, key=None):
+            events.append(('record', Path(result['input']).name))
+            return record(journal, result, entries, key)
+
+        processor = ScenarioProcessor(str(self.config_path))
+        self.assertEqual(processor.replacer.durability, 'none')
+        with mock.patch.object(json_io, '_fsync_path', side_effect=track_fsync), \
+                mock.patch.object(CheckpointJournal, 'record', autospec=True, side_effect=track_record):
+            processor.process_scenario(
+                self.files,
+                base_dir=str(self.input_dir),
+                checkpoint=self.journal_path
+            )
+
+        for path in self.files:
+            name = Path(path).name
+            recorded = events.index(('record', name))
+            synced = [
+                index for index, (kind, target) in enumerate(events)
+                if kind == 'fsync' and target.startswith(f'.{name}.')
+            ]
+            self.assertTrue(synced)
+            self.assertLess(synced[0], recorded)
+        # 설정한 내구성 모드는 처리 후 그대로
+        self.assertEqual(processor.replacer.durability, 'none')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -50,6 +50,28 @@ class TestConfigLoader(unittest.TestCase):
         finally:
             os.unlink(temp_path)
     
+    def test_get_setting(self):
+        """패턴 외 최상위 설정 항목 조회 테스트"""
+        config = dict(self.test_patterns)
+        config['path_templates'] = ['/api/user/{phone}']
+        
+        with tempfile.NamedTemporaryFile(
+            mode='w',
+            suffix='.yaml',
+            delete=False,
+            encoding='utf-8'
+        ) as f:
+            yaml.dump(config, f, allow_unicode=True)
+            temp_path = f.name
+        
+        try:
+            loader = ConfigLoader(temp_path)
+            self.assertEqual(loader.get_setting('path_templates'), ['/api/user/{phone}'])
+            self.assertEqual(loader.get_setting('missing', []), [])
+            self.assertEqual(len(loader.get_patterns()), 2)
+        finally:
+            os.unlink(temp_path)
+    
     def test_load_json_config(self):
         """JSON 설정 파일 로드 테스트"""
         with tempfile.NamedTemporaryFile(
@@ -0,0 +1,96 @@
+"""디렉토리 탐색 테스트"""
+import unittest
+import tempfile
+from pathlib import Path
+
+from src.file_walker import walk_files, DEFAULT_EXCLUDE
+
+
+class TestFileWalker(unittest.TestCase):
+    """walk_files 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 디렉토리 구성"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        for rel_path in (
+            'a.json',
+            'notes.txt',
+            'mappings/b.json',
+            'mappings/c.ndjson',
+            'mappings/deep/d.json',
+            'mappings/deep/deeper/e.json',
+            '.git/objects/f.json',
+            'node_modules/pkg/g.json',
+            'fixtures/h.json',
+        ):
+            path = self.root / rel_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text('{}', encoding='utf-8')
+
+    def tearDown(self):
+        """임시 디렉토리 정리"""
+        self.temp_dir.cleanup()
+
+    def _walk(self, **kwargs):
+        return [
+            Path(path).relative_to(self.root).as_posix()
+            for path in walk_files(str(self.root), **kwargs)
+        ]
+
+    def test_default_walk(self):
+        """기본 탐색 테스트 (.git, node_modules 제외, 순서 고정)"""
+        self.assertEqual(self._walk(), [
+            'a.json',
+            'fixtures/h.json',
+            'mappings/b.json',
+            'mappings/c.ndjson',
+            'mappings/deep/d.json',
+            'mappings/deep/deeper/e.json',
+        ])
+        self.assertEqual(self._walk(workers=1), self._walk(workers=8))
+
+    def test_include_exclude(self):
+        """include/exclude glob 테스트"""
+        self.assertEqual(
+            self._walk(include=['*.ndjson', 'fixtures/*']),
+            ['fixtures/h.json', 'mappings/c.ndjson']
+        )
+        self.assertEqual(
+            self._walk(exclude=DEFAULT_EXCLUDE + ('deep', 'fixtures')),
+            ['a.json', 'mappings/b.json', 'mappings/c.ndjson']
+        )
+
+    def test_exclude_paths(self):
+        """exclude_paths는 상대 경로 전체가 같은 항목만 건너뛰는지 테스트"""
+        self.assertEqual(
+            self._walk(exclude_paths=['mappings/deep']),
+            ['a.json', 'fixtures/h.json', 'mappings/b.json', 'mappings/c.ndjson']
+        )
+        # 이름만 같은 최상위 항목이나 glob 문자는 일치로 보지 않음
+        self.assertEqual(len(self._walk(exclude_paths=['deep', 'mappings/*'])), 6)
+        self.assertEqual(
+            self._walk(exclude_paths=['mappings/b.json']),
+            [
+                'a.json',
+                'fixtures/h.json',
+                'mappings/c.ndjson',
+                'mappings/deep/d.json',
+                'mappings/deep/deeper/e.json',
+            ]
+        )
+
+    def test_max_depth(self):
+        """최대 깊이 테스트"""
+        self.assertEqual(self._walk(max_depth=0), ['a.json'])
+        self.assertEqual(len(self._walk(max_depth=2)), 5)
+
+    def test_streaming(self):
+        """전체 탐색 전에 첫 파일을 내보내는지 테스트"""
+        iterator = walk_files(str(self.root))
+        self.assertTrue(next(iterator).endswith('a.json'))
+        iterator.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
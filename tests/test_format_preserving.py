@@ -0,0 +1,52 @@
+"""형식 보존 생성 테스트"""
+import unittest
+import random
+
+from src.generator.format_preserving import compile_shape, preserve_format, shape_of
+from src.generator.virtual_data_generator import VirtualDataGenerator
+
+
+class TestFormatPreserving(unittest.TestCase):
+    """format_preserving 모듈 테스트 클래스"""
+
+    def test_shape_of(self):
+        """형태 문자열 테스트"""
+        self.assertEqual(shape_of('010-1234-5678'), '999-9999-9999')
+        self.assertEqual(shape_of('Ab 1_가'), 'Aa 9_가')
+
+    def test_template_cached_per_shape(self):
+        """같은 형태는 같은 템플릿을 재사용하는지 테스트"""
+        self.assertIs(compile_shape('999-9999'), compile_shape('999-9999'))
+
+    def test_preserve_format(self):
+        """구분자, 길이, 대소문자 보존 테스트"""
+        self.assertEqual(preserve_format('01012345678', '532-1234-5678'), '53212345678')
+        self.assertEqual(preserve_format('010.1234.5678', '532-1234-5678'), '532.1234.5678')
+        self.assertEqual(preserve_format('m1234', 'XX9876543'), 'x9876')
+
+    def test_missing_characters_are_deterministic(self):
+        """모자란 자리를 난수 생성기로 결정적으로 채우는지 테스트"""
+        first = preserve_format('1234-5678-9012', '1', random.Random(7))
+        second = preserve_format('1234-5678-9012', '1', random.Random(7))
+
+        self.assertEqual(first, second)
+        self.assertRegex(first, r'^1\d{3}-\d{4}-\d{4}$')
+
+    def test_no_slots_returns_candidate(self):
+        """채울 자리가 없는 원본은 생성된 값을 그대로 사용하는지 테스트"""
+        self.assertEqual(preserve_format('---', '532-1234'), '532-1234')
+
+    def test_generator_preserves_format(self):
+        """생성기의 형식 보존 테스트"""
+        generator = VirtualDataGenerator()
+
+        self.assertRegex(generator.generate('phone', '01012345678'), r'^\d{11}$')
+        self.assertRegex(generator.generate('account_number', '123-456789-01'), r'^\d{3}-\d{6}-\d{2}$')
+        self.assertRegex(generator.generate('passport', 'm12345678'), r'^[a-z]\d{8}$')
+
+        generator = VirtualDataGenerator(format_preserving=False)
+        self.assertRegex(generator.generate('phone', '01012345678'), r'^\d{3}-\d{4}-\d{4}$')
+
+
+if __name__ == '__main__':
+    unittest.main()
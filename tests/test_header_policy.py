@@ -0,0 +1,97 @@
+"""HTTP 헤더 처리 정책 테스트"""
+import unittest
+
+from src.identifier.personal_info_identifier import PersonalInfoIdentifier
+from src.generator.virtual_data_generator import VirtualDataGenerator
+from src.replacer.personal_info_replacer import PersonalInfoReplacer
+from src.replacer.header_policy import (
+    HeaderPolicy,
+    HEADER_ALLOW,
+    HEADER_DENY,
+    HEADER_COOKIE,
+    HEADER_FORWARDED,
+)
+
+
+class TestHeaderPolicy(unittest.TestCase):
+    """HeaderPolicy 및 헤더 치환 테스트 클래스"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        patterns = [
+            {
+                'keys': ['^name$', '.*name.*'],
+                'type': 'name',
+                'pattern': '^[가-힣]{2,4}$|^[A-Za-z\\s]{2,30}$'
+            },
+            {
+                'keys': ['^phone$', '.*phone.*'],
+                'type': 'phone',
+                'pattern': '^01[0-9]-\\d{3,4}-\\d{4}$'
+            }
+        ]
+        self.policy = HeaderPolicy(allow=['X-Trace'], deny=['X-Api-Key'])
+        self.replacer = PersonalInfoReplacer(
+            PersonalInfoIdentifier(patterns),
+            VirtualDataGenerator(),
+            header_policy=self.policy
+        )
+    
+    def test_classify_case_insensitive(self):
+        """헤더 이름 분류 테스트 (대소문자 무시)"""
+        self.assertEqual(self.policy.classify('Content-Type'), HEADER_ALLOW)
+        self.assertEqual(self.policy.classify('x-trace'), HEADER_ALLOW)
+        self.assertEqual(self.policy.classify('X-API-KEY'), HEADER_DENY)
+        self.assertEqual(self.policy.classify('Cookie'), HEADER_COOKIE)
+        self.assertEqual(self.policy.classify('X-Forwarded-For'), HEADER_FORWARDED)
+        self.assertIsNone(self.policy.classify('X-User-Name'))
+    
+    def test_replace_headers(self):
+        """헤더 정책에 따른 치환 테스트"""
+        result = self.replacer._replace_in_dict({
+            'headers': {
+                'Content-Type': 'application/json',
+                'X-User-Name': '홍길동',
+                'X-Api-Key': 'secret-key-123',
+                'Cookie': 'session=abc; name=홍길동; phone=010-1234-5678',
+                'X-Forwarded-For': '203.0.113.7, 10.0.0.1, unknown'
+            }
+        })
+        headers = result['headers']
+        
+        self.assertEqual(headers['Content-Type'], 'application/json')
+        self.assertNotEqual(headers['X-User-Name'], '홍길동')
+        self.assertNotEqual(headers['X-Api-Key'], 'secret-key-123')
+        
+        cookie = headers['Cookie']
+        self.assertTrue(cookie.startswith('session=abc; name='))
+        self.assertIn(f"name={headers['X-User-Name']}", cookie)
+        self.assertNotIn('010-1234-5678', cookie)
+        
+        forwarded = [part.strip() for part in headers['X-Forwarded-For'].split(',')]
+        self.assertEqual(len(forwarded), 3)
+        self.assertNotIn('203.0.113.7', forwarded)
+        self.assertNotIn('10.0.0.1', forwarded)
+        self.assertEqual(forwarded[2], 'unknown')
+
+    
+    def test_deny_header_uses_header_generator(self):
+        """deny 헤더가 원본과 같은 형식의 불투명 토큰으로 치환되는지 테스트"""
+        first = self.replacer._replace_in_dict({
+            'headers': {'X-Api-Key': 'sk_live_4f9A2b71', 'Authorization': 'Bearer abc.DEF-123'}
+        })['headers']
+        second = self.replacer._replace_in_dict({'headers': {'x-api-key': 'sk_live_4f9A2b71'}})['headers']
+        
+        token = first['X-Api-Key']
+        self.assertNotEqual(token, 'sk_live_4f9A2b71')
+        self.assertRegex(token, r'^[a-z]{2}_[a-z]{4}_[0-9][a-z][0-9][A-Z][0-9][a-z][0-9]{2}$')
+        self.assertNotIn('테스트값', token)
+        self.assertEqual(second['x-api-key'], token)
+        self.assertEqual(
+            self.replacer.get_replacement_map()['header:sk_live_4f9A2b71']['replacement'],
+            token
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
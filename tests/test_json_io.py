@@ -0,0 +1,105 @@
+"""JSON 파일 입출력 모듈 테스트"""
+import unittest
+import tempfile
+import json
+import os
+from pathlib import Path
+from unittest import mock
+
+from src.json_io import (
+    load_json_file,
+    dump_json_file,
+    DurableWriteBatch,
+    DURABILITY_FILE,
+    DURABILITY_BATCH,
+)
+
+
+class TestJsonIO(unittest.TestCase):
+    """json_io 모듈 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.data = {
+            'name': '홍길동',
+            'items': [{'phone': '010-1234-5678'}, {'age': 30}]
+        }
+        self.path = Path(self.temp_dir) / 'data.json'
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, ensure_ascii=False)
+
+    def tearDown(self):
+        """테스트 정리"""
+        for name in os.listdir(self.temp_dir):
+            os.unlink(os.path.join(self.temp_dir, name))
+        os.rmdir(self.temp_dir)
+
+    def test_load_with_mmap(self):
+        """임계값 이상인 파일은 메모리 매핑 경로로 읽는지 테스트"""
+        self.assertEqual(load_json_file(self.path, mmap_threshold=1), self.data)
+
+    def test_load_without_mmap(self):
+        """임계값 미만이거나 비활성화된 경우 일반 경로로 읽는지 테스트"""
+        self.assertEqual(load_json_file(self.path, mmap_threshold=None), self.data)
+        self.assertEqual(
+            load_json_file(self.path, mmap_threshold=10 * 1024 * 1024),
+            self.data
+        )
+
+    def test_load_opens_file_once(self):
+        """크기 확인과 읽기에 파일을 한 번만 여는지 테스트"""
+        for threshold in (1, None, 10 * 1024 * 1024):
+            with mock.patch('builtins.open', wraps=open) as opened:
+                self.assertEqual(load_json_file(self.path, mmap_threshold=threshold), self.data)
+            self.assertEqual(opened.call_count, 1)
+
+    def test_dump_overwrites_atomically(self):
+        """덮어쓰기 후 임시 파일이 남지 않고 권한이 유지되는지 테스트"""
+        os.chmod(self.path, 0o640)
+        dump_json_file({'name': '테스트개인1'}, self.path, DURABILITY_FILE)
+
+        self.assertEqual(load_json_file(self.path), {'name': '테스트개인1'})
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o640)
+        self.assertEqual(os.listdir(self.temp_dir), ['data.json'])
+
+    def test_failed_dump_keeps_original(self):
+        """직렬화에 실패하면 원본 파일이 그대로 유지되는지 테스트"""
+        with self.assertRaises(TypeError):
+            dump_json_file({'value': object()}, self.path)
+
+        self.assertEqual(load_json_file(self.path), self.data)
+        self.assertEqual(os.listdir(self.temp_dir), ['data.json'])
+
+    def test_new_file_mode_follows_umask(self):
+        """새 출력 파일에 현재 umask가 적용되는지 테스트"""
+        output = Path(self.temp_dir) / 'output.json'
+        previous = os.umask(0o027)
+        try:
+            dump_json_file(self.data, output)
+        finally:
+            os.umask(previous)
+
+        self.assertEqual(os.stat(output).st_mode & 0o777, 0o640)
+
+    def test_batch_durability(self):
+        """batch 모드에서 파일 내용과 디렉토리 fsync가 모두 flush 시점까지 미뤄지는지 테스트"""
+        batch = DurableWriteBatch()
+        outputs = [Path(self.temp_dir) / f'output_{i}.json' for i in range(3)]
+        with mock.patch('src.json_io.os.fsync') as fsync:
+            for output in outputs:
+                dump_json_file(self.data, output, DURABILITY_BATCH, batch)
+                self.assertEqual(load_json_file(output), self.data)
+            self.assertEqual(fsync.call_count, 0)
+
+            self.assertEqual(batch.files, set(outputs))
+            self.assertEqual(batch.directories, {Path(self.temp_dir)})
+            self.assertEqual(batch.flush(), 3)
+            # 파일 3개와 디렉토리 1개
+            self.assertEqual(fsync.call_count, 4)
+        self.assertEqual(len(batch.files), 0)
+        self.assertEqual(len(batch.directories), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
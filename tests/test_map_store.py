@@ -0,0 +1,151 @@
+"""치환 매핑 저장/불러오기 테스트"""
+import unittest
+import json
+import tempfile
+from pathlib import Path
+
+from src.identifier.personal_info_identifier import PersonalInfoIdentifier
+from src.generator.virtual_data_generator import VirtualDataGenerator
+from src.replacer.personal_info_replacer import PersonalInfoReplacer
+from src.replacer.map_store import (
+    ReplacementMapFile,
+    export_replacement_map,
+    load_replacement_map,
+    merge_replacement_maps
+)
+
+
+class TestMapStore(unittest.TestCase):
+    """map_store 모듈 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.replacement_map = {
+            'name:홍길동': {'type': 'name', 'original': '홍길동', 'replacement': '테스트개인1'},
+            'name:김철수': {'type': 'name', 'original': '김철수', 'replacement': '테스트개인2'},
+            'phone:010-1234-5678': {
+                'type': 'phone',
+                'original': '010-1234-5678',
+                'replacement': '010-9999-0000'
+            }
+        }
+
+    def tearDown(self):
+        """임시 디렉토리 정리"""
+        self.temp_dir.cleanup()
+
+    def _path(self, name: str) -> str:
+        return str(Path(self.temp_dir.name) / name)
+
+    def test_binary_round_trip(self):
+        """바이너리 형식 저장/불러오기 테스트"""
+        path = self._path('map.bin')
+        export_replacement_map(self.replacement_map, path)
+
+        self.assertEqual(load_replacement_map(path), self.replacement_map)
+
+    def test_json_round_trip(self):
+        """JSON 형식 저장/불러오기 테스트"""
+        path = self._path('map.json')
+        export_replacement_map(self.replacement_map, path)
+
+        with open(path, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+        self.assertEqual(len(entries), 3)
+        self.assertEqual(load_replacement_map(path), self.replacement_map)
+
+    def test_export_independent_of_map_order(self):
+        """매핑 순서와 무관하게 같은 파일로 저장되는지 테스트"""
+        reversed_map = dict(reversed(list(self.replacement_map.items())))
+        for suffix in ('json', 'bin'):
+            first, second = self._path(f'a.{suffix}'), self._path(f'b.{suffix}')
+            export_replacement_map(self.replacement_map, first)
+            export_replacement_map(reversed_map, second)
+
+            self.assertEqual(Path(first).read_bytes(), Path(second).read_bytes())
+
+    def test_mapped_lookup(self):
+        """전체를 읽지 않고 개별 항목을 조회하는지 테스트"""
+        path = self._path('map.bin')
+        export_replacement_map(self.replacement_map, path)
+
+        with ReplacementMapFile(path) as map_file:
+            self.assertEqual(len(map_file), 3)
+            self.assertEqual(sorted(map_file.types), ['name', 'phone'])
+            self.assertEqual(map_file.lookup('name', '김철수'), '테스트개인2')
+            self.assertEqual(map_file.lookup('phone', '010-1234-5678'), '010-9999-0000')
+            self.assertIsNone(map_file.lookup('name', '이영희'))
+            self.assertIsNone(map_file.lookup('email', '홍길동'))
+
+    def test_empty_map(self):
+        """빈 치환 매핑 테스트"""
+        path = self._path('empty.bin')
+        export_replacement_map({}, path)
+
+        self.assertEqual(load_replacement_map(path), {})
+
+    def test_invalid_file(self):
+        """형식이 다른 파일 테스트"""
+        path = self._path('invalid.bin')
+        Path(path).write_bytes(b'not a replacement map')
+
+        with self.assertRaises(ValueError):
+            load_replacement_map(path)
+
+    def test_truncated_file(self):
+        """잘린 파일은 struct.error 대신 ValueError로 거부하는지 테스트"""
+        path = self._path('map.bin')
+        export_replacement_map(self.replacement_map, path)
+        data = Path(path).read_bytes()
+
+        truncated = self._path('truncated.bin')
+        for length in range(len(data)):
+            Path(truncated).write_bytes(data[:length])
+            with self.assertRaises(ValueError, msg=f"length={length}"):
+                load_replacement_map(truncated)
+
+    def test_replacer_uses_imported_map(self):
+        """불러온 치환 매핑이 치환에 사용되는지 테스트"""
+        patterns = [
+            {
+                'keys': ['^name$'],
+                'type': 'name',
+                'pattern': '^[가-힣]{2,4}$'
+            }
+        ]
+        replacer = PersonalInfoReplacer(
+            PersonalInfoIdentifier(patterns),
+            VirtualDataGenerator()
+        )
+        replacer.load_replacement_map(self.replacement_map)
+
+        result = replacer._replace_document({'name': '홍길동'})
+        self.assertEqual(result['name'], '테스트개인1')
+
+
+    def test_merge_replacement_maps(self):
+        """샤드별 치환 매핑 병합과 충돌 검사 테스트"""
+        other = {
+            'name:홍길동': {'type': 'name', 'original': '홍길동', 'replacement': '테스트개인1'},
+            'name:이영희': {'type': 'name', 'original': '이영희', 'replacement': '테스트개인3'}
+        }
+        merged, conflicts = merge_replacement_maps([self.replacement_map, other])
+
+        self.assertEqual(conflicts, [])
+        self.assertEqual(len(merged), 4)
+
+        conflicting = {
+            'name:홍길동': {'type': 'name', 'original': '홍길동', 'replacement': '테스트개인9'},
+            'name:박민수': {'type': 'name', 'original': '박민수', 'replacement': '테스트개인2'}
+        }
+        merged, conflicts = merge_replacement_maps([self.replacement_map, conflicting])
+
+        self.assertEqual([c['kind'] for c in conflicts], ['replacement', 'duplicate'])
+        self.assertEqual(merged['name:홍길동']['replacement'], '테스트개인1')
+        # 서로 다른 원본이 같은 치환값을 가져도 두 항목 모두 유지
+        self.assertEqual(merged['name:박민수']['replacement'], '테스트개인2')
+        self.assertEqual(merged['name:김철수']['replacement'], '테스트개인2')
+
+if __name__ == '__main__':
+    unittest.main()
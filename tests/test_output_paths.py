@@ -0,0 +1,94 @@
+"""출력 경로 결정 테스트"""
+import unittest
+import io
+import tempfile
+import unicodedata
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from src.output_paths import OutputPathMapper
+
+
+class TestOutputPathMapper(unittest.TestCase):
+    """OutputPathMapper 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.input_dir = self.root / 'in'
+        self.output_dir = self.root / 'out'
+
+    def tearDown(self):
+        """임시 디렉토리 정리"""
+        self.temp_dir.cleanup()
+
+    def test_relative_path_preserved(self):
+        """상대 경로 유지 및 디렉토리 생성 테스트"""
+        mapper = OutputPathMapper(str(self.output_dir), str(self.input_dir))
+        first = mapper.prepare(str(self.input_dir / 'user' / 'mapping.json'))
+        second = mapper.prepare(str(self.input_dir / 'order' / 'mapping.json'))
+
+        self.assertEqual(first, self.output_dir / 'user' / 'mapping.json')
+        self.assertEqual(second, self.output_dir / 'order' / 'mapping.json')
+        self.assertTrue(first.parent.is_dir())
+        self.assertTrue(second.parent.is_dir())
+
+    def test_collision_detected(self):
+        """파일 이름만 사용할 때 충돌 검출 테스트"""
+        mapper = OutputPathMapper(str(self.output_dir))
+        mapper.prepare(str(self.input_dir / 'user' / 'mapping.json'))
+        # 같은 입력은 충돌이 아님
+        mapper.prepare(str(self.input_dir / 'user' / 'mapping.json'))
+
+        with self.assertRaises(ValueError):
+            mapper.prepare(str(self.input_dir / 'order' / 'mapping.json'))
+
+    def test_case_and_normalization_collision(self):
+        """대소문자를 무시하고 정규화하는 파일 시스템에서는 그 차이만 있는 경로도 충돌로 검출하는지 테스트"""
+        mapper = OutputPathMapper(str(self.output_dir), str(self.input_dir))
+        # macOS/Windows 기본 파일 시스템처럼 동작한다고 가정
+        mapper.case_insensitive = mapper.normalizing = True
+        mapper.prepare(str(self.input_dir / 'User' / 'Mapping.json'))
+
+        with self.assertRaises(ValueError):
+            mapper.prepare(str(self.input_dir / 'user' / 'mapping.json'))
+
+        name = '홍길동.json'
+        mapper.prepare(str(self.input_dir / unicodedata.normalize('NFC', name)))
+        with self.assertRaises(ValueError):
+            mapper.prepare(str(self.input_dir / unicodedata.normalize('NFD', name)))
+
+    def test_case_variants_on_case_sensitive_filesystem(self):
+        """대소문자를 구분하는 파일 시스템에서는 두 파일을 모두 쓰고 경고만 출력하는지 테스트"""
+        mapper = OutputPathMapper(str(self.output_dir), str(self.input_dir))
+        output = io.StringIO()
+        with redirect_stdout(output):
+            first = mapper.prepare(str(self.input_dir / 'User.json'))
+        if mapper.case_insensitive:
+            self.skipTest('출력 파일 시스템이 대소문자를 구분하지 않음')
+
+        with redirect_stdout(output):
+            second = mapper.prepare(str(self.input_dir / 'user.json'))
+        first.write_text('{"a": 1}', encoding='utf-8')
+        second.write_text('{"b": 2}', encoding='utf-8')
+
+        self.assertEqual(first.read_text(encoding='utf-8'), '{"a": 1}')
+        self.assertEqual(second.read_text(encoding='utf-8'), '{"b": 2}')
+        self.assertIn('경고', output.getvalue())
+        self.assertIn('user.json', output.getvalue())
+        # 확인용 임시 파일은 남기지 않음
+        self.assertEqual(sorted(p.name for p in self.output_dir.iterdir()), ['User.json', 'user.json'])
+
+    def test_outside_base_dir_uses_name(self):
+        """기준 디렉토리 밖의 입력은 파일 이름을 사용하는지 테스트"""
+        mapper = OutputPathMapper(str(self.output_dir), str(self.input_dir))
+
+        self.assertEqual(
+            mapper.map(str(self.root / 'other' / 'a.json')),
+            self.output_dir / 'a.json'
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+"""패턴 설정 분석 테스트"""
+import unittest
+import random
+
+from src.pattern_analyzer import PatternAnalyzer, Reservoir, iter_key_values
+
+
+class TestPatternAnalyzer(unittest.TestCase):
+    """PatternAnalyzer 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.patterns = [
+            {
+                'keys': ['^phone$', '.*tel.*'],
+                'type': 'phone',
+                'pattern': '^01[0-9]-\\d{3,4}-\\d{4}$'
+            },
+            {
+                'keys': ['^memo$'],
+                'type': 'memo'
+            }
+        ]
+
+    def test_iter_key_values(self):
+        """(키, 값) 순회 테스트"""
+        data = {'a': 1, 'b': {'c': 'x'}, 'd': [1, {'e': None}, 'y']}
+
+        self.assertEqual(list(iter_key_values(data)), [('a', 1), ('c', 'x'), ('d', 1), ('d', 'y')])
+
+    def test_match_and_rejection_counts(self):
+        """키 일치 횟수와 값 거부율 테스트"""
+        analyzer = PatternAnalyzer(self.patterns)
+        analyzer.analyze_document({
+            'phone': '010-1234-5678',
+            'tel': '010-1111-2222',
+            'hotel': 'Hilton',
+            'title': 'Manager',
+            'memo': 'hello'
+        })
+        report = analyzer.report()
+        rows = {row['key_pattern']: row for row in report['patterns']}
+
+        self.assertEqual(report['pairs'], 5)
+        self.assertEqual(rows['^phone$']['key_matches'], 1)
+        self.assertEqual(rows['.*tel.*']['key_matches'], 2)
+        self.assertEqual(rows['.*tel.*']['value_rejections'], 1)
+        self.assertEqual(rows['.*tel.*']['rejection_rate'], 0.5)
+        self.assertEqual(rows['.*tel.*']['sample_rejected_keys'], ['hotel'])
+        self.assertEqual(rows['^memo$']['sample_matched_keys'], ['memo'])
+        self.assertGreaterEqual(rows['.*tel.*']['time_ms'], 0.0)
+
+    def test_reservoir_is_bounded(self):
+        """저수지 샘플이 크기 제한을 지키며 균등하게 선택되는지 테스트"""
+        reservoir = Reservoir(5, random.Random(0))
+        for i in range(10000):
+            reservoir.add(i)
+
+        self.assertEqual(reservoir.seen, 10000)
+        self.assertEqual(len(reservoir.items), 5)
+        self.assertTrue(any(item >= 5 for item in reservoir.items))
+
+    def test_csv_report(self):
+        """CSV 보고서 테스트"""
+        analyzer = PatternAnalyzer(self.patterns)
+        analyzer.analyze_document({'hotel': 'Hilton'})
+
+        lines = analyzer.report_csv().splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertIn('hotel', lines[2])
+
+
+if __name__ == '__main__':
+    unittest.main()
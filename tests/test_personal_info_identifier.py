@@ -98,6 +98,79 @@ class TestPersonalInfoIdentifier(unittest.TestCase):
         result = self.identifier.identify_in_value('홍길동', 'nm')
         self.assertIsNotNone(result)
         self.assertEqual(result['type'], 'name')
+    
+    def test_find_in_text(self):
+        """문자열 내부 개인정보 위치 검색 테스트"""
+        identifier = PersonalInfoIdentifier([
+            {
+                'keys': ['^phone$'],
+                'type': 'phone',
+                'pattern': '^01[0-9]-\\d{3,4}-\\d{4}$',
+                'text_pattern': '(?<![\\d-])01[0-9]-\\d{3,4}-\\d{4}(?![\\d-])'
+            },
+            {
+                'keys': ['^email$'],
+                'type': 'email',
+                'text_pattern': '[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}'
+            }
+        ])
+        text = '문의: 010-1234-5678 (hong@example.com), 주문번호 2010-1234-56789'
+        results = identifier.find_in_text(text)
+        
+        self.assertEqual([r['type'] for r in results], ['phone', 'email'])
+        self.assertEqual(results[0]['value'], '010-1234-5678')
+        self.assertEqual(text[results[1]['start']:results[1]['end']], 'hong@example.com')
+    
+    def test_value_only_mode(self):
+        """키와 무관하게 값만으로 개인정보를 판별하는 모드 테스트"""
+        patterns = [
+            {
+                'keys': ['^card_number$'],
+                'type': 'card_number',
+                'pattern': '^\\d{4}-\\d{4}-\\d{4}-\\d{4}$|^\\d{16}$',
+                'validator': 'luhn',
+                'priority': 20
+            },
+            {
+                'keys': ['^ssn$'],
+                'type': 'ssn',
+                'pattern': '^\\d{6}-[1-4]\\d{6}$',
+                'validator': 'rrn',
+                'priority': 30
+            },
+            {
+                'keys': ['^email$'],
+                'type': 'email',
+                'pattern': '^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}$',
+                'value_only': True
+            },
+            {
+                'keys': ['^name$'],
+                'type': 'name',
+                'pattern': '^[가-힣]{2,4}$'
+            }
+        ]
+        identifier = PersonalInfoIdentifier(patterns, value_only=True)
+        
+        self.assertEqual(identifier.identify_in_value('4111-1111-1111-1111', 'p1')['type'], 'card_number')
+        self.assertEqual(identifier.identify_in_value(4111111111111111, 'val')['type'], 'card_number')
+        self.assertEqual(identifier.identify_in_value('900101-1234568', 'data')['type'], 'ssn')
+        self.assertEqual(identifier.identify_in_value('hong@example.com', 'x')['type'], 'email')
+        # 체크섬이 맞지 않으면 판별하지 않음
+        self.assertIsNone(identifier.identify_in_value('4111-1111-1111-1112', 'p1'))
+        self.assertIsNone(identifier.identify_in_value('900101-1234567', 'data'))
+        # validator나 value_only가 없는 유형은 키가 있어야만 판별
+        self.assertIsNone(identifier.identify_in_value('홍길동', 'p2'))
+        self.assertIsNone(identifier.identify_in_value(True, 'flag'))
+        
+        # 모드가 꺼져 있으면 값만으로 판별하지 않음
+        self.assertIsNone(
+            PersonalInfoIdentifier(patterns).identify_in_value('4111-1111-1111-1111', 'p1')
+        )
+    
+    def test_find_in_text_without_text_patterns(self):
+        """text_pattern이 없으면 문자열 내부 검색을 하지 않음"""
+        self.assertEqual(self.identifier.find_in_text('010-1234-5678'), [])
 
 
 if __name__ == '__main__':
@@ -3,6 +3,7 @@ import unittest
 import tempfile
 import json
 import os
+import random
 from pathlib import Path
 
 from src.identifier.personal_info_identifier import PersonalInfoIdentifier
@@ -117,6 +118,183 @@ class TestPersonalInfoReplacer(unittest.TestCase):
         self.assertNotEqual(result['users'][0]['name'], '홍길동')
         self.assertNotEqual(result['users'][1]['name'], '김철수')
     
+    def test_replace_in_ndjson_file(self):
+        """NDJSON 스트리밍 치환 테스트 - 순서와 일관성 유지"""
+        records = [
+            {'id': i, 'name': '홍길동' if i % 2 else '김철수', 'phone': '010-1234-5678'}
+            for i in range(50)
+        ]
+        
+        with tempfile.NamedTemporaryFile(
+            mode='w',
+            suffix='.ndjson',
+            delete=False,
+            encoding='utf-8'
+        ) as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            f.write('\n')  # 빈 줄은 무시
+            input_path = f.name
+        
+        output_path = input_path + '.output'
+        
+        try:
+            stats = self.replacer.replace_in_ndjson_file(
+                input_path,
+                output_path,
+                workers=4,
+                chunk_size=7
+            )
+            self.assertEqual(stats['records'], 50)
+            
+            with open(output_path, 'r', encoding='utf-8') as f:
+                output = [json.loads(line) for line in f]
+            
+            self.assertEqual([r['id'] for r in output], list(range(50)))
+            self.assertEqual(len({r['phone'] for r in output}), 1)
+            self.assertEqual(len({r['name'] for r in output}), 2)
+            self.assertNotIn('홍길동', {r['name'] for r in output})
+        finally:
+            if os.path.exists(input_path):
+                os.unlink(input_path)
+            if os.path.exists(output_path):
+                os.unlink(output_path)
+    
+    def test_ndjson_with_small_buffer(self):
+        """작은 쓰기 버퍼로도 NDJSON 출력이 올바르게 저장되는지 테스트"""
+        replacer = PersonalInfoReplacer(
+            self.identifier,
+            self.generator,
+            write_buffer_size=16
+        )
+        records = [{'id': i, 'name': '홍길동'} for i in range(20)]
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_path = os.path.join(temp_dir, 'input.ndjson')
+            output_path = os.path.join(temp_dir, 'output.ndjson')
+            with open(input_path, 'w', encoding='utf-8') as f:
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            
+            replacer.replace_in_ndjson_file(input_path, output_path, chunk_size=3)
+            
+            with open(output_path, 'r', encoding='utf-8') as f:
+                output = [json.loads(line) for line in f]
+        
+        self.assertEqual([r['id'] for r in output], list(range(20)))
+        self.assertEqual(len({r['name'] for r in output}), 1)
+        self.assertNotEqual(output[0]['name'], '홍길동')
+    
+    def test_replace_embedded_json_string(self):
+        """문자열로 직렬화된 JSON 내부의 개인정보 치환 테스트"""
+        body = json.dumps(
+            {'name': '홍길동', 'items': [{'phone': '010-1234-5678'}]},
+            ensure_ascii=False,
+            separators=(',', ':')
+        )
+        data = {
+            'response': {'body': body},
+            'request': {'bodyPatterns': [{'equalToJson': '{\n  "name": "홍길동"\n}'}]}
+        }
+        result = self.replacer._replace_in_dict(data)
+        
+        replaced_body = result['response']['body']
+        self.assertIsInstance(replaced_body, str)
+        self.assertNotIn('홍길동', replaced_body)
+        self.assertNotIn('010-1234-5678', replaced_body)
+        # 원본의 compact 스타일 유지
+        self.assertNotIn(', ', replaced_body)
+        
+        parsed_body = json.loads(replaced_body)
+        pattern = json.loads(result['request']['bodyPatterns'][0]['equalToJson'])
+        self.assertEqual(parsed_body['name'], pattern['name'])
+        self.assertTrue(
+            result['request']['bodyPatterns'][0]['equalToJson'].startswith('{\n  "name"')
+        )
+    
+    def test_embedded_json_without_personal_info_unchanged(self):
+        """개인정보가 없거나 JSON이 아닌 문자열은 그대로 유지되는지 테스트"""
+        body = '{"status" : "ok",  "count": 3}'
+        data = {'body': body, 'text': '{not json'}
+        result = self.replacer._replace_in_dict(data)
+        
+        self.assertEqual(result['body'], body)
+        self.assertEqual(result['text'], '{not json')
+    
+    def test_embedded_json_cache_hit_reports_unchanged(self):
+        """캐시된 embedded JSON을 다시 만나도 바뀌지 않은 문자열을 치환됨으로 보고하지 않는지 테스트"""
+        parts = ['{"status": ', '"ok"}']
+        for _ in range(2):
+            # 매번 내용은 같지만 다른 문자열 객체
+            body = ''.join(parts)
+            replaced, changed = self.replacer._replace_in_value(body, 'body')
+            self.assertEqual(replaced, body)
+            self.assertFalse(changed)
+        
+        body = json.dumps({'name': '홍길동'}, ensure_ascii=False)
+        first = self.replacer._replace_in_value(body, 'body')
+        second = self.replacer._replace_in_value(''.join([body[:1], body[1:]]), 'body')
+        self.assertTrue(first[1])
+        self.assertEqual(second, first)
+    
+    def test_scan_text(self):
+        """문자열 내부 개인정보 부분 치환 테스트"""
+        identifier = PersonalInfoIdentifier([
+            {
+                'keys': ['^phone$'],
+                'type': 'phone',
+                'pattern': '^01[0-9]-\\d{3,4}-\\d{4}$',
+                'text_pattern': '(?<![\\d-])01[0-9]-\\d{3,4}-\\d{4}(?![\\d-])'
+            }
+        ])
+        replacer = PersonalInfoReplacer(
+            identifier,
+            VirtualDataGenerator(),
+            scan_text=True
+        )
+        data = {
+            'phone': '010-1234-5678',
+            'description': '고객(010-1234-5678) 요청, 대체 연락처 010-9999-8888'
+        }
+        result = replacer._replace_in_dict(data)
+        
+        self.assertNotIn('010-1234-5678', result['description'])
+        self.assertNotIn('010-9999-8888', result['description'])
+        self.assertTrue(result['description'].startswith('고객('))
+        # 키로 식별된 값과 같은 치환값 사용
+        self.assertIn(result['phone'], result['description'])
+    
+    def test_replace_in_url_preserves_untouched_parameters(self):
+        """치환하지 않은 query 파라미터는 순서와 인코딩이 유지되는지 테스트"""
+        url = '/api/search?q=hello%20world&name=%ED%99%8D%EA%B8%B8%EB%8F%99&tag=a+b&phone=010-1234-5678'
+        replaced, changed = self.replacer._replace_in_url(url)
+        
+        self.assertTrue(changed)
+        self.assertTrue(replaced.startswith('/api/search?q=hello%20world&name='))
+        self.assertIn('&tag=a+b&phone=', replaced)
+        self.assertNotIn('%ED%99%8D%EA%B8%B8%EB%8F%99', replaced)
+        self.assertNotIn('010-1234-5678', replaced)
+    
+    def test_replace_in_url_path_template(self):
+        """경로 템플릿으로 경로 세그먼트의 개인정보 치환 테스트"""
+        replacer = PersonalInfoReplacer(
+            self.identifier,
+            self.generator,
+            path_templates=['/api/user/{phone}', '/api/users/{name}/*']
+        )
+        result = replacer._replace_in_dict({
+            'url': '/api/user/010-1234-5678?name=홍길동',
+            'urlPath': '/api/users/%ED%99%8D%EA%B8%B8%EB%8F%99/orders',
+            'phone': '010-1234-5678'
+        })
+        
+        self.assertTrue(result['url'].startswith('/api/user/'))
+        self.assertNotIn('010-1234-5678', result['url'])
+        self.assertIn(result['phone'], result['url'])
+        self.assertTrue(result['urlPath'].startswith('/api/users/'))
+        self.assertTrue(result['urlPath'].endswith('/orders'))
+        self.assertNotIn('%ED%99%8D%EA%B8%B8%EB%8F%99', result['urlPath'])
+    
     def test_get_replacement_map(self):
         """치환 매핑 테이블 조회 테스트"""
         data = {'name': '홍길동'}
@@ -136,6 +314,76 @@ class TestPersonalInfoReplacer(unittest.TestCase):
         
         self.assertEqual(len(self.replacer.get_replacement_map()), 0)
 
+    
+    def test_replacements_independent_of_order(self):
+        """처리 순서와 무관하게 같은 원본은 같은 치환값을 받는지 테스트"""
+        names = [f"사용자{i}" for i in range(3000)]
+        shuffled = list(names)
+        random.Random(7).shuffle(shuffled)
+        
+        other = PersonalInfoReplacer(self.identifier, VirtualDataGenerator())
+        for name in names:
+            self.replacer._get_or_create_replacement('name', name)
+        for name in shuffled:
+            other._get_or_create_replacement('name', name)
+        
+        self.assertEqual(self.replacer.get_replacement_map(), other.get_replacement_map())
+        replacements = {
+            entry['replacement'] for entry in self.replacer.get_replacement_map().values()
+        }
+        self.assertEqual(len(replacements), len(names))
+    
+    def test_collisions_rehashed_to_unique_values(self):
+        """치환값이 겹치면 재해시하여 유형 안에서 유일한 값을 받는지 테스트"""
+        generator = self.generator
+        generator.register('small', lambda original: f"값{generator.rng.randint(1, 20)}")
+        values = [
+            self.replacer._get_or_create_replacement('small', str(i))
+            for i in range(15)
+        ]
+        
+        self.assertEqual(len(set(values)), 15)
+        self.assertGreater(self.replacer.get_collision_stats()['small']['rehashed'], 0)
+        # 이미 만든 치환값은 다시 요청해도 그대로
+        self.assertEqual(self.replacer._get_or_create_replacement('small', '3'), values[3])
+    
+    def test_exhausted_space_raises(self):
+        """유형의 치환값 공간이 소진되면 겹친 값을 쓰지 않고 오류를 내는지 테스트"""
+        self.generator.register('constant', lambda original: '고정값')
+        self.assertEqual(self.replacer._get_or_create_replacement('constant', 'a'), '고정값')
+        
+        with self.assertRaises(RuntimeError):
+            self.replacer._get_or_create_replacement('constant', 'b')
+        self.assertNotIn('constant:b', self.replacer.get_replacement_map())
+    
+    def test_load_replacement_map_releases_overwritten_value(self):
+        """불러온 항목이 덮어쓴 이전 치환값을 사용 기록에서 지우는지 테스트"""
+        self.replacer.load_replacement_map({
+            'constant:a': {'type': 'constant', 'original': 'a', 'replacement': '고정값'},
+            'constant:b': {'type': 'constant', 'original': 'b', 'replacement': '고정값'}
+        })
+        self.assertEqual(self.replacer.get_collision_stats()['constant']['duplicates'], 1)
+        
+        self.replacer.load_replacement_map({
+            'constant:b': {'type': 'constant', 'original': 'b', 'replacement': '다른값'}
+        })
+        
+        self.assertEqual(self.replacer.get_collision_stats()['constant']['duplicates'], 0)
+        self.assertEqual(
+            self.replacer._used_replacements['constant'],
+            {'고정값': 1, '다른값': 1}
+        )
+    
+    def test_new_value_avoids_loaded_replacements(self):
+        """불러온 매핑이 쓰는 치환값은 새 원본에 주지 않는지 테스트"""
+        taken = self.replacer._generate_replacement('name:홍길동', 'name', '홍길동')
+        self.replacer.load_replacement_map({
+            'name:김철수': {'type': 'name', 'original': '김철수', 'replacement': taken}
+        })
+        
+        replacement = self.replacer._get_or_create_replacement('name', '홍길동')
+        self.assertNotEqual(replacement, taken)
+        self.assertEqual(self.replacer.get_collision_stats()['name']['rehashed'], 1)
 
 if __name__ == '__main__':
     unittest.main()
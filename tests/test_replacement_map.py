@@ -0,0 +1,136 @@
+"""스레드 안전 치환 매핑 테스트"""
+import unittest
+import random
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from src.identifier.personal_info_identifier import PersonalInfoIdentifier
+from src.generator.virtual_data_generator import VirtualDataGenerator
+from src.replacer.personal_info_replacer import PersonalInfoReplacer
+from src.replacer.replacement_map import ShardedReplacementMap
+
+
+class TestShardedReplacementMap(unittest.TestCase):
+    """ShardedReplacementMap 테스트 클래스"""
+
+    def test_mapping_interface(self):
+        """딕셔너리 인터페이스 테스트"""
+        mapping = ShardedReplacementMap(shard_count=5)
+        mapping['a'] = 1
+        mapping['b'] = 2
+
+        self.assertEqual(len(mapping), 2)
+        self.assertIn('a', mapping)
+        self.assertEqual(dict(mapping), {'a': 1, 'b': 2})
+        del mapping['a']
+        self.assertEqual(mapping.get('a'), None)
+        mapping.clear()
+        self.assertEqual(len(mapping), 0)
+
+    def test_get_or_create_calls_factory_once(self):
+        """같은 키의 생성 함수가 한 번만 호출되는지 테스트"""
+        mapping = ShardedReplacementMap()
+        calls = []
+        barrier = threading.Barrier(8)
+
+        def create():
+            barrier.wait()
+            return mapping.get_or_create('key', lambda: calls.append(1) or {'value': 1})
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: create(), range(8)))
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+
+
+class TestConcurrentReplacer(unittest.TestCase):
+    """여러 스레드에서 공유하는 치환기 스트레스 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.patterns = [
+            {
+                'keys': ['^phone$'],
+                'type': 'phone',
+                'pattern': '^01[0-9]-\\d{3,4}-\\d{4}$'
+            },
+            {
+                'keys': ['^email$'],
+                'type': 'email',
+                'pattern': '^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}$'
+            },
+            {
+                'keys': ['^ssn$'],
+                'type': 'ssn',
+                'pattern': '^\\d{6}-?\\d{7}$'
+            },
+            {
+                'keys': ['^nickname$'],
+                'type': 'nickname',
+                'pattern': '^\\S+$'
+            }
+        ]
+        self.documents = [
+            {
+                'phone': f"010-{i % 9000 + 1000}-{i * 7 % 9000 + 1000}",
+                'email': f"user{i}@example.com",
+                'ssn': f"{900000 + i % 1000:06d}-{1000000 + i:07d}",
+                # 치환값 공간이 작아 서로 다른 원본끼리 자주 겹치는 유형
+                'nickname': f"nick{i % 500}"
+            }
+            for i in range(2000)
+        ]
+
+    def _make_replacer(self) -> PersonalInfoReplacer:
+        generator = VirtualDataGenerator()
+        generator.register('nickname', lambda original: f"별칭{generator.rng.randint(1, 2000)}")
+        return PersonalInfoReplacer(
+            PersonalInfoIdentifier(self.patterns),
+            generator
+        )
+
+    def test_concurrent_output_matches_single_thread(self):
+        """멀티스레드 결과가 단일 스레드 결과와 같은지 테스트"""
+        expected = self._make_replacer()
+        for document in self.documents:
+            expected._replace_document(document)
+
+        replacer = self._make_replacer()
+        shuffled = [list(self.documents) for _ in range(8)]
+        for index, documents in enumerate(shuffled):
+            random.Random(index).shuffle(documents)
+
+        def run(documents):
+            for document in documents:
+                replacer._replace_document(document)
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(run, shuffled))
+        finally:
+            sys.setswitchinterval(interval)
+
+        actual_map = replacer.get_replacement_map()
+        expected_map = expected.get_replacement_map()
+        self.assertEqual(list(actual_map), list(expected_map))
+        # 겹치지 않은 유형은 처리 순서와 무관하게 단일 스레드 결과와 같음
+        for key, entry in expected_map.items():
+            if entry['type'] != 'nickname':
+                self.assertEqual(actual_map[key], entry)
+
+        # 겹친 원본은 재해시하여 모든 치환값이 유일
+        self.assertGreater(expected.get_collision_stats()['nickname']['rehashed'], 0)
+        nicknames = [
+            entry['replacement'] for entry in actual_map.values()
+            if entry['type'] == 'nickname'
+        ]
+        self.assertEqual(len(nicknames), 500)
+        self.assertEqual(len(set(nicknames)), 500)
+
+
+if __name__ == '__main__':
+    unittest.main()
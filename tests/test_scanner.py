@@ -0,0 +1,121 @@
+"""개인정보 스캔 테스트"""
+import unittest
+import json
+import tempfile
+from pathlib import Path
+
+from src.scanner import scan_files
+
+
+class TestScanner(unittest.TestCase):
+    """scan_files 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.patterns = [
+            {
+                'keys': ['^name$'],
+                'type': 'name',
+                'pattern': '^[가-힣]{2,4}$'
+            },
+            {
+                'keys': ['^phone$'],
+                'type': 'phone',
+                'pattern': '^01[0-9]-\\d{3,4}-\\d{4}$',
+                'text_pattern': '(?<![\\d-])01[0-9]-\\d{3,4}-\\d{4}(?![\\d-])'
+            }
+        ]
+        self.temp_dir = tempfile.TemporaryDirectory()
+        base = Path(self.temp_dir.name)
+        documents = {
+            'a.json': {'name': '홍길동', 'phone': '010-1234-5678'},
+            'b.json': [{'user': {'name': '김철수'}}, {'status': 'ok'}],
+            'c.json': {'status': 'ok'}
+        }
+        self.files = []
+        for name, data in documents.items():
+            path = base / name
+            path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+            self.files.append(str(path))
+        ndjson = base / 'd.ndjson'
+        ndjson.write_text('{"name": "이영희"}\n\n{"phone": "010-1111-2222"}\n', encoding='utf-8')
+        self.files.append(str(ndjson))
+        broken = base / 'e.json'
+        broken.write_text('{', encoding='utf-8')
+        self.files.append(str(broken))
+
+    def tearDown(self):
+        """임시 디렉토리 정리"""
+        self.temp_dir.cleanup()
+
+    def test_aggregated_report(self):
+        """유형/키/파일별 집계 테스트"""
+        report = scan_files(self.files, self.patterns).to_dict()
+
+        self.assertEqual(report['files_scanned'], 5)
+        self.assertEqual(report['total'], 5)
+        self.assertEqual(report['by_type'], {'name': 3, 'phone': 2})
+        self.assertEqual(report['by_file'][self.files[0]], 2)
+        self.assertNotIn(self.files[2], report['by_file'])
+        self.assertIn(f"{self.files[1]}:[0].user.name", report['samples']['name'])
+        self.assertIn(f"{self.files[3]}:line3.phone", report['samples']['phone'])
+        self.assertIn(self.files[4], report['errors'])
+
+    def test_report_has_no_original_values(self):
+        """보고서에 원본 값이 포함되지 않는지 테스트"""
+        report = scan_files(self.files, self.patterns)
+
+        self.assertNotIn('홍길동', report.to_json())
+        self.assertNotIn('010-1234-5678', report.to_csv())
+
+    def test_process_pool_matches_serial(self):
+        """프로세스 풀 결과가 단일 프로세스 결과와 같은지 테스트"""
+        serial = scan_files(self.files, self.patterns, sample_size=1).to_dict()
+        parallel = scan_files(self.files, self.patterns, workers=2, sample_size=1).to_dict()
+
+        self.assertEqual(serial, parallel)
+        self.assertEqual(len(parallel['samples']['name']), 1)
+
+    def test_uses_replacer_traversal(self):
+        """치환과 같은 순회로 URL, 문자열 안의 JSON, WireMock matcher의 값도 찾는지 테스트"""
+        path = Path(self.temp_dir.name) / 'stub.json'
+        path.write_text(json.dumps({
+            'request': {
+                'method': 'GET',
+                'url': '/api/user?phone=010-1234-5678&page=1',
+                'queryParameters': {'name': {'equalTo': '홍길동'}}
+            },
+            'response': {
+                'status': 200,
+                'body': json.dumps({'name': '김철수'}, ensure_ascii=False)
+            }
+        }, ensure_ascii=False), encoding='utf-8')
+
+        report = scan_files([str(path)], self.patterns).to_dict()
+
+        self.assertEqual(report['by_type'], {'name': 2, 'phone': 1})
+        self.assertIn(f"{path}:request.url.phone", report['samples']['phone'])
+        self.assertIn(f"{path}:response.body.name", report['samples']['name'])
+        self.assertNotIn('010-1234-5678', json.dumps(report, ensure_ascii=False))
+
+    def test_scan_text_and_path_templates(self):
+        """scan_text와 경로 템플릿 옵션을 치환과 같게 적용하는지 테스트"""
+        path = Path(self.temp_dir.name) / 'text.json'
+        path.write_text(json.dumps({
+            'message': '연락처: 010-1234-5678 (평일)',
+            'url': '/api/phone/010-9999-8888'
+        }, ensure_ascii=False), encoding='utf-8')
+
+        plain = scan_files([str(path)], self.patterns).to_dict()
+        self.assertEqual(plain['total'], 0)
+
+        report = scan_files(
+            [str(path)],
+            self.patterns,
+            options={'scan_text': True, 'path_templates': ['/api/phone/{phone}']}
+        ).to_dict()
+        self.assertEqual(report['by_type'], {'phone': 2})
+
+
+if __name__ == '__main__':
+    unittest.main()
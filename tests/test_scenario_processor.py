@@ -135,6 +135,135 @@ class TestScenarioProcessor(unittest.TestCase):
                 if os.path.exists(f):
                     os.unlink(f)
     
+    def test_process_scenario_audit_db(self):
+        """감사 인덱스에 파일별 치환 기록이 남는지 테스트"""
+        from src.audit_index import AuditIndex
+        
+        temp_dir = tempfile.mkdtemp()
+        try:
+            # 두 번째 파일의 embedded JSON은 캐시 적중으로 처리되어도 기록되어야 함
+            files = []
+            for i, data in enumerate([
+                {'name': '홍길동', 'body': '{"phone": "010-1234-5678"}'},
+                {'body': '{"phone": "010-1234-5678"}'},
+                {'status': 'ok'}
+            ]):
+                path = Path(temp_dir) / f'mapping_{i}.json'
+                path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+                files.append(str(path))
+            audit_db = str(Path(temp_dir) / 'audit.db')
+            
+            self.processor.process_scenario(files, str(Path(temp_dir) / 'out'), audit_db=audit_db)
+            replacement_map = self.processor.get_replacement_map()
+            
+            with AuditIndex(audit_db) as index:
+                self.assertEqual(index.find_files('홍길동'), [files[0]])
+                self.assertEqual(index.find_files('010-1234-5678', 'phone'), files[:2])
+                
+                replacement = replacement_map['name:홍길동']['replacement']
+                originals = index.find_originals(replacement)
+                self.assertEqual(originals[0]['original'], '홍길동')
+        finally:
+            shutil.rmtree(temp_dir)
+    
+    def test_process_scenario_preserves_relative_paths(self):
+        """같은 이름의 파일이 서로 덮어쓰지 않는지 테스트"""
+        temp_dir = Path(tempfile.mkdtemp())
+        try:
+            input_dir = temp_dir / 'services'
+            files = []
+            for service in ('user', 'order'):
+                path = input_dir / service / 'mapping.json'
+                path.parent.mkdir(parents=True)
+                path.write_text(json.dumps({'name': '홍길동', 'service': service}, ensure_ascii=False), encoding='utf-8')
+                files.append(str(path))
+            output_dir = temp_dir / 'out'
+            
+            results = self.processor.process_scenario(files, str(output_dir), base_dir=str(input_dir))
+            self.assertTrue(all(f['status'] == 'success' for f in results['processed_files']))
+            for service in ('user', 'order'):
+                with open(output_dir / service / 'mapping.json', 'r', encoding='utf-8') as f:
+                    self.assertEqual(json.load(f)['service'], service)
+            
+            # 기준 디렉토리가 없으면 같은 이름은 충돌로 보고
+            results = self.processor.process_scenario(files, str(temp_dir / 'flat'))
+            self.assertEqual(
+                [f['status'] for f in results['processed_files']],
+                ['success', 'error']
+            )
+        finally:
+            shutil.rmtree(temp_dir)
+    
+    def test_process_scenario_dedup(self):
+        """내용이 같은 파일은 한 번만 치환하는지 테스트"""
+        temp_dir = Path(tempfile.mkdtemp())
+        try:
+            input_dir = temp_dir / 'in'
+            input_dir.mkdir()
+            body = json.dumps({'name': '홍길동', 'phone': '010-1234-5678'}, ensure_ascii=False)
+            files = []
+            for name, content in (('a.json', body), ('b.json', body), ('c.json', '{"name": "김철수"}')):
+                (input_dir / name).write_text(content, encoding='utf-8')
+                files.append(str(input_dir / name))
+            
+            for link in (False, True):
+                output_dir = temp_dir / f'out_{link}'
+                results = self.processor.process_scenario(
+                    files,
+                    str(output_dir),
+                    base_dir=str(input_dir),
+                    dedup=True,
+                    link_duplicates=link
+                )
+                self.assertEqual(results['duplicates'], 1)
+                statuses = [f['status'] for f in results['processed_files']]
+                self.assertEqual(statuses, ['success'] * 3)
+                self.assertEqual(results['processed_files'][1]['duplicate_of'], files[0])
+                self.assertEqual(
+                    (output_dir / 'a.json').read_bytes(),
+                    (output_dir / 'b.json').read_bytes()
+                )
+                self.assertEqual(
+                    os.path.samefile(output_dir / 'a.json', output_dir / 'b.json'),
+                    link
+                )
+            
+            # 기본값은 중복 제거 없이 모두 각각 치환
+            results = self.processor.process_scenario(
+                files, str(temp_dir / 'out_nodedup'), base_dir=str(input_dir)
+            )
+            self.assertEqual(results['duplicates'], 0)
+            self.assertEqual(
+                (temp_dir / 'out_nodedup' / 'b.json').read_bytes(),
+                (temp_dir / 'out_False' / 'b.json').read_bytes()
+            )
+        finally:
+            shutil.rmtree(temp_dir)
+    
+    def test_io_settings_from_config(self):
+        """설정 파일의 mmap_threshold, write_buffer_size가 적용되는지 테스트"""
+        config = dict(self.test_patterns)
+        config['mmap_threshold'] = 0
+        config['write_buffer_size'] = 4096
+        
+        with tempfile.NamedTemporaryFile(
+            mode='w',
+            suffix='.yaml',
+            delete=False,
+            encoding='utf-8'
+        ) as f:
+            yaml.dump(config, f, allow_unicode=True)
+            config_path = f.name
+        
+        try:
+            processor = ScenarioProcessor(config_path)
+        finally:
+            os.unlink(config_path)
+        
+        self.assertIsNone(processor.identifier.mmap_threshold)
+        self.assertIsNone(processor.replacer.mmap_threshold)
+        self.assertEqual(processor.replacer.write_buffer_size, 4096)
+    
     def test_reset(self):
         """리셋 테스트"""
         test_data = {'name': '홍길동'}
@@ -0,0 +1,81 @@
+"""파일 샤딩 테스트"""
+import unittest
+import tempfile
+import json
+import shutil
+from pathlib import Path
+
+from src.sharding import parse_shard, select_shard, shard_of
+from src.scenario_processor import ScenarioProcessor
+from src.replacer.map_store import merge_replacement_maps
+
+
+class TestSharding(unittest.TestCase):
+    """sharding 모듈 테스트 클래스"""
+
+    def test_parse_shard(self):
+        """'i/N' 형식 해석 테스트"""
+        self.assertEqual(parse_shard('1/4'), (0, 4))
+        self.assertEqual(parse_shard('4/4'), (3, 4))
+        for spec in ('0/4', '5/4', '1', 'a/b', '1/0'):
+            with self.assertRaises(ValueError):
+                parse_shard(spec)
+
+    def test_partition_is_complete_and_disjoint(self):
+        """모든 파일이 정확히 한 샤드에 배정되는지 테스트"""
+        files = [f"/repo/mappings/api/file_{i}.json" for i in range(500)]
+        shards = [
+            list(select_shard(files, index, 4, '/repo'))
+            for index in range(4)
+        ]
+
+        self.assertEqual(sorted(sum(shards, [])), sorted(files))
+        self.assertTrue(all(len(shard) > 50 for shard in shards))
+
+    def test_independent_of_checkout_root(self):
+        """체크아웃 위치가 달라도 같은 샤드에 배정되는지 테스트"""
+        self.assertEqual(
+            shard_of('/ci/node1/repo/mappings/a.json', 8, '/ci/node1/repo'),
+            shard_of('/home/build/repo/mappings/a.json', 8, '/home/build/repo')
+        )
+
+    def test_merged_shard_maps_match_single_run(self):
+        """샤드별 매핑을 합친 결과가 한 번에 처리한 매핑과 같은지 테스트"""
+        temp_dir = Path(tempfile.mkdtemp())
+        try:
+            files = []
+            for index in range(40):
+                path = temp_dir / f"file_{index}.json"
+                users = [
+                    {'name': '김' + chr(0xAC00 + index) + chr(0xAC00 + i)}
+                    for i in range(35)
+                ]
+                path.write_text(json.dumps({'users': users}, ensure_ascii=False), encoding='utf-8')
+                files.append(str(path))
+
+            shard_maps = []
+            for index in range(4):
+                processor = ScenarioProcessor()
+                results = processor.process_scenario(
+                    select_shard(files, index, 4, str(temp_dir)),
+                    str(temp_dir / f"out_{index}"),
+                    base_dir=str(temp_dir)
+                )
+                shard_maps.append(results['replacement_map'])
+            merged, conflicts = merge_replacement_maps(shard_maps)
+
+            single = ScenarioProcessor().process_scenario(
+                files, str(temp_dir / 'out_all'), base_dir=str(temp_dir)
+            )
+            self.assertEqual(len(merged), 40 * 35)
+            self.assertEqual(merged, single['replacement_map'])
+            self.assertEqual(
+                [c for c in conflicts if c['kind'] == 'replacement'],
+                []
+            )
+        finally:
+            shutil.rmtree(temp_dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
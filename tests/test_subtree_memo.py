@@ -0,0 +1,142 @@
+"""하위 트리 메모 테스트"""
+import unittest
+
+from src.identifier.personal_info_identifier import PersonalInfoIdentifier
+from src.generator.virtual_data_generator import VirtualDataGenerator
+from src.replacer.personal_info_replacer import (
+    PersonalInfoReplacer,
+    SUBTREE_MEMO_MAX_DEPTH
+)
+from src.replacer.subtree_memo import SubtreeMemo
+
+
+class TestSubtreeMemo(unittest.TestCase):
+    """SubtreeMemo 및 치환기 메모 사용 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        patterns = [
+            {
+                'keys': ['^name$'],
+                'type': 'name',
+                'pattern': '^[가-힣]{2,4}$'
+            },
+            {
+                'keys': ['^phone$'],
+                'type': 'phone',
+                'pattern': '^01[0-9]-\\d{3,4}-\\d{4}$'
+            }
+        ]
+        self.identifier = PersonalInfoIdentifier(patterns)
+        self.user = {
+            'name': '홍길동',
+            'phone': '010-1234-5678',
+            'bio': 'x' * 300
+        }
+
+    def _replacer(self, memo_size: int) -> PersonalInfoReplacer:
+        return PersonalInfoReplacer(
+            self.identifier,
+            VirtualDataGenerator(),
+            subtree_memo_size=memo_size
+        )
+
+    def test_size_weighted_eviction(self):
+        """크기 합 기준으로 오래된 항목을 제거하는지 테스트"""
+        memo = SubtreeMemo(100)
+        memo.put('a', 1, 40)
+        memo.put('b', 2, 40)
+        memo.get('a')
+        memo.put('c', 3, 40)
+
+        self.assertEqual(memo.get('a'), 1)
+        self.assertIsNone(memo.get('b'))
+        self.assertEqual(memo.size, 80)
+
+        # 한도보다 큰 항목은 저장하지 않음
+        memo.put('d', 4, 101)
+        self.assertIsNone(memo.get('d'))
+        self.assertEqual(len(memo), 2)
+
+    def test_memo_result_matches_traversal(self):
+        """메모를 사용한 결과가 순회한 결과와 같은지 테스트"""
+        documents = [
+            {'response': {'id': i, 'user': dict(self.user)}}
+            for i in range(5)
+        ]
+        memoized = self._replacer(1024 * 1024)
+        plain = self._replacer(0)
+
+        for document in documents:
+            self.assertEqual(
+                memoized._replace_document(document),
+                plain._replace_document(document)
+            )
+        self.assertEqual(memoized.subtree_memo.hits, 4)
+
+    def test_memo_records_touches_on_hit(self):
+        """메모 적중 시에도 감사 기록이 남는지 테스트"""
+        replacer = self._replacer(1024 * 1024)
+        replacer._replace_document({'user': self.user})
+
+        replacer.start_touch_tracking()
+        replacer._replace_document({'other': 1, 'user': self.user})
+        touched = replacer.stop_touch_tracking()
+
+        self.assertEqual(
+            sorted(entry['type'] for entry in touched),
+            ['name', 'phone']
+        )
+
+        replacer.start_touch_tracking()
+        replacer._replace_document({'again': 1, 'user': self.user})
+        self.assertEqual(len(replacer.stop_touch_tracking()), 2)
+        self.assertGreater(replacer.subtree_memo.hits, 0)
+
+    def test_memo_depth_is_bounded(self):
+        """깊은 문서에서 제한된 깊이까지만 하위 트리를 직렬화하여 메모하는지 테스트"""
+        document = {'user': dict(self.user)}
+        for level in range(10):
+            document = {f'level{level}': document}
+        memoized = self._replacer(1024 * 1024)
+        plain = self._replacer(0)
+
+        self.assertEqual(
+            memoized._replace_document(document),
+            plain._replace_document(document)
+        )
+        self.assertEqual(memoized.subtree_memo.misses, SUBTREE_MEMO_MAX_DEPTH)
+        self.assertEqual(len(memoized.subtree_memo), SUBTREE_MEMO_MAX_DEPTH)
+
+    def test_memo_keyed_by_traversal_mode(self):
+        """같은 키의 같은 하위 트리를 헤더와 일반 객체로 순회한 결과를 섞지 않는지 테스트"""
+        subtree = {'Cookie': 'name=홍길동', 'bio': 'x' * 300}
+        # 'headers' 객체는 헤더 정책으로, 'headers' 리스트의 항목은 일반 객체로 순회
+        as_headers = {'headers': dict(subtree)}
+        as_items = {'headers': [dict(subtree)]}
+
+        for documents in ([as_headers, as_items], [as_items, as_headers]):
+            memoized = self._replacer(1024 * 1024)
+            plain = self._replacer(0)
+            for document in documents:
+                self.assertEqual(
+                    memoized._replace_document(document),
+                    plain._replace_document(document)
+                )
+
+        plain = self._replacer(0)
+        self.assertNotEqual(plain._replace_document(as_headers)['headers']['Cookie'], 'name=홍길동')
+        self.assertEqual(plain._replace_document(as_items)['headers'][0]['Cookie'], 'name=홍길동')
+
+    def test_memo_cleared_with_replacement_map(self):
+        """치환 매핑 초기화 시 메모도 비우는지 테스트"""
+        replacer = self._replacer(1024 * 1024)
+        replacer._replace_document({'user': self.user})
+        self.assertGreater(len(replacer.subtree_memo), 0)
+
+        replacer.clear_replacement_map()
+        self.assertEqual(len(replacer.subtree_memo), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
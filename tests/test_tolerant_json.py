@@ -0,0 +1,141 @@
+"""관대한 JSON 파싱 테스트"""
+import unittest
+import tempfile
+import json
+import shutil
+from pathlib import Path
+
+import yaml
+
+from src.tolerant_json import parse_tolerant, iter_scalar_pairs
+from src.scenario_processor import ScenarioProcessor
+
+
+class TestTolerantJson(unittest.TestCase):
+    """parse_tolerant 및 관대한 처리 모드 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.config_path = self.temp_dir / 'patterns.yaml'
+        self.config_path.write_text(yaml.dump({
+            'personal_info_patterns': [
+                {
+                    'keys': ['^name$'],
+                    'type': 'name',
+                    'pattern': '^[가-힣]{2,4}$'
+                },
+                {
+                    'keys': ['^phone$'],
+                    'type': 'phone',
+                    'pattern': '^01[0-9]-\\d{3,4}-\\d{4}$',
+                    'text_pattern': '01[0-9]-\\d{3,4}-\\d{4}'
+                }
+            ]
+        }, allow_unicode=True), encoding='utf-8')
+        self.input_dir = self.temp_dir / 'in'
+        self.input_dir.mkdir()
+
+    def tearDown(self):
+        """임시 디렉토리 정리"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_parse_tolerant_fixes(self):
+        """BOM, 주석, 끝의 쉼표, 이어 붙은 문서 처리 테스트"""
+        text = '\ufeff{"a": 1, // 주석\n "b": [1, 2,], /* 블록 */ "c": "http://x/*y*/",}\n{"d": 2}'
+        documents, fixes = parse_tolerant(text)
+
+        self.assertEqual(documents, [{'a': 1, 'b': [1, 2], 'c': 'http://x/*y*/'}, {'d': 2}])
+        self.assertEqual(fixes, ['bom', 'comments', 'trailing_commas', 'concatenated'])
+        self.assertEqual(parse_tolerant('{"a": 1}'), ([{'a': 1}], []))
+        with self.assertRaises(ValueError):
+            parse_tolerant('{"a": ')
+
+    def test_iter_scalar_pairs(self):
+        """깨진 텍스트에서 문자열과 따옴표 없는 값의 키-값 쌍을 찾는 테스트"""
+        text = (
+            '{"name": "홍길동", "memo": "a\\"b", "ssn": 9001011234567, '
+            '"phone": 010-1234-5678, "ok": true, "broken": '
+        )
+        pairs = [
+            (key, value, quoted)
+            for key, value, _, _, quoted in iter_scalar_pairs(text)
+        ]
+
+        self.assertEqual(pairs, [
+            ('name', '홍길동', True),
+            ('memo', 'a"b', True),
+            ('ssn', 9001011234567, False),
+            ('phone', '010-1234-5678', False),
+        ])
+
+    def test_process_scenario_tolerant(self):
+        """관대한 모드에서 모든 파일을 한 번에 치환하는지 테스트"""
+        files = {
+            'fixable.json': '\ufeff{\n  // 사용자\n  "name": "홍길동",\n}',
+            'broken.json': (
+                '{"name": "홍길동", "note": "연락처 010-1234-5678", '
+                '"phone": 010-9876-5432, "x": ['
+            ),
+            'lines.ndjson': (
+                '{"name": "홍길동"}\n{"name": "김철수",}\n{"name": "이영희"\n'
+                '{"name": "박민수",}\n{"name": "최지우"\n'
+            ),
+            'concatenated.json': '{"name": "홍길동"}\n{"name": "김철수"}'
+        }
+        for name, content in files.items():
+            (self.input_dir / name).write_text(content, encoding='utf-8')
+        paths = [str(self.input_dir / name) for name in files]
+        output_dir = self.temp_dir / 'out'
+
+        strict = ScenarioProcessor(str(self.config_path))
+        results = strict.process_scenario(paths, str(output_dir), base_dir=str(self.input_dir))
+        self.assertEqual(
+            [f['status'] for f in results['processed_files']],
+            ['error'] * 4
+        )
+
+        processor = ScenarioProcessor(str(self.config_path), tolerant=True)
+        results = processor.process_scenario(paths, str(output_dir), base_dir=str(self.input_dir))
+        self.assertEqual(
+            [f['status'] for f in results['processed_files']],
+            ['success'] * 4
+        )
+        # JSON 파일은 파일 수, NDJSON 파일은 고친 라인 수로 집계
+        self.assertEqual(results['parse_fixes'], {
+            'bom': 1,
+            'comments': 1,
+            'trailing_commas': 3,
+            'text_fallback': 3,
+            'concatenated': 1
+        })
+        self.assertEqual(
+            results['processed_files'][2]['parse_fixes'],
+            {'trailing_commas': 2, 'text_fallback': 2}
+        )
+
+        name = processor.get_replacement_map()['name:홍길동']['replacement']
+        fixed = json.loads((output_dir / 'fixable.json').read_text(encoding='utf-8'))
+        self.assertEqual(fixed, {'name': name})
+
+        broken = (output_dir / 'broken.json').read_text(encoding='utf-8')
+        self.assertIn(f'"name": "{name}"', broken)
+        self.assertNotIn('010-1234-5678', broken)
+        phone = processor.get_replacement_map()['phone:010-9876-5432']['replacement']
+        self.assertIn(f'"phone": "{phone}"', broken)
+        self.assertTrue(broken.endswith('"x": ['))
+
+        concatenated = json.loads(
+            (output_dir / 'concatenated.json').read_text(encoding='utf-8')
+        )
+        self.assertEqual(len(concatenated), 2)
+        self.assertEqual(concatenated[0], {'name': name})
+
+        lines = (output_dir / 'lines.ndjson').read_text(encoding='utf-8')
+        self.assertNotIn('홍길동', lines)
+        self.assertNotIn('김철수', lines)
+        self.assertNotIn('이영희', lines)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+"""URL 토큰화 모듈 테스트"""
+import unittest
+
+from src.replacer.url_tokenizer import split_url, iter_query_params, PathTemplate
+
+
+class TestUrlTokenizer(unittest.TestCase):
+    """url_tokenizer 모듈 테스트 클래스"""
+    
+    def test_split_url(self):
+        """경로와 query string 위치 분리 테스트"""
+        url = 'https://example.com/api/user?name=a&b=c#top'
+        path_start, path_end, query_start, query_end = split_url(url)
+        
+        self.assertEqual(url[path_start:path_end], '/api/user')
+        self.assertEqual(url[query_start:query_end], 'name=a&b=c')
+    
+    def test_split_url_without_query(self):
+        """query string이 없는 경로 테스트"""
+        url = '/api/user/010-1234-5678'
+        path_start, path_end, query_start, query_end = split_url(url)
+        
+        self.assertEqual(url[path_start:path_end], url)
+        self.assertEqual(query_start, query_end)
+    
+    def test_iter_query_params(self):
+        """query 파라미터 값 위치 테스트"""
+        url = '/api?name=%ED%99%8D&flag&empty=&q=a+b'
+        _, _, start, end = split_url(url)
+        params = [
+            (name, url[s:e]) for name, s, e in iter_query_params(url, start, end)
+        ]
+        
+        self.assertEqual(params, [('name', '%ED%99%8D'), ('empty', ''), ('q', 'a+b')])
+    
+    def test_path_template(self):
+        """경로 템플릿 매칭 테스트"""
+        template = PathTemplate('/api/users/{phone}/*')
+        url = '/api/users/010-1234-5678/orders'
+        path_start, path_end, _, _ = split_url(url)
+        fields = template.match(url, path_start, path_end)
+        
+        self.assertEqual(len(fields), 1)
+        name, start, end = fields[0]
+        self.assertEqual(name, 'phone')
+        self.assertEqual(url[start:end], '010-1234-5678')
+        
+        self.assertIsNone(template.match('/api/users/x', 0, 12))
+        self.assertIsNone(template.match('/api/items/x/y', 0, 14))
+        self.assertIsNone(template.match('/api/users/x/y/z', 0, 16))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+"""개인정보 값 검증(체크섬) 모듈 테스트"""
+import unittest
+
+from src.identifier.validators import luhn_valid, rrn_valid, imei_valid
+
+
+class TestValidators(unittest.TestCase):
+    """validators 모듈 테스트 클래스"""
+    
+    def test_luhn(self):
+        """Luhn 체크섬 테스트"""
+        self.assertTrue(luhn_valid('4111-1111-1111-1111'))
+        self.assertTrue(luhn_valid('4111111111111111'))
+        self.assertFalse(luhn_valid('4111-1111-1111-1112'))
+        self.assertFalse(luhn_valid('1'))
+    
+    def test_rrn(self):
+        """주민등록번호 검증번호 테스트"""
+        self.assertTrue(rrn_valid('900101-1234568'))
+        self.assertFalse(rrn_valid('900101-1234567'))
+        self.assertFalse(rrn_valid('900101-123456'))
+    
+    def test_imei(self):
+        """IMEI 체크섬 테스트"""
+        self.assertTrue(imei_valid('490154203237518'))
+        self.assertFalse(imei_valid('490154203237519'))
+        self.assertFalse(imei_valid('4111111111111111'))
+    
+    def test_non_ascii_digits_ignored(self):
+        """ASCII가 아닌 숫자 문자는 자릿수로 보지 않는지 테스트"""
+        self.assertTrue(luhn_valid('4111-1111-1111-1111\u00b2'))
+        self.assertFalse(rrn_valid('\uff19\uff10\uff10\uff11\uff10\uff11-1234568'))
+        self.assertFalse(imei_valid('49015420323751\u0668'))
+
+
+if __name__ == '__main__':
+    unittest.main()
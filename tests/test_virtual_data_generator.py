@@ -1,7 +1,9 @@
 """가상 개인정보 생성 모듈 테스트"""
 import unittest
 import re
+from unittest import mock
 
+from src.generator import virtual_data_generator
 from src.generator.virtual_data_generator import VirtualDataGenerator
 
 
@@ -65,6 +67,26 @@ class TestVirtualDataGenerator(unittest.TestCase):
         self.assertIsInstance(address, str)
         self.assertIn('테스트', address)
     
+    def test_generate_mac_address(self):
+        """MAC 주소 생성 테스트 (로컬 관리 주소, 시드마다 다른 값)"""
+        values = set()
+        for seed in range(100):
+            self.generator.seed(seed)
+            mac = self.generator.generate('mac_address')
+            self.assertRegex(mac, r'^02(:[0-9a-f]{2}){5}$')
+            values.add(mac)
+        
+        self.assertEqual(len(values), 100)
+    
+    def test_generate_header(self):
+        """헤더 값 생성 테스트 (원본 길이/문자 종류 유지, 인증 스킴 유지)"""
+        token = self.generator.generate('header', 'Bearer eyJhbGci.Oi-12==')
+        self.assertRegex(token, r'^Bearer [a-z]{2}[A-Z][a-z]{2}[A-Z][a-z]{2}\.[A-Z][a-z]-[0-9]{2}==$')
+        self.assertNotEqual(token, 'Bearer eyJhbGci.Oi-12==')
+        
+        self.assertRegex(self.generator.generate('header', '홍길동'), r'^[a-z]{3}$')
+        self.assertEqual(len(self.generator.generate('header', None)), 32)
+    
     def test_generate_consistency(self):
         """일관성 테스트 - 같은 시드로 같은 값 생성"""
         gen1 = VirtualDataGenerator(seed=42)
@@ -82,6 +104,49 @@ class TestVirtualDataGenerator(unittest.TestCase):
         result = self.generator.generate('unknown_type', 'test')
         self.assertIsInstance(result, str)
         self.assertTrue(result.startswith('테스트값_'))
+    
+    def test_register_generator(self):
+        """생성기 등록 테스트"""
+        self.generator.register('member_id', lambda original: f"MEMBER-{len(original)}")
+        
+        self.assertEqual(self.generator.generate('member_id', 'abc'), 'MEMBER-3')
+    
+    def test_generators_from_config(self):
+        """설정 파일의 'module:function' 생성기 등록 테스트"""
+        generator = VirtualDataGenerator(generators={'member_id': 'string:capwords'})
+        self.assertEqual(generator.generate('member_id', 'hong gildong'), 'Hong Gildong')
+        
+        with self.assertRaises(ValueError):
+            VirtualDataGenerator(generators={'member_id': 'string'})
+    
+    def test_entry_points_are_opt_in(self):
+        """entry point 생성기는 명시적으로 켠 경우에만 등록되고 오류는 모아두는지 테스트"""
+        def load_broken():
+            raise ImportError('broken')
+        
+        working = mock.Mock()
+        working.name = 'member_id'
+        working.load.return_value = lambda original: 'MEMBER'
+        broken = mock.Mock()
+        broken.name = 'broken_id'
+        broken.load.side_effect = load_broken
+        
+        virtual_data_generator._entry_point_generators.cache_clear()
+        try:
+            with mock.patch.object(
+                virtual_data_generator,
+                'entry_points',
+                return_value=[working, broken]
+            ):
+                default = VirtualDataGenerator()
+                enabled = VirtualDataGenerator(load_entry_points=True)
+        finally:
+            virtual_data_generator._entry_point_generators.cache_clear()
+        
+        self.assertNotIn('member_id', default.generators)
+        self.assertEqual(default.entry_point_errors, [])
+        self.assertEqual(enabled.generate('member_id', 'abc'), 'MEMBER')
+        self.assertEqual(enabled.entry_point_errors, ['broken_id (broken)'])
 
 
 if __name__ == '__main__':
@@ -0,0 +1,148 @@
+"""WireMock 스텁 구조 인식 치환 테스트"""
+import unittest
+import json
+
+from src.identifier.personal_info_identifier import PersonalInfoIdentifier
+from src.generator.virtual_data_generator import VirtualDataGenerator
+from src.replacer.personal_info_replacer import PersonalInfoReplacer
+from src.replacer.wiremock_traversal import is_wiremock_stub
+
+
+class TestWireMockTraversal(unittest.TestCase):
+    """WireMockStubTraverser 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        patterns = [
+            {
+                'keys': ['^name$'],
+                'type': 'name',
+                'pattern': '^[가-힣]{2,4}$|^[A-Za-z\\s]{2,30}$'
+            },
+            {
+                'keys': ['^phone$', '.*phone.*'],
+                'type': 'phone',
+                'pattern': '^01[0-9]-\\d{3,4}-\\d{4}$'
+            },
+            {
+                'keys': ['^email$'],
+                'type': 'email',
+                'pattern': '^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}$'
+            },
+            {
+                'keys': ['^username$'],
+                'type': 'name',
+                'pattern': '^[가-힣]{2,4}$|^[A-Za-z\\s]{2,30}$'
+            },
+            {
+                'keys': ['^password$'],
+                'type': 'password',
+                'pattern': '^.{4,}$'
+            }
+        ]
+        identifier = PersonalInfoIdentifier(patterns)
+        self.replacer = PersonalInfoReplacer(identifier, VirtualDataGenerator())
+        self.stub = {
+            'name': 'Get user profile',
+            'scenarioName': 'UserFlow',
+            'request': {
+                'method': 'GET',
+                'urlPattern': '/api/user\\?phone=010-1234-5678&page=.*',
+                'queryParameters': {
+                    'name': {'equalTo': '홍길동'},
+                    'email': {'hasExactly': [{'equalTo': 'hong@example.com'}]}
+                },
+                'headers': {
+                    'X-User-Phone': {'equalTo': '010-1234-5678'},
+                    'Accept': {'contains': 'json'}
+                },
+                'bodyPatterns': [
+                    {'matchesJsonPath': "$[?(@.name == '홍길동')]"},
+                    {'matchesJsonPath': {'expression': '$.user.phone', 'equalTo': '010-1234-5678'}},
+                    {'equalToJson': '{"email":"hong@example.com"}'}
+                ]
+            },
+            'response': {
+                'status': 200,
+                'jsonBody': {'name': '홍길동', 'phone': '010-1234-5678'}
+            }
+        }
+
+    def test_is_wiremock_stub(self):
+        """스텁 판별 테스트"""
+        self.assertTrue(is_wiremock_stub(self.stub))
+        self.assertFalse(is_wiremock_stub({'request': {'a': 1}, 'response': {}}))
+        self.assertFalse(is_wiremock_stub({'name': '홍길동'}))
+
+    def test_matchers_use_effective_field_name(self):
+        """matcher 객체의 실제 필드 이름으로 식별하는지 테스트"""
+        result = self.replacer._replace_document(self.stub)
+        request = result['request']
+
+        name = request['queryParameters']['name']['equalTo']
+        phone = request['headers']['X-User-Phone']['equalTo']
+        self.assertNotEqual(name, '홍길동')
+        self.assertNotEqual(phone, '010-1234-5678')
+        self.assertNotEqual(
+            request['queryParameters']['email']['hasExactly'][0]['equalTo'],
+            'hong@example.com'
+        )
+        self.assertEqual(request['headers']['Accept'], {'contains': 'json'})
+
+        # 요청과 응답의 같은 값은 같은 치환값으로 변환
+        self.assertEqual(result['response']['jsonBody']['name'], name)
+        self.assertEqual(result['response']['jsonBody']['phone'], phone)
+
+    def test_body_patterns_and_url_pattern(self):
+        """bodyPatterns와 urlPattern 치환 테스트"""
+        result = self.replacer._replace_document(self.stub)
+        request = result['request']
+        name = result['response']['jsonBody']['name']
+        phone = result['response']['jsonBody']['phone']
+
+        self.assertEqual(request['bodyPatterns'][0]['matchesJsonPath'], f"$[?(@.name == '{name}')]")
+        self.assertEqual(request['bodyPatterns'][1]['matchesJsonPath']['expression'], '$.user.phone')
+        self.assertEqual(request['bodyPatterns'][1]['matchesJsonPath']['equalTo'], phone)
+        self.assertNotIn('hong@example.com', request['bodyPatterns'][2]['equalToJson'])
+        json.loads(request['bodyPatterns'][2]['equalToJson'])
+
+        self.assertNotIn('010-1234-5678', request['urlPattern'])
+        self.assertTrue(request['urlPattern'].endswith('&page=.*'))
+
+    def test_basic_auth_credentials_replaced(self):
+        """basicAuthCredentials의 username/password도 필드 이름으로 치환하는지 테스트"""
+        stub = {
+            'request': {
+                'method': 'GET',
+                'url': '/api/secure',
+                'basicAuthCredentials': {'username': '홍길동', 'password': 'secret1234'}
+            },
+            'response': {'status': 200, 'jsonBody': {'name': '홍길동'}}
+        }
+        result = self.replacer._replace_document(stub)
+        credentials = result['request']['basicAuthCredentials']
+
+        self.assertNotEqual(credentials['username'], '홍길동')
+        self.assertNotEqual(credentials['password'], 'secret1234')
+        self.assertEqual(credentials['username'], result['response']['jsonBody']['name'])
+        self.assertEqual(result['request']['method'], 'GET')
+
+    def test_stub_metadata_not_replaced(self):
+        """스텁 이름 등 메타데이터는 치환하지 않는지 테스트"""
+        result = self.replacer._replace_document(self.stub)
+
+        self.assertEqual(result['name'], 'Get user profile')
+        self.assertEqual(result['scenarioName'], 'UserFlow')
+        self.assertEqual(result['response']['status'], 200)
+
+    def test_mappings_array(self):
+        """'mappings' 배열 형식 테스트"""
+        result = self.replacer._replace_document({'mappings': [self.stub, self.stub]})
+
+        self.assertEqual(len(result['mappings']), 2)
+        self.assertEqual(result['mappings'][0], result['mappings'][1])
+        self.assertEqual(result['mappings'][0]['name'], 'Get user profile')
+
+
+if __name__ == '__main__':
+    unittest.main()